@@ -0,0 +1,143 @@
+"""
+A persistent, content-addressed cache for assembled license pages.
+
+Assembling a license page is pure: the output only depends on the license's `index.md`, its `CHANGELOG.md`, its version, the boilerplate in `mkdocs.yml`, and the hook code itself. We hash all of those together, and if we've seen the hash before, we hand back the assembled page (its metadata and markdown) from disk instead of assembling it again. Entries are pickled, so a hit doesn't need a YAML parse either.
+
+Set `ASSEMBLY_CACHE=false` to turn the cache off.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from collections.abc import MutableMapping
+from typing import Any
+
+from hook_logger import get_logger
+
+ASSEMBLY_CACHE_ENABLED = os.environ.get("ASSEMBLY_CACHE", "true").lower() == "true"
+ASSEMBLY_CACHE_DIR = Path(".cache/plugin/license_assembly")
+
+_cache_log_level = logging.WARNING
+
+if not hasattr(__name__, "cache_logger"):
+    cache_logger = get_logger("ASSEMBLY_CACHE", _cache_log_level)
+
+
+def hash_bytes(*parts: bytes) -> str:
+    """
+    Returns a sha256 hex digest of the provided byte strings. Each part is length-prefixed so that moving bytes between parts changes the digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def read_bytes(path: Path | str | None) -> bytes:
+    """Returns the bytes of a file, or an empty byte string if it doesn't exist."""
+    if not path:
+        return b""
+    path = Path(path)
+    return path.read_bytes() if path.is_file() else b""
+
+
+class AssemblyCache:
+    """
+    On-disk cache of assembled license pages, keyed by a hash of everything that goes into a page.
+
+    Entries are stored as `<license-slug>.<digest>.pickle`. Writing a new entry for a license removes its stale entries, so the cache holds at most one page per license.
+    """
+
+    def __init__(
+        self,
+        boilerplate: dict[str, Any],
+        sources: list[Path],
+        cache_dir: Path = ASSEMBLY_CACHE_DIR,
+        *,
+        enabled: bool = ASSEMBLY_CACHE_ENABLED,
+        salt: str = "",
+    ) -> None:
+        """
+        Args:
+            boilerplate (dict[str, Any]): The `extra.boilerplate` block from the config.
+            sources (list[Path]): Source files for the hook code; a change to any of them invalidates every entry.
+            cache_dir (Path): Where to store the cache entries.
+            enabled (bool): Whether the cache is enabled.
+            salt (str): Any other build state that changes the output (e.g. the year, production flag).
+        """
+        self.enabled = enabled
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._build_key = hash_bytes(
+            json.dumps(boilerplate, sort_keys=True, default=str).encode(),
+            *(read_bytes(source) for source in sources),
+            salt.encode(),
+        )
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def slug(url: str) -> str:
+        """Returns a filesystem-safe name for a license page's URL. We go by URL because, with translations, one `index.md` can be built at more than one."""
+        return url.strip("/").replace("/", "__") or "index"
+
+    def key(self, index: Path | str, changelog: Path | str | None, plain_version: str, url: str = "") -> str:
+        """
+        Returns the cache key for a license.
+
+        Args:
+            index (Path | str): The license's `index.md`.
+            changelog (Path | str | None): The license's `CHANGELOG.md`, if any.
+            plain_version (str): The license's version, from the version index.
+            url (str): The page URL; with translations, the same `index.md` can be built at more than one.
+        """
+        return hash_bytes(
+            self._build_key.encode(),
+            read_bytes(index),
+            read_bytes(changelog),
+            plain_version.encode(),
+            url.encode(),
+        )
+
+    def _entry_path(self, url: str, key: str) -> Path:
+        return self.cache_dir / f"{self.slug(url)}.{key}.pickle"
+
+    def get(self, url: str, key: str) -> tuple[MutableMapping[str, Any], str] | None:
+        """Returns the cached page metadata and markdown for a license, or None on a miss."""
+        if not self.enabled:
+            return None
+        entry = self._entry_path(url, key)
+        if entry.is_file():
+            try:
+                meta, markdown = pickle.loads(entry.read_bytes())
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+                cache_logger.warning("Discarding unreadable cache entry %s: %s", entry, e)
+                entry.unlink(missing_ok=True)
+            else:
+                self.hits += 1
+                cache_logger.debug("Cache hit for %s", url)
+                return meta, markdown
+        self.misses += 1
+        cache_logger.debug("Cache miss for %s", url)
+        return None
+
+    def put(self, url: str, key: str, meta: MutableMapping[str, Any], markdown: str) -> None:
+        """Stores page metadata and markdown for a license and removes its stale entries."""
+        if not self.enabled:
+            return
+        entry = self._entry_path(url, key)
+        for stale in self.cache_dir.glob(f"{self.slug(url)}.*"):
+            if stale != entry:
+                stale.unlink(missing_ok=True)
+        tmp = entry.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps((meta, markdown), protocol=pickle.HIGHEST_PROTOCOL))
+        tmp.replace(entry)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the hit and miss counts for this build."""
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,123 @@
+"""
+A dependency graph for license pages, so dirty rebuilds (`mkdocs serve --dirty`, `mkdocs build --dirty`) only redo the license pages whose inputs changed.
+
+Each build, `license_assembly.on_files` records what every license page is built from: its `index.md`, `CHANGELOG.md`, and `package.json`, the templates, icons, and `buildmeta.json` under the theme's `custom_dir`, the boilerplate, and the assembly cache key (which covers the hook code too). On a dirty rebuild, a page whose record matches the last successful build, and whose output is still on disk, is left alone. We skip assembling it, and MkDocs skips rendering it, along with every page hook (`update_changelogs`, `socialmedia`, the canary) that would have run for it. Like the rest of a dirty build, pages that didn't change keep their old navigation.
+
+Files are compared by mtime and size, so checking a page costs a few `stat` calls. The graph is saved after every successful build, dirty or not, so the next dirty build has something to compare with.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from hook_logger import get_logger
+from mkdocs.structure.files import File
+
+DEPENDENCY_GRAPH_PATH = Path(".cache/plugin/license_dependencies.json")
+# what a license page picks up from the theme's custom_dir
+THEME_PATTERNS = ("**/*.html", ".icons/**/*.svg", "buildmeta.json")
+
+_graph_log_level = logging.WARNING
+
+if not hasattr(__name__, "graph_logger"):
+    graph_logger = get_logger("DEPENDENCIES", _graph_log_level)
+
+
+def fingerprint(path: Path | str | None) -> list[int] | None:
+    """Returns a file's mtime and size, or None if it doesn't exist."""
+    if not path:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def theme_inputs(custom_dir: Path | str | None) -> list[Path]:
+    """Returns the files under the theme's custom_dir that license pages depend on."""
+    if not custom_dir:
+        return []
+    root = Path(custom_dir)
+    return sorted({path for pattern in THEME_PATTERNS for path in root.glob(pattern) if path.is_file()})
+
+
+class UnchangedFile(File):
+    """A license page that a dirty rebuild leaves as it is. MkDocs skips rendering it, so it doesn't need any content."""
+
+    def is_modified(self) -> bool:
+        return False
+
+
+class DependencyGraph:
+    """
+    Each license page's inputs, keyed by page URL, as of the last successful build.
+
+    Records staged during a build only replace the saved ones in `commit`, after the build succeeds; a failed build can't mark its pages as up to date.
+
+    Attributes:
+        dirty (bool): Whether this is a dirty build; set by `license_assembly.on_startup`.
+        path (Path): Where the graph is saved.
+    """
+
+    def __init__(self, path: Path = DEPENDENCY_GRAPH_PATH) -> None:
+        self.path = path
+        self.dirty = False
+        self._built: dict[str, dict[str, Any]] = self._load()
+        self._staged: dict[str, dict[str, Any]] = {}
+        self._theme: dict[str, list[int] | None] = {}
+        self._theme_digest = ""
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            graph_logger.debug("Starting a new dependency graph: %s", e)
+            return {}
+
+    def scan_theme(self, custom_dir: Path | str | None) -> None:
+        """Fingerprints the theme files once per build; every license page depends on all of them."""
+        self._theme = {path.as_posix(): fingerprint(path) for path in theme_inputs(custom_dir)}
+        self._theme_digest = hashlib.sha256(json.dumps(self._theme, sort_keys=True).encode()).hexdigest()
+
+    def record(self, url: str, inputs: Iterable[Path | str | None], **keys: str) -> dict[str, Any]:
+        """
+        Stages this build's record for a page and returns it.
+
+        Args:
+            url (str): The page URL.
+            inputs (Iterable[Path | str | None]): The page's own input files; missing ones (None) are skipped.
+            **keys (str): Digests of anything else the page depends on, like the boilerplate.
+        """
+        record = {
+            "inputs": {Path(path).as_posix(): fingerprint(path) for path in inputs if path},
+            "theme": self._theme_digest,
+            **keys,
+        }
+        self._staged[url] = record
+        return record
+
+    def unchanged(self, url: str, record: dict[str, Any], output: Path | str) -> bool:
+        """Returns True if a page's record matches the last successful build and its output is still there."""
+        return self._built.get(url) == record and Path(output).is_file()
+
+    def commit(self) -> None:
+        """Makes this build's records the ones to compare against, and saves them."""
+        self._built.update(self._staged)
+        self._staged = {}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._built), encoding="utf-8")
+        except OSError as e:
+            graph_logger.warning("Couldn't save the dependency graph to %s: %s", self.path, e)
+
+
+_graph = DependencyGraph()
+
+
+def get_dependency_graph() -> DependencyGraph:
+    """Returns the process-wide dependency graph. It lives here, not in a hook, so it survives the hook reloads `mkdocs serve` does on every rebuild."""
+    return _graph
@@ -13,6 +13,7 @@ from mkdocs.config.base import Config as MkDocsConfig
 from mkdocs.plugins import event_priority
 from mkdocs.structure.files import Files
 from PIL import Image
+from plainlicense.logs import lazy
 
 Image.MAX_IMAGE_PIXELS = 300000000
 # avoid "DecompressionBombError: Image size (XXXXXX pixels) exceeds limit of 89478485 pixels, could be decompression bomb DOS attack."
@@ -67,5 +68,5 @@ def on_env(env: Environment, config: MkDocsConfig, files: Files) -> Environment:
         "Added Jinja extensions: do, loopcontrols and filters: markdown to jinja environment."
     )
     env_logger.debug("Markdown extensions: %s", extensions)
-    env_logger.debug("Environment globals: %s", env.globals)
+    env_logger.debug("Environment globals: %s", lazy(env.globals))
     return env
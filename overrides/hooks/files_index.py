@@ -0,0 +1,64 @@
+"""
+An index over a MkDocs `Files` collection for the lookups the license hooks make.
+
+`on_files` builds one `FilesIndex` per build, in a single pass over the files. The index answers src_uri, directory, category, and locale lookups without rescanning the collection. Which files are licenses, and their categories, come from the license manifest (see `plainlicense.manifest`). `replace` swaps in generated files with a `Files.remove` and `Files.append` per file, in place, so mkdocs-static-i18n's `Files` subclass survives; both are dict operations in MkDocs 1.6, so that's cheap.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from mkdocs.structure.files import File, Files
+from plainlicense.locales import split_locale
+from plainlicense.manifest import LicenseManifest
+
+
+class FilesIndex:
+    """
+    src_uri, directory, and category lookups over a `Files` collection.
+
+    Attributes:
+        files (Files): The indexed collection.
+        by_uri (dict[str, File]): Every file, keyed by src_uri.
+        children (dict[str, list[File]]): The files directly in each directory (`""` is the docs root), in collection order.
+        licenses (dict[str, list[File]]): Each category's license `index.md` files, in collection order.
+        locales (dict[str | None, list[File]]): Each locale's license `index.md` files, in collection order; untranslated licenses are under None.
+    """
+
+    def __init__(self, files: Files, manifest: LicenseManifest) -> None:
+        self.files = files
+        self.by_uri: dict[str, File] = {}
+        self.children: defaultdict[str, list[File]] = defaultdict(list)
+        self.licenses: defaultdict[str, list[File]] = defaultdict(list)
+        self.locales: defaultdict[str | None, list[File]] = defaultdict(list)
+        self._license_files: list[File] = []
+        for file in files:
+            self.by_uri[file.src_uri] = file
+            self.children[file.src_uri.rpartition("/")[0]].append(file)
+            if entry := manifest.get(file.src_uri):
+                self.licenses[entry.category].append(file)
+                self.locales[split_locale(file.src_uri)[0]].append(file)
+                self._license_files.append(file)
+
+    def get(self, src_uri: str) -> File | None:
+        """Returns the file with this src_uri, if there is one."""
+        return self.by_uri.get(src_uri)
+
+    def sibling(self, file: File, name: str) -> File | None:
+        """Returns the file called `name` in the same directory as `file`, if there is one."""
+        parent = file.src_uri.rpartition("/")[0]
+        return self.by_uri.get(f"{parent}/{name}" if parent else name)
+
+    def license_files(self) -> list[File]:
+        """Returns every license `index.md`, in collection order."""
+        return list(self._license_files)
+
+    def replace(self, new_files: Iterable[File]) -> Files:
+        """
+        Puts `new_files` in place of the files they share a src_uri with and returns the collection. Like `Files.remove` followed by `Files.append`, replacements (and any new files) go at the end, in the order given. The collection is updated in place, so a `Files` subclass (mkdocs-static-i18n's, say) keeps its behavior.
+        """
+        for file in new_files:
+            if (old := self.by_uri.get(file.src_uri)) is not None:
+                self.files.remove(old)
+            self.files.append(file)
+            self.by_uri[file.src_uri] = file
+        return self.files
@@ -3,24 +3,45 @@
 Centralized logging configuration for all hooks.
 
 You can force the global log level to a lower level (more verbose) by setting the LOG_LEVEL_OVERRIDE environment variable as an integer. If you are only interested in a special logger, set that logger's level to the desired level... the lower level will be used.
+
+Loggers don't write anything themselves. Each one gets the same `QueueHandler`, and a `QueueListener` thread does the formatting and the writing, so a hook that logs doesn't wait on the terminal or the disk. A record's message is still put together in the hook's own thread, because its arguments are live objects (page metadata renders lazily, for one) that we can't read from another thread. Wrap big arguments in `lazy` (from `plainlicense.logs`) so they're capped, and skipped entirely when their level is off.
+
+Set HOOK_TRACE=true to trace the build: every MkDocs event, and every plugin or hook that handles it, becomes a span tagged with the page it ran for, and the spans are written as a Chrome trace to `.workbench/traces/build_trace.json` after `on_post_build` (see `plainlicense.tracing`).
+
+Set MEMORY_PROFILE=true to see where the build's memory goes: each hook call is measured with `tracemalloc`, RSS is sampled after each phase, and at the end of the build a report of the memory each hook kept, and where it was allocated, is written to `.workbench/memory/memory_report.txt` (see `plainlicense.memory`). Under `mkdocs serve`, each rebuild is compared with the last one, and growth past MEMORY_LEAK_BYTES is logged as a warning.
+
+The log file (`.workbench/logs/pl_build.log`, with FILEHANDLER_ENABLED) rotates at LOG_MAX_BYTES and keeps LOG_BACKUPS gzipped old logs. The console handler only runs when the file handler is off, as in CI by default.
+
+`.workbench/` sits next to the config file, wherever MkDocs runs from; `on_config` moves it there. The log file isn't opened until the first record is written, so a build that logs nothing before `on_config` leaves nothing behind in the working directory.
 """
 
+import atexit
+import copy
+import functools
+import gzip
+import inspect
 import logging
 import os
+import queue
+import shutil
 import sys
+from contextlib import nullcontext
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from pprint import pformat
-from datetime import datetime, timezone
-from typing import Literal
+from typing import Any, Literal
 
 import click
 
 from jinja2 import Environment
 from mkdocs.config.base import Config as MkDocsConfig
-from mkdocs.plugins import event_priority
+from mkdocs.plugins import PluginCollection, event_priority
 from mkdocs.structure.pages import Page
 from mkdocs.structure.files import Files
 from mkdocs.structure.nav import Navigation
+from plainlicense.logs import lazy
+from plainlicense.memory import MemoryProfiler, source_root
+from plainlicense.tracing import Tracer
 
 # Configuration
 LOG_LEVEL_OVERRIDE = int(os.environ.get("LOG_LEVEL_OVERRIDE", logging.WARNING))
@@ -31,15 +52,20 @@ FILEHANDLER_ENABLED = (
 STREAMHANDLER_ENABLED = (
     os.environ.get("STREAMHANDLER_ENABLED", "true").lower() == "true"
 )
-
-if FILEHANDLER_ENABLED:
-    LOG_SAVE_PATH = Path(
-        f".workbench/logs/pl_build_log_{datetime.now(timezone.utc).isoformat(timespec='seconds')}.log"
-    )
-    LOG_SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+# relative to WORKBENCH_DIR
+LOG_SAVE_PATH = Path("logs/pl_build.log")
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", 5 * 1024 * 1024))
+LOG_BACKUPS = int(os.environ.get("LOG_BACKUPS", 10))
+HOOK_TRACE = os.environ.get("HOOK_TRACE", "false").lower() == "true"
+TRACE_SAVE_PATH = Path("traces/build_trace.json")
+MEMORY_PROFILE = os.environ.get("MEMORY_PROFILE", "false").lower() == "true"
+MEMORY_SAVE_PATH = Path("memory/memory_report.txt")
 
 # Global variables
+WORKBENCH_DIR = Path(".workbench")  # until `anchor_workbench` moves it next to the config file
 LOGGERS: dict[str, logging.Logger] = {}
+tracer = Tracer()
+profiler = MemoryProfiler()
 
 class ColorFormatter(logging.Formatter):
     """Formats log messages"""
@@ -52,7 +78,7 @@ class ColorFormatter(logging.Formatter):
     }
 
     def format(self, record: logging.LogRecord) -> str:
-        """The formatter...
+        """The formatter... Multi-line messages (like a pformat dump) keep their line breaks, with each line indented under the first.
 
         Args:
             record: The LogRecord object to format
@@ -61,28 +87,155 @@ class ColorFormatter(logging.Formatter):
             The formatted record as a string
 
         """
-        if record.message.splitlines() > 1:
-            log_message = super().format(pformat(record))
-        else:
-            log_message = super().format(record)
-        if record.name == "CANARY":
+        log_message = super().format(record)
+        prefix, indent = self.prefix(record.levelname, record.name)
+        if len(lines := log_message.splitlines()) > 1:
+            log_message = f"\n{indent}".join(lines)
+        return (
+            prefix
+            + click.style(log_message, fg=(self.COLORS.get(record.levelname, "white")), bg="bright_blue" if record.name == "CANARY" else None) + f" logger: {record.filename}"
+        )
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def prefix(cls, levelname: str, name: str) -> tuple[str, str]:
+        """Returns the styled level and logger name that start a record, and the indent for its continuation lines. There are only a few combinations, so we style each one once."""
+        if name == "CANARY":
             module_color = {"fg": "bright_yellow", "bg": "bright_blue", "bold": True}
         else:
             module_color = {"fg": "bright_blue"}
-        return (
-            click.style(
-                f"{record.levelname:<8} ", fg=self.COLORS.get(record.levelname, "white")
+        prefix = click.style(f"{levelname:<8} ", fg=cls.COLORS.get(levelname, "white")) + click.style(f"{name:<12} ", **module_color)
+        return prefix, " " * (max(len(levelname), 8) + max(len(name), 12) + 2)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queues records with their message put together, and leaves the formatting to the listener thread."""
+
+    _exceptions = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exceptions.formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as log, gzip.open(dest, "wb") as compressed:
+        shutil.copyfileobj(log, compressed)
+    os.remove(source)
+
+
+class WorkbenchFileHandler(RotatingFileHandler):
+    """A rotating log file in the workbench. It's opened when the first record is written, and `move` can point it somewhere else."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True)
+        self.namer = _gzip_namer
+        self.rotator = _gzip_rotator
+
+    def _open(self) -> Any:
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+    def move(self, path: Path) -> None:
+        """Writes the next records to `path`. Records already written stay where they are."""
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.close()
+                self.stream = None  # type: ignore[assignment]
+            self.baseFilename = os.path.abspath(path)
+        finally:
+            self.release()
+
+
+def workbench_path(path: Path) -> Path:
+    """Returns where a workbench file goes, like `LOG_SAVE_PATH`."""
+    return WORKBENCH_DIR / path
+
+
+def anchor_workbench(config: MkDocsConfig) -> None:
+    """Moves the workbench next to the config file, so the logs, traces and memory reports land in the same place wherever MkDocs runs from."""
+    global WORKBENCH_DIR
+    if not config.config_file_path:
+        return
+    directory = Path(config.config_file_path).resolve().parent / ".workbench"
+    if directory == WORKBENCH_DIR:
+        return
+    WORKBENCH_DIR = directory
+    for handler in _listener.handlers if _listener else ():
+        if isinstance(handler, WorkbenchFileHandler):
+            handler.move(workbench_path(LOG_SAVE_PATH))
+
+
+def _handlers() -> list[logging.Handler]:
+    """Returns the handlers the listener writes to."""
+    handlers: list[logging.Handler] = []
+    if FILEHANDLER_ENABLED:
+        file_handler = WorkbenchFileHandler(workbench_path(LOG_SAVE_PATH))
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             )
-            + click.style(f"{record.name:<12} ", **module_color)
-            + click.style(log_message, fg=(self.COLORS.get(record.levelname, "white")), bg="bright_blue" if record.name == "CANARY" else None) + f" logger: {record.filename}"
         )
+        handlers.append(file_handler)
+    elif STREAMHANDLER_ENABLED:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(ColorFormatter("%(asctime)s - %(message)s"))
+        handlers.append(stream_handler)
+    return handlers
+
+
+_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_queue_handler = DeferredQueueHandler(_queue)
+_listener: QueueListener | None = None
+
+
+def start_logging() -> None:
+    """Starts the listener thread, if it isn't running."""
+    global _listener
+    if _listener is not None:
+        return
+    _listener = QueueListener(_queue, *_handlers(), respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Writes out everything queued and stops the listener thread. `on_shutdown` calls this, and so does the interpreter on exit."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def _has_queue_handler(logger: logging.Logger) -> bool:
+    """Returns True if the logger, or an ancestor it propagates to, already sends records to the queue."""
+    current: logging.Logger | None = logger
+    while current is not None:
+        if _queue_handler in current.handlers:
+            return True
+        current = current.parent if current.propagate else None
+    return False
 
 
 def get_logger(name: str, level: int = logging.WARNING) -> logging.Logger:
     """
     Get a logger instance with the specified name and logging level.
 
-    This function retrieves a logger by name, creating it if it does not already exist. It configures the logger with appropriate handlers based on the specified logging level and predefined settings.
+    This function retrieves a logger by name, creating it if it does not already exist. It sets the logger's level and connects it to the logging queue, unless it (or a logger it propagates to) already is.
 
     Args:
         name (str): The name of the logger to retrieve or create.
@@ -102,25 +255,126 @@ def get_logger(name: str, level: int = logging.WARNING) -> logging.Logger:
     level = min(LOG_LEVEL_OVERRIDE, level)
     logger.setLevel(level)
 
-    if FILEHANDLER_ENABLED and not logger.hasHandlers():
-        file_handler = logging.FileHandler(LOG_SAVE_PATH)
-        file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-        )
-        file_handler.setLevel(level)
-        logger.addHandler(file_handler)
-
-    if STREAMHANDLER_ENABLED and not logger.hasHandlers():
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setFormatter(ColorFormatter("%(asctime)s - %(message)s"))
-        logger.addHandler(stream_handler)
+    if (FILEHANDLER_ENABLED or STREAMHANDLER_ENABLED) and not _has_queue_handler(logger):
+        start_logging()
+        logger.addHandler(_queue_handler)
 
     LOGGERS[name] = logger
     return logger
 
 
+# Tracing
+# the time between two events that none of our code runs in, keyed by the event that ends it: (the event that starts it, the span's name)
+RENDER_GAPS = {
+    "page_content": ("page_markdown", "render markdown"),
+    "post_page": ("page_context", "render template"),
+}
+_gap_starts: dict[tuple[str, str | None], float] = {}
+
+
+def _src_uri(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
+    """Returns the src_uri of the page an event is for, if it's for one. `on_pre_page` passes the page as the event's item; the other page events pass it as `page`."""
+    page = kwargs.get("page")
+    if page is None and args and isinstance(args[0], Page):
+        page = args[0]
+    return page.file.src_uri if isinstance(page, Page) else None
+
+
+def traced(method: Any, event: str, origin: str) -> Any:
+    """Wraps a plugin's or hook's event method so each call is a span, tagged with the page it ran for, and with MEMORY_PROFILE, a memory measurement."""
+    if getattr(method, "__traced__", False):
+        return method
+    name = f"{origin} on_{event}"
+    measure = profiler.measure if MEMORY_PROFILE else nullcontext
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tracer.span(name, "hook", plugin=origin, event=event, src_uri=_src_uri(args, kwargs)), measure(name):
+            return method(*args, **kwargs)
+
+    wrapper.__traced__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def trace_plugins(plugins: PluginCollection) -> None:
+    """
+    Traces a build: wraps every registered event method, and `run_event` itself, so each event is a `phase` span with a `hook` span for each plugin or hook that handles it. The time MkDocs spends rendering a page's markdown and its template, between events, gets a `render` span.
+
+    Nested builds (the i18n plugin builds each language from inside `on_post_build`) reuse the same plugins, so they add to the same trace.
+    """
+    if getattr(plugins.run_event, "__traced__", False):
+        return
+    tracer.reset()
+    _gap_starts.clear()
+    if MEMORY_PROFILE:
+        profiler.start()
+    origins = getattr(plugins, "_event_origins", {})
+    for event, methods in plugins.events.items():
+        for i, method in enumerate(methods):
+            methods[i] = traced(method, event, origins.get(method, "<unknown>"))
+            origins[methods[i]] = origins.get(method, "<unknown>")
+    run_event = plugins.run_event
+
+    def traced_run_event(name: str, item: Any = None, **kwargs: Any) -> Any:
+        src_uri = _src_uri((item,), kwargs)
+        if name in RENDER_GAPS and (start := _gap_starts.pop((RENDER_GAPS[name][0], src_uri), None)) is not None:
+            tracer.add(RENDER_GAPS[name][1], "render", start, tracer.now(), src_uri=src_uri)
+        with tracer.span(f"on_{name}", "phase", src_uri=src_uri):
+            result = run_event(name, item, **kwargs)
+        if name in {gap_start for gap_start, _ in RENDER_GAPS.values()}:
+            _gap_starts[name, src_uri] = tracer.now()
+        if MEMORY_PROFILE:
+            profiler.sample_rss(f"on_{name}")
+        if name in {"post_build", "build_error"}:
+            if HOOK_TRACE:
+                write_trace()
+            # nested builds finish inside the outer build's post_build
+            if MEMORY_PROFILE and tracer.depth == 0:
+                write_memory_report(plugins)
+        return result
+
+    traced_run_event.__traced__ = True  # type: ignore[attr-defined]
+    plugins.run_event = traced_run_event  # type: ignore[method-assign]
+
+
+def write_trace() -> None:
+    """Writes the trace so far, and logs the hooks that took the longest."""
+    path = tracer.write(workbench_path(TRACE_SAVE_PATH))
+    logger = get_logger("MkDocs")
+    logger.info("Wrote %s trace spans to %s", len(tracer.spans), path)
+    logger.info("Slowest hooks:\n%s", tracer.summary("hook"))
+
+
+def write_memory_report(plugins: PluginCollection) -> None:
+    """Writes the memory report for the build, and logs the leak check's warnings."""
+    origins = getattr(plugins, "_event_origins", {})
+    owners = {source_root(inspect.getfile(inspect.unwrap(method))): origin for method, origin in origins.items()}
+    hooks_dir = Path(__file__).resolve().parent
+    modules = {
+        id(module): module
+        for module in list(sys.modules.values())
+        if (filename := getattr(module, "__file__", None))
+        and (module.__name__.startswith("plainlicense") or Path(filename).resolve().parent == hooks_dir)
+        # the tracer and the profiler are ours, not the build's
+        and module.__name__ not in {"plainlicense.memory", "plainlicense.tracing"}
+        and Path(filename).name != "hook_logger.py"
+    }
+    classes = [
+        value
+        for module in modules.values()
+        for value in list(vars(module).values())
+        if isinstance(value, type) and value.__module__ == module.__name__
+    ]
+    report, warnings = profiler.finish(owners, modules.values(), classes)
+    path = workbench_path(MEMORY_SAVE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report + "\n", encoding="utf-8")
+    logger = get_logger("MkDocs")
+    logger.info("Wrote the memory report to %s:\n%s", path, report)
+    if warnings:
+        logger.warning("\n".join(warnings))
+
+
 # MkDocs plugin hooks
 @event_priority(100)
 def on_startup(command: Literal['build', 'serve', 'gh-deploy'], dirty: bool) -> None:
@@ -129,10 +383,14 @@ def on_startup(command: Literal['build', 'serve', 'gh-deploy'], dirty: bool) ->
     logger = get_logger("MkDocs", logging.DEBUG)
     logger.info("Starting %s command", command)
 
+@event_priority(100)
 def on_config(config: MkDocsConfig) -> MkDocsConfig:
-    """log on_config"""
+    """log on_config, move the workbench next to the config file, and start tracing if HOOK_TRACE or MEMORY_PROFILE is on"""
+    anchor_workbench(config)
     logger = get_logger("MkDocs")
-    logger.debug("Processing configuration, %s", config)
+    logger.debug("Processing configuration, %s", lazy(config))
+    if HOOK_TRACE or MEMORY_PROFILE:
+        trace_plugins(config.plugins)
     return config
 
 def on_pre_build(config: MkDocsConfig) -> None:
@@ -144,7 +402,7 @@ def on_files(files: Files, config: MkDocsConfig) -> Files:
     """Log files"""
     logger = get_logger("MkDocs")
     logger.debug("Processing %s files", str(len(files)))
-    logger.debug("Files: %s", files)
+    logger.debug("Files: %s", lazy(files))
     return files
 
 
@@ -164,7 +422,7 @@ def on_pre_page(page: Page, config: MkDocsConfig, files: Files) -> Page:
     """log on_pre_page"""
     logger = get_logger("MkDocs")
     logger.debug("Processing page %s", page.file.src_path)
-    logger.debug("Page meta: %s", page.meta)
+    logger.debug("Page meta: %s", lazy(page.meta))
     return page
 
 
@@ -172,3 +430,13 @@ def on_post_build(config: MkDocsConfig) -> None:
     """log on_post_build"""
     logger = get_logger("MkDocs")
     logger.info("Build completed")
+
+
+def on_shutdown() -> None:
+    """Writes out the queued logs before MkDocs exits."""
+    stop_logging()
+
+
+# MkDocs loads hooks by file path, so as a hook this module isn't the `hook_logger` module the other hooks import. The hook events use that one's loggers and listener instead of starting a second set.
+if __name__ != "hook_logger":
+    from hook_logger import anchor_workbench, get_logger, stop_logging, trace_plugins  # noqa: F811
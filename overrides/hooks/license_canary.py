@@ -1,14 +1,22 @@
 """
 The license canary, a build-time check to ensure all licenses are processed correctly. Since we dynamically generate most license content at build, we need to ensure that the resulting pages aren't broken.
+
+By default the canary runs in digest mode: for each license page it keeps a `PageRecord` (a hash and byte size of the page's HTML, whether it got a template context, and any findings), not the page's HTML, template context, or `LicenseContent`. Its state resets at the start of every build, so `mkdocs serve` doesn't pile up records across rebuilds, and memory stays flat however many licenses or rebuilds there are. Set CANARY_DIGEST=false to also keep each page's HTML for debugging.
 """
 
+import hashlib
 import logging
 import os
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from pprint import pformat
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self
+from typing import Any, ClassVar, Literal, Self
 
 from hook_logger import get_logger
+from locale_files import current_locale, get_i18n_plugin
 from mkdocs.config import Config as MkDocsConfig
 from mkdocs.exceptions import PluginError
 from mkdocs.plugins import event_priority
@@ -16,13 +24,77 @@ from mkdocs.structure.files import Files
 from mkdocs.structure.nav import Navigation
 from mkdocs.structure.pages import Page
 from mkdocs.utils.templates import TemplateContext
-
-if TYPE_CHECKING:
-    from overrides.hooks.license_assembly import LicenseContent
+from plainlicense.budgets import BUDGETS_FILE, Budgets
+from plainlicense.leaks import HTML_SCANNER, TEMPLATE_SCANNER, TEXT_SCANNER, Leak, LeakRule, LeakScanner
+from plainlicense.logs import lazy
+from plainlicense.manifest import LicenseManifest, get_license_manifest
+from plainlicense.pages import get_page_registry
+from plainlicense.validation import PageCheck, expected_tabs, format_report, validate_pages
+
+# Set CANARY_DIGEST=false to keep each license page's HTML in its record
+CANARY_DIGEST = os.environ.get("CANARY_DIGEST", "true").lower() == "true"
+# Set POST_BUILD_VALIDATION=false to skip checking the structure of the built license pages
+POST_BUILD_VALIDATION = os.environ.get("POST_BUILD_VALIDATION", "true").lower() == "true"
+# Set PERFORMANCE_BUDGETS=false to skip checking production builds against the performance budgets
+PERFORMANCE_BUDGETS = os.environ.get("PERFORMANCE_BUDGETS", "true").lower() == "true"
+# the leak scanner for each step of the pipeline (see `plainlicense.leaks`)
+STEP_SCANNERS: dict[str, LeakScanner] = {
+    "boilerplate": TEMPLATE_SCANNER,
+    "markdown": TEXT_SCANNER,
+    "plaintext": TEXT_SCANNER,
+    "html": HTML_SCANNER,
+}
+# how many offsets a finding lists for one kind of leak
+FINDING_OFFSETS = 5
 
 _canary_log_level = logging.WARNING
 
 
+@dataclass(slots=True)
+class PageRecord:
+    """
+    What the canary keeps about one license page in a build.
+
+    Attributes:
+        url (str): The page URL.
+        slug (str): The license's slug, from the manifest.
+        size (int): The byte size of the page's HTML.
+        digest (str): A sha256 hex digest of the page's HTML.
+        has_context (bool): Whether the page got a template context.
+        path (str): The page's built HTML file.
+        tabs (tuple[str, ...]): The tabs the page should have.
+        assembly_ms (float | None): How long the license took to assemble, or None if it came from the assembly cache.
+        markdown_size (int): The byte size of the assembled page markdown.
+        render_ms (float | None): How long the page's markdown took to render to HTML.
+        findings (list[str]): Problems found on the page, like leftover Jinja placeholders.
+        html (str | None): The page's HTML, only with CANARY_DIGEST=false.
+    """
+
+    url: str
+    slug: str = ""
+    size: int = 0
+    digest: str = ""
+    has_context: bool = False
+    path: str = ""
+    tabs: tuple[str, ...] = ()
+    assembly_ms: float | None = None
+    markdown_size: int = 0
+    render_ms: float | None = None
+    findings: list[str] = field(default_factory=list)
+    html: str | None = None
+    render_start: float = field(default=0.0, repr=False)
+
+    @property
+    def metrics(self) -> dict[str, float | None]:
+        """Returns the page's performance metrics, as `plainlicense.budgets` names them."""
+        return {
+            "assembly_ms": self.assembly_ms,
+            "render_ms": self.render_ms,
+            "markdown_bytes": self.markdown_size or None,
+            "html_bytes": self.size or None,
+        }
+
+
 class LicenseBuildCanary:
     """
     LicenseBuildCanary helps us ensure that all licenses are processed correctly, and prevents broken from entering production. It's also a singleton, so it doubles as a global reference point for other hooks.
@@ -40,31 +112,23 @@ class LicenseBuildCanary:
         """Get this party started."""
         if self.__class__._initialized:
             return
-        self.expected_licenses: list[str] = self._list_expected_licenses()
-        self.processed_licenses: list["LicenseContent | None"] = []
-        self.processed_context: list[TemplateContext | None] = []
-        self.processed_html: list[str | None] = []
-        self.assembled_pages: list[Page | None] = []
-        self.errors: list[Any] = []
         self.production: bool = True  # Assume production by default
         self.logger: logging.Logger = get_logger("CANARY", _canary_log_level)
+        self.reset()
         self.__class__._initialized = True
 
-    def _list_expected_licenses(self) -> list[str]:
-        license_paths = Path("docs/licenses/").glob("**/index.md")
-        return [
-            path.parent.name  # license name is the parent directory
-            for path in license_paths
-            if path.parent.name
-            not in [  # category and main info pages to exclude
-                "copyleft",
-                "licenses",
-                "permissive",
-                "proprietary",
-                "public-domain",
-                "source-available",
-            ]
-        ]
+    def reset(self, manifest: LicenseManifest | None = None) -> None:
+        """Clears everything the canary collected, ready for a new build, and takes the build's license manifest."""
+        self.manifest: LicenseManifest | None = manifest
+        self.expected_licenses: frozenset[str] = manifest.slugs if manifest else frozenset()
+        self.processed_licenses: list[str] = []  # src_uris assembled in this build
+        self.cached_licenses: list[str] = []  # src_uris served from the assembly cache
+        self.unchanged_licenses: list[str] = []  # src_uris a dirty rebuild left alone (see `dependency_graph`)
+        # license src_uris per language (`default` without mkdocs-static-i18n)
+        self.expected_by_locale: dict[str, list[str]] = {}
+        self.processed_by_locale: defaultdict[str, list[str]] = defaultdict(list)
+        self.pages: dict[str, PageRecord] = {}
+        self.errors: list[Any] = []
 
     def list_production(self, command: str) -> None:
         """Sets the production flag based on the MKDocs command"""
@@ -92,7 +156,69 @@ class LicenseBuildCanary:
         try:
             getattr(self, attr).append(value)
         except AttributeError as e:
-            AttributeError(f"Attribute {attr} not a valid attribute {e}")
+            raise AttributeError(f"Attribute {attr} not a valid attribute {e}") from e
+
+    def expect_locale(self, locale: str, src_uris: list[str]) -> None:
+        """Records the license src_uris a language's build should assemble (or take from the cache)."""
+        self.logger.debug("Expecting %s licenses for %s", len(src_uris), locale)
+        self.expected_by_locale[locale] = list(src_uris)
+        self.processed_by_locale.pop(locale, None)
+
+    def add_locale_value(self, locale: str, src_uri: str) -> None:
+        """Records a license assembled (or taken from the cache) for a language."""
+        self.processed_by_locale[locale].append(src_uri)
+
+    def page_record(self, page: Page) -> PageRecord:
+        """Returns the record for a license page in this build, creating it if needed."""
+        return self._record(page.url)
+
+    def _record(self, url: str) -> PageRecord:
+        if (record := self.pages.get(url)) is None:
+            record = self.pages[url] = PageRecord(url)
+        return record
+
+    def record_assembly(self, url: str, src_uri: str, seconds: float | None, markdown: str) -> None:
+        """Records how long a license page took to assemble (None if it came from the assembly cache), and how big its markdown is."""
+        record = self._record(url)
+        if self.manifest is not None and (entry := self.manifest.get(src_uri)):
+            record.slug = entry.slug
+        record.assembly_ms = None if seconds is None else seconds * 1000
+        record.markdown_size = len(markdown.encode())
+
+    def record_html(self, page: Page, html: str) -> None:
+        """Records a license page's HTML as a digest and a size (and the HTML itself, outside digest mode), and scans it for leaked markup."""
+        record = self.page_record(page)
+        encoded = html.encode()
+        record.size = len(encoded)
+        record.digest = hashlib.sha256(encoded).hexdigest()
+        record.html = None if CANARY_DIGEST else html
+        record.findings.extend(self.check_placeholders(html, "html", page.url))
+
+    def validate_pages(self) -> None:
+        """Checks the structure of every license page this build wrote (see `plainlicense.validation`), and records what's wrong as errors."""
+        checks = [PageCheck(record.url, record.path, record.tabs) for record in self.pages.values() if record.digest and record.path]
+        start = time.perf_counter()
+        reports = validate_pages(checks)
+        for report in reports:
+            self.pages[report.url].findings.extend(report.problems)
+            self.errors.extend(f"{report.url}: {problem}" for problem in report.problems)
+        summary = format_report(reports)
+        elapsed = time.perf_counter() - start
+        if any(report.problems for report in reports):
+            self.logger.error("%s\n(%.2f s)", summary, elapsed)
+        else:
+            self.logger.info("%s (%.2f s)", summary, elapsed)
+
+    def check_budgets(self, path: Path) -> None:
+        """Checks every license page this build measured against the performance budgets (see `plainlicense.budgets`). Fatal overruns are errors; the rest are logged as warnings."""
+        budgets = Budgets.load(path)
+        overruns = [overrun for record in self.pages.values() if record.slug for overrun in budgets.check(record.slug, record.metrics)]
+        for overrun in overruns:
+            if overrun.fatal:
+                self.add_value("errors", f"Over the performance budget: {overrun}")
+            else:
+                self.logger.warning("Over the performance budget: %s", overrun)
+        self.logger.info("Checked %s license pages against %s: %s over budget", len(self.pages), path, len(overruns))
 
     @classmethod
     def canary(cls) -> Self:
@@ -103,7 +229,7 @@ class LicenseBuildCanary:
 
     def is_license_page(self, page: Page) -> bool:
         """
-        Checks if the page is a license page.
+        Checks if the page is a license page: its source is a license `index.md`, or a translation of one, in the build's manifest. The page registry (see `plainlicense.pages`) answers this from the classification it made in `on_files`.
 
         Args:
             page (Page): The page object containing metadata and content.
@@ -111,53 +237,58 @@ class LicenseBuildCanary:
         Returns:
             bool: True if the page is a license page, False otherwise.
         """
-        self.logger.debug("Checking if page is a license page. Page URL: %s", page.url)
-        page_name = (
-            page.url.split("/")[-2]
-            if len(page.url.split("/")) > 2
-            else "definitely not a license page"
-        )
-        return page_name in self.expected_licenses
+        return get_page_registry().is_license(page.file.src_uri)
 
     def check_placeholders(
-        self, content: Any, step: Literal["boilerplate", "markdown", "html"]
-    ) -> None:
+        self, content: Any, step: Literal["boilerplate", "markdown", "plaintext", "html"], source: str = ""
+    ) -> list[str]:
         """
-        Checks if jinja placeholders are still in the content.
+        Scans content for leaked markup with the step's scanner: Jinja placeholders, Blocks API fences, `{ .annotate }` markers, undefined footnotes, raw license headers (see `plainlicense.leaks`). Fatal leaks are errors; the rest are logged as warnings.
+
+        Args:
+            content (Any): A string, or a dict or list of them.
+            step (Literal["boilerplate", "markdown", "plaintext", "html"]): Which step of the pipeline produced the content.
+            source (str): Where the content came from, like a page URL, for the findings.
+
+        Returns:
+            list[str]: One finding per kind of leak, with where the first few are and the text around the first one.
         """
 
-        def check_content(content: Any) -> bool:
+        def strings(content: Any) -> Iterator[str]:
             if not content:
-                return False
+                return
             if isinstance(content, str):
-                return "{{" in content
-            if isinstance(content, dict):
-                return any(check_content(value) for value in content.values())
+                yield content
+                return
+            for value in content.values() if isinstance(content, dict) else content:
+                yield from strings(value)
+
+        by_rule: dict[LeakRule, list[Leak]] = defaultdict(list)
+        for text in strings(content):
+            for leak in STEP_SCANNERS[step].scan(text):
+                by_rule[leak.rule].append(leak)
+        findings = []
+        for rule, leaks in by_rule.items():
+            offsets = ", ".join(str(leak.offset) for leak in leaks[:FINDING_OFFSETS])
+            more = " and more" if len(leaks) > FINDING_OFFSETS else ""
+            where = f" in {source}" if source else ""
+            finding = f"{rule.description} at step {step}{where}: {len(leaks)} found, at offsets {offsets}{more}; the first: {leaks[0].snippet!r}"
+            if rule.fatal:
+                self.add_value("errors", finding)
             else:
-                return any(check_content(item) for item in content)
-
-        if check_content(content):
-            self.add_value(
-                "errors",
-                f"Jinja placeholders still in content. Placeholders found at step: {step}. Provided content: {content}",
-            )
+                self.logger.warning(finding)
+            findings.append(finding)
+        return findings
 
     @property
-    def licenses(
-        self,
-    ) -> dict[
-        str,
-        list[str | None]
-        | list["LicenseContent | None"]
-        | list[TemplateContext | None]
-        | list[None],
-    ]:
-        """Returns the list of expected licenses."""
+    def licenses(self) -> dict[str, list[str] | list[PageRecord]]:
+        """Returns what the canary collected about this build's licenses."""
         return {
-            "Expected licenses": self.expected_licenses,
+            "Expected licenses": sorted(self.expected_licenses),
             "Processed licenses": self.processed_licenses,
-            "Processed pages": self.processed_context,
-            "Processed HTML": self.processed_html,
+            "Cached licenses": self.cached_licenses,
+            "Unchanged licenses": self.unchanged_licenses,
+            "Processed pages": list(self.pages.values()),
         }
 
     @property
@@ -179,13 +310,27 @@ def on_startup(command: str, dirty: bool) -> None:
     canary = LicenseBuildCanary()
     canary.list_production(command)
     canary.logger.debug("Build Canary production flag is list to %s", canary.production)
-    canary.logger.debug("Canary expected licenses: %s", canary.expected_licenses)
+    canary.logger.debug("Canary expected licenses: %s", lazy(sorted(canary.expected_licenses)))
+
+@event_priority(100)
+def on_pre_build(config: MkDocsConfig) -> None:
+    """
+    We reset the Build Canary for the new build, with the license manifest for the docs directory (see `plainlicense.manifest`). mkdocs-static-i18n builds each other language inside the first build, and the first build records what every language should assemble, so those builds keep it.
+    """
+    manifest = get_license_manifest(config.docs_dir)
+    if (plugin := get_i18n_plugin(config)) and plugin.building:
+        canary = LicenseBuildCanary.canary()
+        expected_by_locale = canary.expected_by_locale
+        canary.reset(manifest)
+        canary.expected_by_locale = expected_by_locale
+        return
+    LicenseBuildCanary.canary().reset(manifest)
 
 def on_page_context(
     context: TemplateContext, page: Page, config: MkDocsConfig, nav: Navigation
 ) -> TemplateContext:
     """
-    We add the page context to the Build Canary.
+    We note that the license page got its template context, where it will be written, and which tabs it should have.
 
     Args:
         context (TemplateContext): The current template context.
@@ -193,17 +338,31 @@ def on_page_context(
         config (MkDocsConfig): The configuration object for the site.
 
     Returns:
-        TemplateContext: The updated template context after processing the page.
+        TemplateContext: The template context, unchanged.
     """
     canary = LicenseBuildCanary.canary()
     if canary.is_license_page(page):
-        canary.add_value("processed_context", str(context))
+        record = canary.page_record(page)
+        record.has_context = True
+        record.path = page.file.abs_dest_path
+        record.tabs = expected_tabs(bool(page.meta.get("official_license_text")))
     return context
 
 
+@event_priority(-200)
+def on_page_markdown(markdown: str, page: Page, config: MkDocsConfig, files: Files) -> str:
+    """
+    We start timing the license page's render, after every other hook has had the markdown.
+    """
+    canary = LicenseBuildCanary.canary()
+    if canary.is_license_page(page):
+        canary.page_record(page).render_start = time.perf_counter()
+    return markdown
+
+
 def on_page_content(html: str, page: Page, config: MkDocsConfig, files: Files) -> str:
     """
-    Uses the final HTML content to populate. This should be after all processing is over.
+    Records the license page's HTML and how long it took to render, and checks it for leftover placeholders. This should be after all processing is over.
 
     Args:
         html (str): The rendered HTML content BEFORE it's passed to the template.
@@ -216,49 +375,67 @@ def on_page_content(html: str, page: Page, config: MkDocsConfig, files: Files) -
     """
     canary = LicenseBuildCanary.canary()
     if canary.is_license_page(page):
-        canary.check_placeholders(html, "html")
-        canary.add_value("processed_html", html)
-        canary.logger.debug("Processed HTML: %s", html)
+        record = canary.page_record(page)
+        if record.render_start:
+            record.render_ms = (time.perf_counter() - record.render_start) * 1000
+        canary.record_html(page, html)
+        canary.logger.debug("Processed HTML for %s: %s bytes", page.url, len(html))
     return html
 
 
 def on_post_build(config: MkDocsConfig) -> None:
     """
-    We check the Build Canary after the build is complete.
+    We check the Build Canary after the build is complete, and validate the license pages it wrote (set POST_BUILD_VALIDATION=false to skip that). Production builds also check each license against the performance budgets (set PERFORMANCE_BUDGETS=false to skip that). With mkdocs-static-i18n this runs once per language, and checks that language.
     """
     canary = LicenseBuildCanary.canary()
     canary.logger.info("Checking Build Canary for errors.")
+    locale = current_locale(config) or "default"
+    rendered = [record.url for record in canary.pages.values() if record.digest]
+    with_context = [record.url for record in canary.pages.values() if record.has_context]
 
     checks = [
         (
-            canary.expected_licenses,
-            canary.processed_licenses,
-            "Expected licenses: {} do not match processed licenses: {}",
+            canary.expected_by_locale.get(locale, canary.expected_licenses),
+            canary.processed_licenses + canary.cached_licenses + canary.unchanged_licenses,
+            "Expected licenses: {} do not match processed, cached, and unchanged licenses: {}",
         ),
         (
-            canary.processed_context,
-            canary.processed_html,
+            with_context,
+            rendered,
             "Processed pages: {} do not match processed HTML: {}",
         ),
     ]
+    if locale in canary.expected_by_locale:
+        checks.append(
+            (
+                canary.expected_by_locale[locale],
+                canary.processed_by_locale.get(locale, []),
+                f"Expected {locale} licenses: {{}} do not match processed {locale} licenses: {{}}",
+            )
+        )
 
     for expected, processed, message in checks:
         if len(expected) != len(processed):
             canary.add_value("errors", str(message.format(expected, processed)))
-    """
+
+    if POST_BUILD_VALIDATION:
+        canary.validate_pages()
+    if PERFORMANCE_BUDGETS and canary.production:
+        canary.check_budgets(Path(config.config_file_path).parent / BUDGETS_FILE)
+
     if canary.logger.level == logging.DEBUG:
         for k, v in canary.licenses.items():
             canary.logger.debug("%s: %s\n", k, v)
 
-    if empty := next((None if v else k for k, v in canary.licenses.items()), None):
-        canary.add_value(
-            "errors", "Build Canary found empty values. %s was empty." % empty)
-
     if canary.dead:
         canary.logger.error("Build Canary found errors.")
-        raise PluginError("Build Canary found errors. ... here's a list of the errors.\n %s", pformat((canary.build_errors), indent=2))
+        raise PluginError(f"Build Canary found errors. ... here's a list of the errors.\n {pformat(canary.build_errors, indent=2)}")
 
     canary.logger.info("Build Canary passed without errors.")
-    """
+
+
+# MkDocs loads hooks by file path, so as a hook this module isn't the `license_canary` module the other hooks import, and its class would make a second singleton. The hook events use the shared one instead.
+if __name__ != "license_canary":
+    from license_canary import LicenseBuildCanary  # noqa: F811
 
 LicenseBuildCanary()
@@ -0,0 +1,69 @@
+"""
+Finds the license files each language's build serves when mkdocs-static-i18n is configured.
+
+The i18n plugin builds the site once per language, one after the other, and each build only sees the files for its own language (a translation where there is one, the default language's page otherwise). Assembling each language's licenses in its own build would make build time grow with the number of languages. Instead, `license_assembly.on_files` asks for every language's license files during the first build, assembles all of them in one process pool, and the other builds pick up the results.
+
+We make each language's files with the plugin's own `create_i18n_file`, so their src_uris, URLs, and i18n attributes match the ones that language's build sees.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from hook_logger import get_logger
+from mkdocs.config.base import Config as MkDocsConfig
+from mkdocs.structure.files import File, get_files
+from plainlicense.manifest import LicenseManifest
+
+# where a file's output goes, and the attributes mkdocs-static-i18n adds; a generated license file takes these over from the file it replaces
+LOCATION_ATTRIBUTES = ("name", "dest_uri", "url", "abs_dest_path")
+I18N_ATTRIBUTES = ("alternates", "locale", "locale_alternate_of", "localization", "norm_src_uri")
+
+_locale_log_level = logging.WARNING
+
+if not hasattr(__name__, "locale_logger"):
+    locale_logger = get_logger("LOCALES", _locale_log_level)
+
+
+def get_i18n_plugin(config: MkDocsConfig) -> Any | None:
+    """Returns the mkdocs-static-i18n plugin, if the site uses it."""
+    return config.plugins.get("i18n")
+
+
+def current_locale(config: MkDocsConfig) -> str | None:
+    """Returns the language the current build is for, or None without mkdocs-static-i18n."""
+    plugin = get_i18n_plugin(config)
+    return plugin.current_language if plugin else None
+
+
+def locale_license_files(config: MkDocsConfig, plugin: Any, manifest: LicenseManifest) -> dict[str, list[File]]:
+    """
+    Returns, for each language the i18n plugin builds, the license `index.md` files that language's build will serve. A translation wins over the default language's page; without one, the default page stands in if the plugin falls back to it.
+    """
+    if plugin.config.docs_structure == "suffix":
+        from mkdocs_static_i18n.suffix import create_i18n_file
+    else:
+        from mkdocs_static_i18n.folder import create_i18n_file
+    sources = [file for file in get_files(config) if manifest.get(file.src_uri)]
+    by_locale: dict[str, list[File]] = {}
+    for locale in plugin.build_languages:
+        chosen: dict[str, File] = {}
+        for source in sources:
+            file = create_i18n_file(source, locale, plugin.default_language, plugin.all_languages, config)
+            if file.locale == locale:
+                chosen[file.norm_src_uri] = file
+            elif plugin.config.fallback_to_default and file.locale == plugin.default_language:
+                chosen.setdefault(file.norm_src_uri, file)
+        by_locale[locale] = list(chosen.values())
+        locale_logger.debug("%s license files for %s", len(chosen), locale)
+    return by_locale
+
+
+def carry_over(original: File, generated: File, attributes: Iterable[str] = LOCATION_ATTRIBUTES + I18N_ATTRIBUTES) -> File:
+    """
+    Copies where `original` is built to, and any i18n attributes, onto the `generated` file that replaces it. Without the i18n plugin the locations already match, so this changes nothing.
+    """
+    for attribute in attributes:
+        if attribute in vars(original):
+            setattr(generated, attribute, getattr(original, attribute))
+    return generated
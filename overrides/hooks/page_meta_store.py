@@ -0,0 +1,68 @@
+"""
+Hands assembled license metadata to the page lifecycle without a YAML round trip.
+
+Without the store, `on_files` serializes each license's metadata to YAML frontmatter, and MkDocs parses it right back when the page reads its source. That metadata includes the official license text and every rendered tab, so it's by far the biggest YAML on the site. With the store, the generated file holds only markdown, `on_files` keeps the metadata here keyed by src_uri, and `license_assembly.on_page_markdown` puts it back on the page before any other hook or plugin sees it.
+
+Set `META_HANDOFF=false` to write the metadata as frontmatter instead.
+"""
+
+import logging
+import os
+from collections.abc import MutableMapping
+from typing import Any
+
+from hook_logger import get_logger
+from mkdocs.structure.pages import Page
+
+META_HANDOFF_ENABLED = os.environ.get("META_HANDOFF", "true").lower() == "true"
+
+_store_log_level = logging.WARNING
+
+if not hasattr(__name__, "store_logger"):
+    store_logger = get_logger("META_STORE", _store_log_level)
+
+
+class PageMetaStore:
+    """Assembled page metadata, keyed by src_uri, for one build."""
+
+    def __init__(self) -> None:
+        self._meta: dict[str, MutableMapping[str, Any]] = {}
+
+    def put(self, src_uri: str, meta: MutableMapping[str, Any]) -> None:
+        """Stores a page's metadata."""
+        self._meta[src_uri] = meta
+
+    def restore(self, page: Page) -> bool:
+        """Puts the stored metadata back on a page that has read its source. Returns False if there's nothing stored for it."""
+        if (meta := self._meta.get(page.file.src_uri)) is None:
+            return False
+        if page.meta:
+            # something slipped frontmatter into the generated file; the assembled values win
+            store_logger.warning("Page %s already has metadata; replacing it with the assembled metadata", page.file.src_uri)
+        page.meta = meta
+        return True
+
+    def clear(self) -> None:
+        """Drops all stored metadata; `on_files` calls this at the start of each build."""
+        self._meta.clear()
+
+    def __contains__(self, src_uri: object) -> bool:
+        return src_uri in self._meta
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+
+_store = PageMetaStore()
+
+
+def get_meta_store() -> PageMetaStore:
+    """Returns the process-wide page metadata store."""
+    return _store
+
+
+def page_source(markdown: str) -> str:
+    """
+    Returns the generated file content for a page whose metadata is in the store. The leading blank line stops MkDocs from reading MultiMarkdown-style metadata out of the first lines, and MkDocs strips it along with the rest of the leading newlines, just as it does after frontmatter.
+    """
+    return f"\n{markdown}"
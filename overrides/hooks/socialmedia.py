@@ -1,6 +1,5 @@
-"""Adds social media buttons to the bottom of each blog and license page."""
+"""Adds social media buttons to the bottom of each page in the about, FAQ, and helping sections."""
 import logging
-import re
 import urllib.parse
 from textwrap import dedent
 
@@ -10,6 +9,7 @@ from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
 
 from hook_logger import get_logger
+from plainlicense.pages import get_page_registry
 
 if not hasattr("SOCIAL", "social_logger"):
     social_logger = get_logger(__name__, logging.WARNING)
@@ -19,15 +19,11 @@ def on_page_markdown(
     markdown: str, page: Page, config: MkDocsConfig, files: Files
 ) -> str:
     """
-    Adds social media buttons to the bottom of each blog and license page.
+    Adds social media buttons to the bottom of each page in the about, FAQ, and helping sections (but not their index pages). The page registry classified the page in `on_files` (see `plainlicense.pages`).
     """
     x_intent = "https://twitter.com/intent/tweet"
     fb_sharer = "https://www.facebook.com/sharer/sharer.php"
-    include = re.compile(
-        r"blog/[1-9].*|licenses/.+/index.+|licenses/.+/index.+|licenses/.+/.+/index.+|helping/.+|faq/.+|about/.+"
-    )
-    social_logger.info
-    if not include.match(page.url) or "index" in page.url:
+    if not get_page_registry().is_shareable(page.file.src_uri):
         return markdown
     base_url: str = config.get("site_url", "https://plainlicense.org")
     page_url: str = f"{base_url}{page.url}" if page.url.startswith('/') else f"{base_url}/{page.url}"
@@ -6,10 +6,9 @@ from pathlib import Path
 from hook_logger import get_logger
 from mkdocs.config.base import Config as MkDocsConfig
 from mkdocs.structure.pages import Page
-from mkdocs.structure.files import Files
+from mkdocs.structure.files import Files, InclusionLevel
 from mkdocs.plugins import event_priority
-
-from license_canary import LicenseBuildCanary
+from plainlicense.pages import get_page_registry
 
 if not hasattr("CHANGELOGS", "changelog_logger"):
     changelog_logger = get_logger(__name__, logging.WARNING)
@@ -20,7 +19,7 @@ def on_pre_page(page: Page, config: MkDocsConfig, files: Files) -> Page:
 
     Also, check for tags in the frontmatter and update them if necessary.
     """
-    if not LicenseBuildCanary().canary().is_license_page(page):
+    if not get_page_registry().is_license(page.file.src_uri):
         return page
 
     license_dir = Path(page.file.src_uri).parent
@@ -28,5 +27,5 @@ def on_pre_page(page: Page, config: MkDocsConfig, files: Files) -> Page:
     if changelog := files.get_file_from_path(f"{license_dir}/CHANGELOG.md"):
         changelog_content = changelog.content_string
         page.meta["changelog"] = changelog_content
-        setattr(changelog, "inclusion", -3)
+        changelog.inclusion = InclusionLevel.EXCLUDED
     return page
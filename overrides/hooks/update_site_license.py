@@ -4,7 +4,6 @@ Hook that updates the site license to match the current version of the Plain Unl
 
 import logging
 from pathlib import Path
-from pprint import pformat
 from textwrap import wrap
 
 from hook_logger import get_logger
@@ -12,8 +11,8 @@ from mkdocs.config.base import Config as MkDocsConfig
 from mkdocs.structure.nav import Navigation
 from mkdocs.structure.pages import Page
 from mkdocs.utils.templates import TemplateContext
-
-from license_canary import LicenseBuildCanary
+from plainlicense.logs import lazy
+from plainlicense.pages import get_page_registry
 
 _site_license_log_level = logging.WARNING
 
@@ -35,13 +34,11 @@ def on_page_context(
         TemplateContext: The updated template context after processing the page.
     """
     logger = get_logger("SITE_LICENSE", _site_license_log_level)
-    canary = LicenseBuildCanary.canary()
-
-    if not (license := canary.is_license_page(page)):
+    if not get_page_registry().is_license(page.file.src_uri):
         return context
 
     logger.debug("License context: %s \n", context)
-    logger.debug("License page: %s \n", pformat(page.content, 2))
+    logger.debug("License page: %s \n", lazy(page.content))
     meta = page.meta
     if 'original_name' not in meta:
         return context
@@ -52,7 +49,7 @@ def on_page_context(
         logger.debug("PATH: %s", Path.cwd())
         license = SiteLicense(context, page)
         license.check_for_updates()
-        logger.debug("license: %s", license.full_text)
+        logger.debug("license: %s", lazy(license.full_text))
     return context
 
 
@@ -103,7 +100,7 @@ class SiteLicense:
         self.full_text = f"{self._preamble}\n\n{self.title}\n\n{self.version_text}\n\n{self.text}\n\n{self.interpretation_section}\n\nOfficial Unlicense: [Unlicense.org]({self.original_url})"
         self.logger = get_logger(__name__, _site_license_log_level)
 
-        self.logger.debug("license full text: %s", self.full_text)
+        self.logger.debug("license full text: %s", lazy(self.full_text))
 
     def wrap_text(self, text: str) -> str:
         """
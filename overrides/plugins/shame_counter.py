@@ -3,6 +3,7 @@ from mkdocs.config.base import Config as MkDocsConfig
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
+from plainlicense.pages import get_page_registry
 
 
 class ShameCounter(BasePlugin):
@@ -14,10 +15,11 @@ class ShameCounter(BasePlugin):
     Attributes:
         shame_counts (dict): A dictionary storing counts of shame words for each license.
         total_counts (dict): A dictionary storing total counts of shame words across all licenses.
+        shame_words (dict): The shame words from the config, mapped to their plain language alternatives.
     """
 
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig:
-        """Initializes the shame_counts and total_counts dictionaries.
+        """Initializes the shame_counts and total_counts dictionaries, and reads the shame words and their alternatives from the config.
 
         Args:
             config (MkDocsConfig): The configuration object.
@@ -27,9 +29,10 @@ class ShameCounter(BasePlugin):
         """
         self.shame_counts = {}
         self.total_counts = {}
-        self.shame_words = [
-            word.strip() for word in config["extra"]["shame_words"].keys()
-        ]
+        self.shame_words = {
+            word.strip(): alternative
+            for word, alternative in config["extra"]["shame_words"].items()
+        }
         return config
 
     def on_page_markdown(
@@ -49,9 +52,9 @@ class ShameCounter(BasePlugin):
         Returns:
             str: The original markdown content.
         """
-        if page.file.src_path.startswith("docs/licenses/"):
+        if get_page_registry().is_license(page.file.src_uri):
             license_name = page.meta.get("original_name")
-            license_text = page.meta.get("official_license_text")
+            license_text = page.meta.get("official_license_text") or ""
 
             word_count = {}
             for word, alternative in self.shame_words.items():
@@ -0,0 +1,228 @@
+"""
+Benchmarks how license assembly scales with the number of licenses, using synthetic corpora from `corpus.py`.
+
+For each corpus size (10, 100, and 1000 licenses by default), we time these stages:
+
+- license_content: assembling every synthetic license with `LicenseContent` (`plainlicense.content.assemble_license`), from inputs read up front.
+- render_boilerplate: rendering the whole boilerplate for every synthetic license (`RenderedBoilerplate`, which replaced `render_mapping`).
+- on_files: the `license_assembly` hook's `on_files`, on a fresh `Files` each run.
+- build: a full `mkdocs build` of the site with the synthetic licenses added.
+
+Each stage runs in its own process, so module-level caches start cold and the process's peak RSS belongs to that stage. We report the best and mean time, throughput in licenses and MiB of license source per second (from the best run), and peak RSS, along with the RSS after setup so you can tell the stage's share apart from the setup's. The assembly cache is turned off; `PARALLEL_ASSEMBLY` and `ASSEMBLY_WORKERS` are passed through, so run with `PARALLEL_ASSEMBLY=true` to measure the process pool.
+
+Results go to stdout as JSON (or to `--output`), with a table on stderr. Run it from the repository root:
+
+    python scripts/benchmarks/assembly_scaling.py --sizes 10 100 --output scaling.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from corpus import MAX_SIZE, MIN_SIZE, copy_site, generate_corpus
+
+STAGES = ("license_content", "render_boilerplate", "on_files", "build")
+SIZES = (10, 100, 1000)
+MIB = 1024 * 1024
+
+
+@dataclass
+class StageResult:
+    """
+    One stage's measurements at one corpus size.
+
+    Attributes:
+        stage (str): The stage name.
+        corpus (int): How many synthetic licenses the corpus has.
+        licenses (int): How many licenses the stage handled; `on_files` and `build` include the site's real licenses.
+        source_bytes (int): The total size of those licenses' `index.md` files.
+        runs (list[float]): Each run's time, in seconds.
+        setup_rss_kib (int): Peak RSS after setup, before the first run.
+        peak_rss_kib (int): Peak RSS after the last run.
+    """
+
+    stage: str
+    corpus: int
+    licenses: int
+    source_bytes: int
+    runs: list[float]
+    setup_rss_kib: int
+    peak_rss_kib: int
+
+    def summary(self) -> dict[str, Any]:
+        best = min(self.runs)
+        return {
+            **asdict(self),
+            "best_s": best,
+            "mean_s": statistics.fmean(self.runs),
+            "licenses_per_s": self.licenses / best if best else None,
+            "mib_per_s": self.source_bytes / MIB / best if best else None,
+        }
+
+
+def peak_rss_kib() -> int:
+    """Returns this process's peak RSS in KiB (`ru_maxrss` is in bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def license_paths(docs_dir: Path) -> list[Path]:
+    return sorted(docs_dir.glob("licenses/*/*/index.md"))
+
+
+def load_site(config_file: Path, docs_dir: Path, site_dir: Path):
+    """Loads the MkDocs config for a corpus and runs the events that come before `on_files`."""
+    from mkdocs.config import load_config
+
+    config = load_config(str(config_file), docs_dir=str(docs_dir), site_dir=str(site_dir))
+    config.plugins.on_startup(command="build", dirty=False)
+    config = config.plugins.on_config(config)
+    config.plugins.on_pre_build(config=config)
+    return config
+
+
+def setup_stage(stage: str, config_file: Path, docs_dir: Path, paths: list[Path]) -> tuple[Callable[[], Any], list[Path]]:
+    """Returns a function that runs one pass of `stage`, and the licenses it handles."""
+    from plainlicense.content import RenderedBoilerplate, assemble_license, clean_content, materialize, prepare_boilerplate
+    from plainlicense.export import load_boilerplate, read_license
+    from plainlicense.versions import VersionIndex
+
+    site_dir = docs_dir.parent / "site"
+    if stage in ("license_content", "render_boilerplate"):
+        boilerplate = prepare_boilerplate(load_boilerplate(config_file))
+        versions = VersionIndex(docs_dir)
+        inputs = [read_license(path, docs_dir, versions) for path in paths]
+        if stage == "license_content":
+            return lambda: [assemble_license(replace(item), boilerplate) for item in inputs], paths
+        metas = [clean_content(item.meta) for item in inputs]
+        return lambda: [materialize(RenderedBoilerplate(boilerplate, meta)) for meta in metas], paths
+    if stage == "on_files":
+        from mkdocs.structure.files import get_files
+
+        config = load_site(config_file, docs_dir, site_dir)
+        hook = next(hook for name, hook in config.hooks.items() if name.endswith("license_assembly.py"))
+        return lambda: hook.on_files(get_files(config), config), license_paths(docs_dir)
+    if stage == "build":
+        from mkdocs.commands.build import build
+        from mkdocs.config import load_config
+
+        def build_site() -> None:
+            # the same events `mkdocs build` sends around a build
+            config = load_config(str(config_file), docs_dir=str(docs_dir), site_dir=str(site_dir))
+            # loaded with the hooks; keep the corpus's pages out of the site's dependency graph
+            from dependency_graph import get_dependency_graph
+
+            get_dependency_graph().path = docs_dir.parent / "license_dependencies.json"
+            config.plugins.on_startup(command="build", dirty=False)
+            try:
+                build(config)
+            finally:
+                config.plugins.on_shutdown()
+
+        return build_site, license_paths(docs_dir)
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def run_stage(stage: str, config_file: Path, docs_dir: Path, paths: list[Path], repeat: int) -> StageResult:
+    """Sets up and times one stage; runs in its own process."""
+    # measure cold assembly
+    os.environ["ASSEMBLY_CACHE"] = "false"
+    func, handled = setup_stage(stage, config_file, docs_dir, paths)
+    setup_rss = peak_rss_kib()
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return StageResult(
+        stage=stage,
+        corpus=len(paths),
+        licenses=len(handled),
+        source_bytes=sum(path.stat().st_size for path in handled),
+        runs=runs,
+        setup_rss_kib=setup_rss,
+        peak_rss_kib=peak_rss_kib(),
+    )
+
+
+def init_repo(root: Path) -> None:
+    """Commits a corpus to its own git repository; the git-revision-date and git-authors plugins need one to build the site."""
+    git = ["git", "-C", str(root), "-c", "user.name=benchmark", "-c", "user.email=benchmark@example.com"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "-A"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "Synthetic corpus"], check=True)
+
+
+def main() -> None:
+    """Generates a corpus for each size and benchmarks each stage against it."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="corpus sizes, in licenses")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--config", type=Path, default=Path("mkdocs.yml"))
+    parser.add_argument("--docs-dir", type=Path, default=Path("docs"), help="the site to add the synthetic licenses to")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the build always runs once")
+    parser.add_argument("--min-size", type=int, default=MIN_SIZE)
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", type=Path, help="where to write the corpora (kept afterwards; default: a temporary directory)")
+    parser.add_argument("--output", type=Path, help="write the JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="plainlicense-corpus-"))
+    results = []
+    print(f"{'stage':<20}{'corpus':>8}{'licenses':>10}{'best s':>10}{'lic/s':>10}{'MiB/s':>9}{'peak MiB':>10}", file=sys.stderr)
+    try:
+        for size in args.sizes:
+            docs_dir = workdir / str(size) / "docs"
+            if any(stage in ("on_files", "build") for stage in args.stages):
+                copy_site(args.docs_dir, docs_dir)
+            paths = generate_corpus(docs_dir, size, min_size=args.min_size, max_size=args.max_size, seed=args.seed)
+            init_repo(docs_dir.parent)
+            for stage in args.stages:
+                repeat = 1 if stage == "build" else args.repeat
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                    result = executor.submit(run_stage, stage, args.config.resolve(), docs_dir.resolve(), paths, repeat).result()
+                summary = result.summary()
+                results.append(summary)
+                print(
+                    f"{stage:<20}{size:>8}{result.licenses:>10}{summary['best_s']:>10.3f}{summary['licenses_per_s']:>10.1f}"
+                    f"{summary['mib_per_s']:>9.2f}{result.peak_rss_kib / 1024:>10.1f}",
+                    file=sys.stderr,
+                )
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parallel_assembly": os.environ.get("PARALLEL_ASSEMBLY", "false"),
+        "assembly_workers": os.environ.get("ASSEMBLY_WORKERS"),
+        "seed": args.seed,
+        "min_size": args.min_size,
+        "max_size": args.max_size,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
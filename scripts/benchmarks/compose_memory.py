@@ -0,0 +1,58 @@
+"""
+Measures how much memory composing each license page takes (tracemalloc peak), relative to the size of the page it produces.
+
+The license text transforms and disclaimer text are computed first, so the peak only covers composing the page: the tabs, the shared disclaimer, and the final join. With segment-based composition, the page string itself should be most of the peak, so the ratio should stay close to 1 however big the license gets. Use `--scale` to repeat each license's text and see how a license several times the size of MPL-2.0 (like GPL-3.0 or AGPL-3.0) behaves.
+
+Run it from the repository root:
+
+    python scripts/benchmarks/compose_memory.py --scale 1 --scale 8
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+from plainlicense.content import prepare_boilerplate, prepare_license
+from plainlicense.discovery import discover_licenses
+from plainlicense.export import load_boilerplate, read_license
+from plainlicense.versions import VersionIndex
+
+
+def measure(path: Path, docs_dir: Path, versions: VersionIndex, boilerplate: dict, scale: int) -> tuple[int, int]:
+    """Returns the page size and the composition peak for one license, both in bytes."""
+    inputs = read_license(path, docs_dir, versions)
+    inputs.meta["reader_license_text"] = "\n\n".join([inputs.meta["reader_license_text"]] * scale)
+    license = prepare_license(inputs, boilerplate)
+    # everything the page is composed from, computed outside the measurement
+    license.variants, license.not_advice_text, license.not_official_text  # noqa: B018
+    tracemalloc.start()
+    try:
+        page = license.license_content
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return sys.getsizeof(page), peak
+
+
+def main() -> None:
+    """Prints the composition peak for each license at each scale."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--docs-dir", type=Path, default=Path("docs"))
+    parser.add_argument("--config", type=Path, default=Path("mkdocs.yml"))
+    parser.add_argument(
+        "--scale", type=int, action="append", help="repeat each license's text this many times (repeatable; default 1)"
+    )
+    args = parser.parse_args()
+
+    boilerplate = prepare_boilerplate(load_boilerplate(args.config))
+    versions = VersionIndex(args.docs_dir)
+    print(f"{'license':<20}{'scale':>6}{'page KiB':>11}{'peak KiB':>11}{'peak/page':>11}")
+    for scale in args.scale or [1]:
+        for path in discover_licenses(args.docs_dir):
+            page, peak = measure(path, args.docs_dir, versions, boilerplate, scale)
+            print(f"{path.parent.name:<20}{scale:>6}{page / 1024:>11.1f}{peak / 1024:>11.1f}{peak / page:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Generates a corpus of synthetic licenses, so we can see how license assembly scales past the handful of real licenses we have.
+
+Each synthetic license gets a directory like a real one: `licenses/<category>/syn-0001/` with an `index.md`, a `CHANGELOG.md`, and a `package.json`. The `index.md` has the frontmatter a real license has, and its license texts use everything the transforms handle: headings, lists, annotations, a definitions list, inline formatting, links, and the `{{ year }}` placeholder. Sizes are spread evenly on a log scale between `--min-size` and `--max-size` (1 KiB to 1 MiB by default), so a corpus has a few huge licenses and plenty of small ones. The same seed always gives the same corpus.
+
+With `--site`, the rest of the docs directory is copied in too, so the corpus builds as a full site (the real licenses stay, and the synthetic ones are added next to them).
+
+Run it from the repository root:
+
+    python scripts/benchmarks/corpus.py /tmp/corpus/docs --count 100 --site
+"""
+
+import argparse
+import json
+import math
+import random
+import shutil
+from pathlib import Path
+
+from plainlicense.content import LICENSE_CATEGORIES
+
+MIN_SIZE = 1024
+MAX_SIZE = 1024 * 1024
+
+WORDS = (
+    "work", "license", "copy", "share", "change", "use", "terms", "rights", "author", "contributor", "notice",
+    "source", "patent", "trademark", "warranty", "liability", "distribute", "permission", "condition", "version",
+    "software", "materials", "grant", "agree", "include", "modify", "sell", "publish", "credit", "original",
+    "you", "we", "must", "may", "not", "any", "all", "and", "or", "the", "a", "of", "to", "in", "for", "with",
+    "under", "this", "that", "these", "each", "every", "without", "unless", "only", "also", "free",
+)
+TERMS = ("we", "you", "the work", "contributor", "larger work", "source form", "executable form", "modifications")
+PERMISSIONS = ("commercial-use", "modifications", "distribution", "private-use", "patent-use")
+CONDITIONS = ("include-copyright", "disclose-source", "document-changes", "same-license", "same-license--file")
+LIMITATIONS = ("liability", "warranty", "trademark-use", "patent-use")
+
+# how the target size of each index.md splits between the two license texts
+READER_SHARE = 0.6
+
+
+def license_sizes(count: int, min_size: int = MIN_SIZE, max_size: int = MAX_SIZE) -> list[int]:
+    """Returns `count` target sizes, in bytes, spaced evenly on a log scale from `min_size` to `max_size`."""
+    if count == 1:
+        return [min_size]
+    ratio = math.log(max_size / min_size) / (count - 1)
+    return [round(min_size * math.exp(ratio * index)) for index in range(count)]
+
+
+def sentence(rng: random.Random, length: int) -> str:
+    """Returns a sentence of `length` words, sometimes with bold or code spans, or a link."""
+    words = rng.choices(WORDS, k=length)
+    if length > 6 and rng.random() < 0.3:
+        start = rng.randrange(length - 3)
+        words[start] = f"**{words[start]}"
+        words[start + 2] = f"{words[start + 2]}**"
+    if length > 4 and rng.random() < 0.15:
+        index = rng.randrange(length)
+        words[index] = f"`{words[index]}`"
+    if rng.random() < 0.1:
+        words.append(f"[{rng.choice(WORDS)}](https://example.com/{rng.choice(WORDS)})")
+    return f"{' '.join(words).capitalize()}."
+
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng, rng.randint(5, 24)) for _ in range(rng.randint(1, 5)))
+
+
+def section(rng: random.Random, annotations: int) -> tuple[str, int]:
+    """Returns one section of license text and how many annotations it used."""
+    lines = [f"## {sentence(rng, rng.randint(3, 7))[:-1].title()}", ""]
+    for _ in range(rng.randint(1, 3)):
+        lines += [paragraph(rng), ""]
+    if rng.random() < 0.5:
+        lines += [f"- {sentence(rng, rng.randint(4, 16))}" for _ in range(rng.randint(2, 6))]
+        lines.append("")
+    if rng.random() < 0.25:
+        annotations += 1
+        lines += [
+            f"{paragraph(rng)}({annotations}) {sentence(rng, rng.randint(5, 12))}",
+            "{ .annotate }",
+            "",
+            f"{annotations}. {sentence(rng, rng.randint(6, 20))}",
+            "",
+        ]
+    return "\n".join(lines), annotations
+
+
+def license_text(rng: random.Random, size: int, *, definitions: bool) -> str:
+    """Returns license text of about `size` bytes, ending with a definitions list if `definitions` is set."""
+    parts = ["Copyright (c) {{ year }} `[copyright holders]`", ""]
+    length = 0
+    annotations = 0
+    while length < size:
+        text, annotations = section(rng, annotations)
+        parts.append(text)
+        length += len(text.encode()) + 1
+    if definitions:
+        parts += ["## Definitions", ""]
+        for term in rng.sample(TERMS, k=rng.randint(3, len(TERMS))):
+            parts += [f"`{term}`", "", f":    {sentence(rng, rng.randint(5, 14))[:-1]}", ""]
+    return "\n".join(parts).strip()
+
+
+def indent(text: str) -> str:
+    """Indents text for a YAML literal block."""
+    return "\n".join(f"  {line}" if line else "" for line in text.splitlines())
+
+
+def license_source(rng: random.Random, number: int, category: str, size: int) -> str:
+    """Returns a synthetic license's `index.md`."""
+    spdx_id = f"SYN-{number:04d}"
+    name = f"Synthetic License {number}"
+    reader = license_text(rng, round(size * READER_SHARE), definitions=True)
+    official = license_text(rng, round(size * (1 - READER_SHARE)), definitions=False)
+    has_official = rng.random() < 0.8
+    lists = {
+        "permissions": rng.sample(PERMISSIONS, k=rng.randint(1, 4)),
+        "conditions": rng.sample(CONDITIONS, k=rng.randint(0, 3)),
+        "limitations": rng.sample(LIMITATIONS, k=rng.randint(1, 3)),
+    }
+    frontmatter = [
+        "---",
+        "template: license.html",
+        f"plain_name: Plain {name}",
+        f"spdx_id: {spdx_id}",
+        f"original_name: {name}",
+        f"original_url: https://example.com/licenses/{spdx_id.lower()}",
+        "original_organization: Synthetic Licensing Foundation",
+        f"original_version: {rng.choice(['null', '1.0', '2.0', '3.1'])}",
+        f"also_known_as: {name.replace('License', 'Terms')}",
+        f"no_official: {'false' if has_official else 'true'}",
+        f"category: {category}",
+        f"license_description: {json.dumps(paragraph(rng))}",
+        f"how: {json.dumps(paragraph(rng))}",
+        f"note: {json.dumps(paragraph(rng))}",
+    ]
+    for key, values in lists.items():
+        frontmatter += [f"{key}:", *(f"  - {value}" for value in values)] if values else [f"{key}: []"]
+    frontmatter += [
+        "outro:",
+        "reader_license_text: |",
+        indent(reader),
+        "official_license_text: |",
+        indent(official),
+        f"original_gunning_fog: {rng.uniform(14, 24):.2f}",
+        f"plain_gunning_fog: {rng.uniform(7, 12):.2f}",
+        "link_in_original: false",
+        "reference_links: null",
+        "---",
+        "",
+    ]
+    abbreviations = [f"*[{term}]: {sentence(rng, rng.randint(6, 16))}" for term in rng.sample(TERMS, k=3)]
+    return "\n".join([*frontmatter, *abbreviations, ""])
+
+
+def changelog_source(rng: random.Random, releases: int) -> str:
+    """Returns a semantic-release style `CHANGELOG.md` with `releases` entries, newest first."""
+    lines: list[str] = []
+    for release in range(releases, 0, -1):
+        lines += [f"## [0.{release}.0](https://example.com/compare/0.{release - 1}.0...0.{release}.0) (2024-01-{release % 28 + 1:02d})", ""]
+        for heading in rng.sample(("Features", "Bug Fixes", "Documentation"), k=rng.randint(1, 2)):
+            lines += [f"### {heading}", ""]
+            lines += [f"* {sentence(rng, rng.randint(4, 12))[:-1]} ([{rng.getrandbits(28):07x}](https://example.com/commit))" for _ in range(rng.randint(1, 4))]
+            lines.append("")
+    return "\n".join(lines)
+
+
+def generate_corpus(
+    docs_dir: Path, count: int, *, min_size: int = MIN_SIZE, max_size: int = MAX_SIZE, seed: int = 0
+) -> list[Path]:
+    """
+    Writes `count` synthetic licenses under `docs_dir/licenses` and returns their `index.md` paths, smallest first.
+
+    Args:
+        docs_dir (Path): The docs directory to write into.
+        count (int): How many licenses to write.
+        min_size (int): The smallest `index.md`, in bytes (roughly).
+        max_size (int): The largest `index.md`, in bytes (roughly).
+        seed (int): The random seed; the same seed always gives the same corpus.
+    """
+    rng = random.Random(seed)
+    paths = []
+    for number, size in enumerate(license_sizes(count, min_size, max_size), start=1):
+        category = LICENSE_CATEGORIES[number % len(LICENSE_CATEGORIES)]
+        directory = docs_dir / "licenses" / category / f"syn-{number:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "index.md").write_text(license_source(rng, number, category, size), encoding="utf-8")
+        (directory / "CHANGELOG.md").write_text(changelog_source(rng, rng.randint(1, 12)), encoding="utf-8")
+        package = {
+            "name": f"plain-license-syn-{number:04d}",
+            "version": rng.choice(["0.0.0-development", f"0.{rng.randint(1, 9)}.{rng.randint(0, 9)}"]),
+            "private": True,
+        }
+        (directory / "package.json").write_text(json.dumps(package, indent=2), encoding="utf-8")
+        paths.append(directory / "index.md")
+    return paths
+
+
+def copy_site(source: Path, docs_dir: Path) -> None:
+    """Copies the site's docs directory, so a synthetic corpus builds as a full site."""
+    shutil.copytree(source, docs_dir, dirs_exist_ok=True)
+
+
+def main() -> None:
+    """Writes a synthetic corpus."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("docs_dir", type=Path, help="where to write the corpus")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--min-size", type=int, default=MIN_SIZE)
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--site", type=Path, nargs="?", const=Path("docs"), help="copy this docs directory in first (default: docs)")
+    args = parser.parse_args()
+
+    if args.site:
+        copy_site(args.site, args.docs_dir)
+    paths = generate_corpus(args.docs_dir, args.count, min_size=args.min_size, max_size=args.max_size, seed=args.seed)
+    total = sum(path.stat().st_size for path in paths)
+    print(f"Wrote {len(paths)} licenses ({total / 1024 / 1024:.1f} MiB) to {args.docs_dir}")
+
+
+if __name__ == "__main__":
+    main()
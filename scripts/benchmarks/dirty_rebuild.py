@@ -0,0 +1,82 @@
+"""
+Checks that a dirty rebuild only assembles the license that changed: we build the site, change one license's `CHANGELOG.md`, and rebuild with `dirty`, like `mkdocs serve --dirty` does after an edit. The canary should report that license as assembled, and every other license as unchanged.
+
+The site builds from a copy of the docs directory in a temporary directory, and the dependency graph is kept there too, so the check leaves the site's own build state alone. The assembly cache is off, since a cache hit would hide whether the license was assembled.
+
+Run it from the repository root:
+
+    python scripts/benchmarks/dirty_rebuild.py
+    python scripts/benchmarks/dirty_rebuild.py --license permissive/mit
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from corpus import copy_site
+
+
+def build_site(config_file: Path, docs_dir: Path, site_dir: Path, *, dirty: bool) -> tuple[list[str], list[str]]:
+    """Builds the site the way `mkdocs build` does, and returns the licenses the canary saw assembled and left unchanged."""
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    config = load_config(str(config_file), docs_dir=str(docs_dir), site_dir=str(site_dir))
+    # loaded with the hooks
+    from dependency_graph import get_dependency_graph
+    from license_canary import LicenseBuildCanary
+
+    get_dependency_graph().path = site_dir.parent / "license_dependencies.json"
+    config.plugins.on_startup(command="build", dirty=dirty)
+    try:
+        build(config, dirty=dirty)
+    finally:
+        config.plugins.on_shutdown()
+    canary = LicenseBuildCanary.canary()
+    return list(canary.processed_licenses), list(canary.unchanged_licenses)
+
+
+def main() -> None:
+    """Runs the check."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--docs-dir", type=Path, default=Path("docs"))
+    parser.add_argument("--config", type=Path, default=Path("mkdocs.yml"))
+    parser.add_argument("--license", default="", help="the license to change, like `permissive/mit` (default: the first one)")
+    args = parser.parse_args()
+
+    # read when the hooks load
+    os.environ["ASSEMBLY_CACHE"] = "false"
+    with tempfile.TemporaryDirectory() as temp:
+        docs_dir, site_dir = Path(temp) / "docs", Path(temp) / "site"
+        copy_site(args.docs_dir, docs_dir)
+        licenses = sorted(path.parent for path in docs_dir.glob("licenses/*/*/index.md"))
+        changed = docs_dir / "licenses" / args.license if args.license else licenses[0]
+        if changed not in licenses:
+            sys.exit(f"No license at {changed.relative_to(docs_dir)}")
+
+        processed, _ = build_site(args.config, docs_dir, site_dir, dirty=False)
+        print(f"Full build assembled {len(processed)} licenses")
+        changelog = changed / "CHANGELOG.md"
+        with changelog.open("a", encoding="utf-8") as file:
+            file.write("\n## Unreleased\n\n- A change to check dirty rebuilds.\n")
+        processed, unchanged = build_site(args.config, docs_dir, site_dir, dirty=True)
+
+    prefix = f"{changed.relative_to(docs_dir).as_posix()}/"
+    print(f"Dirty build after changing {prefix}CHANGELOG.md assembled: {', '.join(processed) or 'nothing'}")
+    failures = []
+    if not processed or any(not src_uri.startswith(prefix) for src_uri in processed):
+        failures.append(f"expected only {prefix}index.md to be assembled, got: {', '.join(processed) or 'nothing'}")
+    if stale := [src_uri for src_uri in unchanged if src_uri.startswith(prefix)]:
+        failures.append(f"the changed license was left unchanged: {', '.join(stale)}")
+    if len(processed) + len(unchanged) != len(licenses):
+        failures.append(f"expected {len(licenses)} licenses, got {len(processed)} assembled and {len(unchanged)} unchanged")
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+    print(f"{len(unchanged)} licenses left unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Checks every license's assembled output against committed golden snapshots, and times each stage of the pipeline, so a faster transform can't quietly change what we publish.
+
+We run the real licenses under `docs/licenses/` and a small synthetic corpus from `corpus.py` (a fixed seed, so it's the same every run) through the assembly pipeline, and compare four outputs per license with the snapshots in `scripts/benchmarks/golden/`:
+
+- reader: the reader license text with the year filled in.
+- markdown, plaintext: the variants `plainlicense.transforms` makes from it.
+- page: the full license page markdown, rendered with Jinja, as `assemble_license` makes it.
+
+The year (through the boilerplate, which `LicenseContent` now takes it from) and the license version are pinned, so the snapshots only change when the pipeline does.
+
+We also time each stage, taking the best of `--repeat` runs per license and summing over the licenses:
+
+- year: filling in the year.
+- tokenize: splitting the text into blocks; definitions are recognized here.
+- annotations: turning annotations into footnotes.
+- render: rendering the markdown and plaintext variants from the blocks.
+- strip_inline: plaintext stripping (the inline formatting `render` removes from each plaintext line), on its own.
+- jinja: rendering the page's templates.
+- assemble: the whole pipeline, from inputs to the rendered page.
+
+The run fails if any output differs from its snapshot, or if any stage is more than `--max-slowdown` slower than the committed timings (`golden/timings.json`). Stages that take less than `--min-time` in the baseline are too noisy to compare and only get reported. After an intended change, run with `--update` to rewrite the snapshots and timings, and commit them with the change. Timings depend on the machine, so update them on the machine you compare on.
+
+Run it from the repository root:
+
+    python scripts/benchmarks/golden_outputs.py
+    python scripts/benchmarks/golden_outputs.py --update
+"""
+
+import argparse
+import difflib
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from corpus import generate_corpus
+from plainlicense.compose import join
+from plainlicense.content import assemble_license, prepare_boilerplate, prepare_license
+from plainlicense.discovery import discover_licenses
+from plainlicense.export import load_boilerplate, read_license
+from plainlicense.templates import get_template_engine
+from plainlicense.transforms import render, resolve_annotations, strip_inline, tokenize
+from plainlicense.versions import VersionIndex
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+TIMINGS_FILE = "timings.json"
+VARIANTS = ("reader", "markdown", "plaintext", "page")
+STAGES = ("year", "tokenize", "annotations", "render", "strip_inline", "jinja", "assemble")
+
+# pinned, so the snapshots don't change with the calendar or a release
+GOLDEN_YEAR = "2024"
+GOLDEN_VERSION = "1.0.0"
+
+# the synthetic fixtures: small enough to commit, big enough to cover every construct the corpus makes
+SYNTHETIC_COUNT = 6
+SYNTHETIC_MAX_SIZE = 8 * 1024
+SYNTHETIC_SEED = 16
+
+
+def best_time(setup: Callable[[], Any], func: Callable[[Any], Any], repeat: int) -> float:
+    """Returns the best time of `func(setup())`, in seconds; `setup` runs outside the timer, so stages that change their input get a fresh one each run."""
+    best = float("inf")
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        func(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def license_outputs(path: Path, docs_dir: Path, versions: VersionIndex, boilerplate: dict[str, Any]) -> tuple[dict[str, str], Any, Any]:
+    """Returns a license's outputs, and its inputs and license for timing."""
+    inputs = replace(read_license(path, docs_dir, versions), plain_version=GOLDEN_VERSION)
+    assembled = assemble_license(replace(inputs), boilerplate)
+    license = prepare_license(replace(inputs), boilerplate)
+    outputs = {
+        "reader": license.reader_license_text,
+        "markdown": license.markdown_license_text,
+        "plaintext": license.plaintext_license_text,
+        "page": assembled.markdown,
+    }
+    return outputs, inputs, license
+
+
+def time_stages(inputs: Any, license: Any, boilerplate: dict[str, Any], repeat: int) -> dict[str, float]:
+    """Returns the best time for each stage on one license."""
+    engine = get_template_engine()
+    raw = license.meta["reader_license_text"]
+    text = license.reader_license_text
+    blocks = tokenize(text)
+    footnotes = resolve_annotations(blocks)
+    lines = [line for block in blocks for line in (block.lines if block.kind != "definition" else [block.term, *block.lines])]
+    lines += footnotes
+    page = join((license.page.markdown, *license.page_segments))
+    return {
+        "year": best_time(lambda: raw, license.replace_year, repeat),
+        "tokenize": best_time(lambda: text, tokenize, repeat),
+        "annotations": best_time(lambda: tokenize(text), resolve_annotations, repeat),
+        "render": best_time(lambda: None, lambda _: render(blocks, footnotes), repeat),
+        "strip_inline": best_time(lambda: lines, lambda lines: [strip_inline(line) for line in lines], repeat),
+        "jinja": best_time(lambda: page, lambda page: engine.render(page, license.meta), repeat),
+        "assemble": best_time(lambda: replace(inputs), lambda fresh: assemble_license(fresh, boilerplate), repeat),
+    }
+
+
+def snapshot_name(docs_dir: Path, path: Path, prefix: str) -> str:
+    """Returns a license's snapshot directory name, like `real__permissive__mit`."""
+    return "__".join((prefix, *path.parent.relative_to(docs_dir / "licenses").parts))
+
+
+def compare(name: str, outputs: dict[str, str], update: bool, context: int) -> list[str]:
+    """Compares a license's outputs with its snapshots, or rewrites them with `update`. Returns the drift, as unified diffs."""
+    directory = GOLDEN_DIR / name
+    drift = []
+    for variant in VARIANTS:
+        snapshot = directory / f"{variant}.md"
+        if update:
+            directory.mkdir(parents=True, exist_ok=True)
+            snapshot.write_text(outputs[variant], encoding="utf-8")
+            continue
+        expected = snapshot.read_text(encoding="utf-8") if snapshot.is_file() else ""
+        if expected != outputs[variant]:
+            diff = difflib.unified_diff(
+                expected.splitlines(), outputs[variant].splitlines(), f"golden/{name}/{variant}.md", "output", n=context, lineterm=""
+            )
+            drift.append("\n".join(diff) if expected else f"golden/{name}/{variant}.md: no snapshot")
+    return drift
+
+
+def check_timings(totals: dict[str, float], baseline: dict[str, float], max_slowdown: float, min_time: float) -> list[str]:
+    """Returns a message for each stage that's slower than the baseline allows."""
+    slow = []
+    for stage, total in totals.items():
+        expected = baseline.get(stage)
+        if expected is None or expected < min_time:
+            continue
+        if total > expected * (1 + max_slowdown):
+            slow.append(f"{stage}: {total * 1000:.2f} ms against {expected * 1000:.2f} ms ({total / expected - 1:+.0%})")
+    return slow
+
+
+def main() -> None:
+    """Checks the outputs against the snapshots and the timings against the baseline; exits non-zero on drift or a slowdown."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--docs-dir", type=Path, default=Path("docs"))
+    parser.add_argument("--config", type=Path, default=Path("mkdocs.yml"))
+    parser.add_argument("--repeat", type=int, default=20, help="runs per stage per license; the best counts")
+    parser.add_argument("--max-slowdown", type=float, default=0.25, help="allowed slowdown per stage, as a fraction (default 0.25)")
+    parser.add_argument("--min-time", type=float, default=0.001, help="ignore stages faster than this many seconds in the baseline")
+    parser.add_argument("--context", type=int, default=3, help="lines of context in diffs")
+    parser.add_argument("--update", action="store_true", help="rewrite the snapshots and timings")
+    args = parser.parse_args()
+
+    boilerplate = prepare_boilerplate({**load_boilerplate(args.config), "year": GOLDEN_YEAR})
+    drift: list[str] = []
+    totals = dict.fromkeys(STAGES, 0.0)
+    seen: set[str] = set()
+    with tempfile.TemporaryDirectory() as synthetic:
+        synthetic_dir = Path(synthetic)
+        generate_corpus(synthetic_dir, SYNTHETIC_COUNT, max_size=SYNTHETIC_MAX_SIZE, seed=SYNTHETIC_SEED)
+        for docs_dir, prefix in ((args.docs_dir, "real"), (synthetic_dir, "synthetic")):
+            versions = VersionIndex(docs_dir)
+            for path in discover_licenses(docs_dir):
+                name = snapshot_name(docs_dir, path, prefix)
+                seen.add(name)
+                outputs, inputs, license = license_outputs(path, docs_dir, versions, boilerplate)
+                drift += compare(name, outputs, args.update, args.context)
+                for stage, seconds in time_stages(inputs, license, boilerplate, args.repeat).items():
+                    totals[stage] += seconds
+
+    print(f"{'stage':<14}{'ms':>10}{'baseline':>10}{'change':>9}")
+    timings_path = GOLDEN_DIR / TIMINGS_FILE
+    baseline = {} if args.update or not timings_path.is_file() else json.loads(timings_path.read_text(encoding="utf-8"))
+    for stage, total in totals.items():
+        expected = baseline.get(stage)
+        change = f"{total / expected - 1:+.0%}" if expected else ""
+        print(f"{stage:<14}{total * 1000:>10.2f}{expected * 1000 if expected else 0:>10.2f}{change:>9}")
+    if args.update:
+        timings_path.write_text(json.dumps(totals, indent=2), encoding="utf-8")
+        print(f"Updated {len(seen)} snapshots and the timings in {GOLDEN_DIR}")
+        return
+
+    stale = sorted(path.name for path in GOLDEN_DIR.glob("*/") if path.name not in seen)
+    slow = check_timings(totals, baseline, args.max_slowdown, args.min_time)
+    for diff in drift:
+        print(diff)
+    if stale:
+        print(f"Snapshots without a license (remove them, or run with --update): {', '.join(stale)}")
+    if slow:
+        print("Slower than the baseline allows:\n  " + "\n  ".join(slow))
+    if drift or slow:
+        sys.exit(1)
+    print(f"{len(seen)} licenses match their snapshots")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmarks the YAML round trip that the page metadata handoff (`overrides/hooks/page_meta_store.py`) removes.
+
+Each license is assembled the way the build assembles it. Then, per license, we time:
+
+- frontmatter: serializing the metadata to YAML frontmatter (`create_page_content`), plus MkDocs parsing it back when the page reads its source (`mkdocs.utils.meta.get_data`).
+- handoff: MkDocs reading the markdown-only file the handoff generates.
+
+Run it from the repository root:
+
+    python scripts/benchmarks/meta_handoff.py
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from mkdocs.utils.meta import get_data
+from plainlicense.content import assemble_license, create_page_content, prepare_boilerplate
+from plainlicense.discovery import discover_licenses
+from plainlicense.export import load_boilerplate, read_license
+from plainlicense.versions import VersionIndex
+
+
+def best_of(func, repeat: int, number: int) -> float:
+    """Returns the best average time per call, in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def main() -> None:
+    """Times the frontmatter round trip against the handoff for each license."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--docs-dir", type=Path, default=Path("docs"))
+    parser.add_argument("--config", type=Path, default=Path("mkdocs.yml"))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    boilerplate = prepare_boilerplate(load_boilerplate(args.config))
+    versions = VersionIndex(args.docs_dir)
+    print(f"{'license':<24}{'yaml KiB':>10}{'dump ms':>10}{'parse ms':>10}{'handoff ms':>12}{'saved ms':>10}")
+    totals = [0.0, 0.0, 0.0]
+    for path in discover_licenses(args.docs_dir):
+        assembled = assemble_license(read_license(path, args.docs_dir, versions), boilerplate)
+        content = create_page_content(assembled.meta, assembled.markdown)
+        handoff = f"\n{assembled.markdown}"
+        dump = best_of(lambda: create_page_content(assembled.meta, assembled.markdown), args.repeat, args.number)
+        parse = best_of(lambda: get_data(content), args.repeat, args.number)
+        read = best_of(lambda: get_data(handoff), args.repeat, args.number)
+        frontmatter_kib = (len(content.encode()) - len(assembled.markdown.encode())) / 1024
+        totals = [totals[0] + dump, totals[1] + parse, totals[2] + read]
+        print(f"{path.parent.name:<24}{frontmatter_kib:>10.1f}{dump:>10.2f}{parse:>10.2f}{read:>12.3f}{dump + parse - read:>10.2f}")
+    dump, parse, read = totals
+    print(f"{'total':<24}{'':>10}{dump:>10.2f}{parse:>10.2f}{read:>12.3f}{dump + parse - read:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Adversarial benchmark for the license text transform: feeds it pathological inputs of growing size and checks that the runtime grows linearly.
+
+Each case repeats a malformed fragment (unclosed links, tags, attribute lists, annotation markers, and so on) until the input reaches a target size, then times `transform_license_text` at each size. We fit the slope of log(time) against log(size): linear work has a slope of 1, quadratic work has a slope of 2. Any case whose slope goes over `--max-slope` fails the run with a non-zero exit code, so it can gate CI.
+
+Run it from the repository root:
+
+    python scripts/benchmarks/redos.py
+"""
+
+import argparse
+import math
+import sys
+import time
+from collections.abc import Callable
+
+from plainlicense.transforms import transform_license_text
+
+# name -> builds a pathological input of about `size` characters
+CASES: dict[str, Callable[[int], str]] = {
+    "unclosed link brackets": lambda size: "Text " + "[" * size,
+    "unclosed link targets": lambda size: "Text " + "[a](" * (size // 4),
+    "unclosed images": lambda size: "Text " + "![" * (size // 2),
+    "unclosed reference links": lambda size: "Text " + "[a][" * (size // 4),
+    "unclosed html tags": lambda size: "Text " + "<a " * (size // 3),
+    "unclosed autolinks": lambda size: "Text " + "<http:" * (size // 6),
+    "unclosed attribute lists": lambda size: "Text " + "{: ." * (size // 4),
+    "attribute list whitespace": lambda size: "Text {" + " " * size,
+    "annotation markers": lambda size: "Text " + "(1" * (size // 2),
+    "heading padding": lambda size: "# " + " " * size + "x",
+    "heading hashes": lambda size: "# x" + " #" * (size // 2) + " x",
+    "html heading": lambda size: "<h2>" + "</h2> " * (size // 6),
+    "definition padding": lambda size: "Term\n:" + " " * size + "x",
+    "emphasis markers": lambda size: "Text " + "*a" * (size // 2),
+    "annotated paragraphs": lambda size: "\n\n".join(
+        ["Text (1) and (2).\n{ .annotate }\n\n1. First note.\n2. Second note."] * (size // 64)
+    ),
+    "nested list items": lambda size: "\n".join("- item" for _ in range(size // 7)),
+}
+
+
+def time_case(build: Callable[[int], str], size: int, repeat: int) -> float:
+    """Returns the best time, in seconds, to transform the case's input at this size."""
+    text = build(size)
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        transform_license_text(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def slope(sizes: list[int], times: list[float]) -> float:
+    """Returns the least-squares slope of log(time) against log(size)."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-7)) for elapsed in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+
+
+def main() -> int:
+    """Runs every case and returns 1 if any of them grows faster than linearly."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--min-size", type=int, default=8_000, help="smallest input, in characters")
+    parser.add_argument("--steps", type=int, default=5, help="how many times to double the input size")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per size; the best one counts")
+    parser.add_argument("--max-slope", type=float, default=1.35, help="largest log-log slope that passes")
+    args = parser.parse_args()
+
+    sizes = [args.min_size * 2**step for step in range(args.steps)]
+    print(f"{'case':<28}" + "".join(f"{size:>10,}" for size in sizes) + f"{'slope':>8}")
+    failed = []
+    for name, build in CASES.items():
+        times = [time_case(build, size, args.repeat) for size in sizes]
+        fit = slope(sizes, times)
+        verdict = "" if fit <= args.max_slope else "  FAIL"
+        print(f"{name:<28}" + "".join(f"{elapsed * 1000:>8.2f}ms" for elapsed in times) + f"{fit:>8.2f}{verdict}")
+        if verdict:
+            failed.append(name)
+    if failed:
+        print(f"\nSuperlinear cases: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    print(f"\nAll {len(CASES)} cases grow linearly (slope <= {args.max_slope}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
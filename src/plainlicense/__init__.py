@@ -0,0 +1,3 @@
+"""
+Plain License's python package: the license assembly the site build uses, and the `plainlicense` command line tools.
+"""
@@ -0,0 +1,7 @@
+"""Runs the `plainlicense` command line tools with `python -m plainlicense`."""
+
+import sys
+
+from plainlicense.cli import main
+
+sys.exit(main())
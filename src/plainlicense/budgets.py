@@ -0,0 +1,130 @@
+"""
+Performance budgets for license pages, so a change that makes a license much slower to build, or its page much bigger, doesn't merge unnoticed.
+
+The budgets live in a JSON file (`performance_budgets.json` next to `mkdocs.yml`). `defaults` sets a budget for each metric, and `licenses` can override any part of it for one license, keyed by slug:
+
+    {
+      "defaults": {"html_bytes": {"limit": 400000, "tolerance": 0.1, "action": "fail"}},
+      "licenses": {"mpl-2.0": {"html_bytes": {"limit": 600000}}}
+    }
+
+A license is over budget when a metric is more than `limit * (1 + tolerance)`. The `action` decides what happens then: `fail` fails the build, and `warn` only logs it. The canary measures these metrics:
+
+- assembly_ms: assembling the license and writing its generated file; licenses from the assembly cache aren't timed.
+- render_ms: converting the page's markdown to HTML.
+- markdown_bytes: the assembled page markdown.
+- html_bytes: the page's rendered HTML, before the theme template wraps it.
+"""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Literal
+
+BUDGETS_FILE = "performance_budgets.json"
+METRICS = ("assembly_ms", "render_ms", "markdown_bytes", "html_bytes")
+
+
+@dataclass(frozen=True, slots=True)
+class Budget:
+    """
+    The budget for one metric.
+
+    Attributes:
+        limit (float): What the metric should stay under.
+        tolerance (float): How far over the limit it can go before it counts, as a fraction of the limit.
+        action (Literal["fail", "warn"]): Whether going over fails the build or only warns.
+    """
+
+    limit: float
+    tolerance: float = 0.0
+    action: Literal["fail", "warn"] = "fail"
+
+    @property
+    def ceiling(self) -> float:
+        """Returns the highest value that's still within budget."""
+        return self.limit * (1 + self.tolerance)
+
+
+@dataclass(frozen=True, slots=True)
+class Overrun:
+    """
+    A metric over its budget.
+
+    Attributes:
+        slug (str): The license.
+        metric (str): The metric.
+        value (float): What the metric measured.
+        budget (Budget): The budget it went over.
+    """
+
+    slug: str
+    metric: str
+    value: float
+    budget: Budget
+
+    @property
+    def fatal(self) -> bool:
+        return self.budget.action == "fail"
+
+    def __str__(self) -> str:
+        over = self.value / self.budget.limit - 1
+        return f"{self.slug}: {self.metric} is {self.value:,.1f}, {over:+.0%} against a limit of {self.budget.limit:,.1f} (tolerance {self.budget.tolerance:.0%})"
+
+
+def _budget(values: Mapping[str, Any], base: Budget | None = None) -> Budget:
+    if base is not None:
+        return replace(base, **values)
+    return Budget(**values)
+
+
+class Budgets:
+    """
+    The budgets from a budget file.
+
+    Attributes:
+        defaults (dict[str, Budget]): Each metric's budget, unless a license overrides it.
+        licenses (dict[str, dict[str, Budget]]): Each license's budgets, with its overrides applied to the defaults.
+    """
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self.defaults: dict[str, Budget] = {}
+        self.licenses: dict[str, dict[str, Budget]] = {}
+        for metric, values in (data.get("defaults") or {}).items():
+            self._check_metric(metric)
+            self.defaults[metric] = _budget(values)
+        for slug, overrides in (data.get("licenses") or {}).items():
+            budgets = dict(self.defaults)
+            for metric, values in overrides.items():
+                self._check_metric(metric)
+                budgets[metric] = _budget(values, self.defaults.get(metric))
+            self.licenses[slug] = budgets
+
+    @staticmethod
+    def _check_metric(metric: str) -> None:
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric in the performance budgets: {metric} (expected one of {', '.join(METRICS)})")
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Budgets":
+        """Loads a budget file. A missing file means no budgets."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls({})
+        return cls(data)
+
+    def budget(self, slug: str, metric: str) -> Budget | None:
+        """Returns a license's budget for a metric, if it has one."""
+        return self.licenses.get(slug, self.defaults).get(metric)
+
+    def check(self, slug: str, metrics: Mapping[str, float | None]) -> list[Overrun]:
+        """Returns the metrics a license went over budget on; metrics that weren't measured (None) are skipped."""
+        overruns = []
+        for metric, value in metrics.items():
+            if value is None or (budget := self.budget(slug, metric)) is None:
+                continue
+            if value > budget.ceiling:
+                overruns.append(Overrun(slug, metric, value, budget))
+        return overruns
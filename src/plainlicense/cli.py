@@ -0,0 +1,70 @@
+"""
+The `plainlicense` command line tools.
+
+`plainlicense export` writes each license's markdown, plaintext, embed HTML, and JSON metadata to a directory without a MkDocs build:
+
+    plainlicense export --output dist/licenses
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from plainlicense.export import export_licenses
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the argument parser for the command line tools."""
+    parser = argparse.ArgumentParser(prog="plainlicense", description="Plain License command line tools.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress and debugging details")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser(
+        "export", help="export every license's markdown, plaintext, embed HTML, and metadata"
+    )
+    export.add_argument("--docs-dir", type=Path, default=Path("docs"), help="the docs directory (default: docs)")
+    export.add_argument(
+        "--config", type=Path, default=Path("mkdocs.yml"), help="the MkDocs config with the boilerplate (default: mkdocs.yml)"
+    )
+    export.add_argument(
+        "-o", "--output", type=Path, default=Path("dist/licenses"), help="where to write the licenses (default: dist/licenses)"
+    )
+    export.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes (default: CPU count; 1 exports in-process)"
+    )
+    export.add_argument(
+        "--development", action="store_true", help="keep development versions instead of treating this as a production build"
+    )
+    return parser
+
+
+def run_export(args: argparse.Namespace) -> int:
+    """Runs `plainlicense export`, printing each license as it's written."""
+    if not args.config.is_file():
+        print(f"plainlicense: config not found: {args.config}", file=sys.stderr)
+        return 2
+    count = 0
+    for exported in export_licenses(
+        args.docs_dir,
+        args.config,
+        args.output,
+        workers=args.workers,
+        production=not args.development,
+    ):
+        count += 1
+        name = f"{exported.locale}/{exported.slug}" if exported.locale else exported.slug
+        print(f"{name}: {', '.join(path.name for path in exported.files)}")
+    if not count:
+        print(f"plainlicense: no licenses found in {args.docs_dir}", file=sys.stderr)
+        return 1
+    print(f"Exported {count} licenses to {args.output}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the `plainlicense` command."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    if args.command == "export":
+        return run_export(args)
+    return 2
@@ -0,0 +1,32 @@
+"""
+Composes license pages from segments.
+
+A license page is a tree of Blocks API blocks: tabs inside an admonition, a disclaimer inside each tab. Building that tree with nested f-strings copies every piece of text once for each level it sits in, so the license text gets copied several times over before the page is done. Here a block is a tuple of segments that point at strings we already have. Nesting a block just adds its segments to the parent, a shared fragment like the disclaimer is the same string object everywhere it appears, and the page is joined into a single string once, at the end.
+"""
+
+from collections.abc import Iterable
+
+Segments = tuple[str, ...]
+
+
+def block(
+    body: Iterable[str], kind: str, title: str, separator_count: int = 5, options: str = ""
+) -> Segments:
+    """
+    Returns the segments for a Blocks API block around `body`.
+
+    Args:
+        body (Iterable[str]): The block's content, as segments. Pass a single string as a one-item tuple.
+        kind (str): The block type, like `tab` or `admonition license`.
+        title (str): The block title.
+        separator_count (int): How many `/` characters fence the block; nested blocks need fewer than their parent.
+        options (str): Block options; any value adds the options line.
+    """
+    separator = "/" * separator_count
+    option_line = f"{' ' * (separator_count + 1)}options\n\n" if options else "\n"
+    return ("\n", separator, " ", kind, " | ", title, "\n", option_line, *body, "\n", separator)
+
+
+def join(segments: Iterable[str]) -> str:
+    """Returns the segments as one string."""
+    return "".join(segments)
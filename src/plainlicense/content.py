@@ -0,0 +1,657 @@
+# sourcery skip: avoid-global-variables, do-not-use-staticmethod
+"""
+License content processing. Everything here works on plain data (no MkDocs `Page` or `Files`), so it can run in worker processes.
+"""
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import re
+import time
+from collections import ChainMap
+from collections.abc import Iterator, Mapping, MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property
+from re import Pattern
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+import ez_yaml
+from jinja2 import TemplateError
+
+from plainlicense.compose import Segments, block, join
+from plainlicense.logs import lazy
+from plainlicense.templates import get_template_engine
+from plainlicense.transforms import LicenseVariants, transform_license_text
+from plainlicense.versions import DEFAULT_VERSION
+
+if TYPE_CHECKING:
+    from mkdocs.structure.pages import Page
+
+# a license lives at licenses/<category>/<license>/index.md
+LICENSE_CATEGORIES = ("proprietary", "public-domain", "copyleft", "permissive", "source-available")
+
+# Set PARALLEL_ASSEMBLY=true to assemble licenses in a process pool; ASSEMBLY_WORKERS caps the pool size
+PARALLEL_ASSEMBLY = os.environ.get("PARALLEL_ASSEMBLY", "false").lower() == "true"
+ASSEMBLY_WORKERS = int(os.environ.get("ASSEMBLY_WORKERS", "0")) or None
+
+# the hooks attach their handlers to the `plainlicense` logger, so build logs still show up with everything else
+assembly_logger = logging.getLogger(__name__)
+
+def clean_content(content: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Strips whitespace from string values in a dictionary, and from strings in lists.
+
+    Args:
+        content (Any): The dictionary to clean.
+
+    Returns:
+        dict[str, Any]: The cleaned dictionary with whitespace removed from string values.
+
+    Examples:
+        cleaned_content = clean_content({"title": "  Example Title  ", "tags": ["  tag1  ", "tag2 "]})
+    """
+
+    def cleaner(value: Any) -> str:
+        """Strips whitespace from a string."""
+        if isinstance(value, dict):
+            return {k: cleaner(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [cleaner(item) for item in value]
+        elif isinstance(value, str):
+            return value.strip()
+        return value
+
+    cleaned_content = {k: cleaner(v) if v else "" for k, v in content.items()}
+    assembly_logger.debug("Cleaned content: %s", lazy(cleaned_content))
+    return cleaned_content
+
+class RenderedBoilerplate(Mapping[str, Any]):
+    """
+    The boilerplate rendered against one license's metadata, one key at a time. A key renders the first time something reads it, and the result is memoized. Nested mappings come back as `RenderedBoilerplate`s of their own, so a subtree nothing reads (like `tag_text`, which the theme takes straight from the config) never renders at all.
+
+    It's read-only, and it never writes to the boilerplate or the context it renders against, so every license can share the same prepared boilerplate.
+    """
+
+    def __init__(self, boilerplate: Mapping[str, Any], context: Mapping[str, Any]) -> None:
+        self._boilerplate = boilerplate
+        self._context = context
+        self._rendered: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._rendered:
+            self._rendered[key] = self._render(self._boilerplate[key])
+        return self._rendered[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._boilerplate)
+
+    def __len__(self) -> int:
+        return len(self._boilerplate)
+
+    def _render(self, value: Any) -> Any:
+        """Renders a boilerplate value; strings are templates, and mappings stay lazy."""
+        if isinstance(value, str):
+            try:
+                return get_template_engine().render(value, self._context)
+            except (TypeError, TemplateError) as e:
+                assembly_logger.error("Error rendering boilerplate: %s", e)
+                return value
+        elif isinstance(value, Mapping):
+            return RenderedBoilerplate(value, self._context)
+        elif isinstance(value, list):
+            return [self._render(item) for item in value]
+        return value
+
+def materialize(value: Any) -> Any:
+    """Returns `value` with every mapping (including `RenderedBoilerplate`s and the `ChainMap` of page metadata) turned into a plain dict, for YAML and JSON."""
+    if isinstance(value, Mapping):
+        return {key: materialize(item) for key, item in value.items()}
+    elif isinstance(value, list):
+        return [materialize(item) for item in value]
+    return value
+
+def compile_templates(value: Any) -> None:
+    """Compiles every template string in a boilerplate value, so the first license to read a key doesn't pay for parsing it. Templates that don't compile are left for `RenderedBoilerplate` to report."""
+    if isinstance(value, str):
+        with contextlib.suppress(TemplateError):
+            get_template_engine().template(value)
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            compile_templates(item)
+    elif isinstance(value, list):
+        for item in value:
+            compile_templates(item)
+
+@dataclass
+class LicenseInputs:
+    """
+    Plain-data inputs for assembling one license page. Unlike a MkDocs `Page`, this pickles cleanly, so we can hand it to a worker process.
+
+    Attributes:
+        src_uri (str): The license's `index.md` src_uri.
+        url (str): The page URL.
+        title (str | None): The page title, as MkDocs sees it after reading the source.
+        meta (MutableMapping[str, Any]): The page frontmatter; after `prepare_license`, a `ChainMap` with the boilerplate on top.
+        markdown (str): The page markdown below the frontmatter.
+        production (bool): Whether this is a production build.
+        plain_version (str): The license's version, from the `VersionIndex`.
+    """
+
+    src_uri: str
+    url: str
+    title: str | None
+    meta: MutableMapping[str, Any]
+    markdown: str = ""
+    production: bool = True
+    plain_version: str = DEFAULT_VERSION
+
+    @classmethod
+    def from_page(
+        cls, page: "Page", *, production: bool = True, plain_version: str = DEFAULT_VERSION
+    ) -> "LicenseInputs":
+        """Creates license inputs from a page that has already read its source."""
+        return cls(
+            src_uri=page.file.src_uri,
+            url=page.url,
+            title=page.title,
+            meta=dict(page.meta),
+            markdown=page.markdown or "",
+            production=production,
+            plain_version=plain_version,
+        )
+
+
+@dataclass
+class AssembledLicense:
+    """
+    The result of assembling a license: the page metadata and markdown, plus the markdown and plaintext variants for the canary. It holds only rendered text, so a worker process sends back no more than the page needs.
+
+    Attributes:
+        src_uri (str): The license's `index.md` src_uri.
+        meta (MutableMapping[str, Any]): The assembled page metadata.
+        markdown (str): The assembled page markdown, without frontmatter.
+        markdown_license_text (str): The license text as markdown.
+        plaintext_license_text (str): The license text as plaintext.
+        seconds (float): How long assembly took. Metadata that renders lazily isn't included until something reads it.
+    """
+
+    src_uri: str
+    meta: MutableMapping[str, Any]
+    markdown: str
+    markdown_license_text: str
+    plaintext_license_text: str
+    seconds: float = 0.0
+
+    @property
+    def content(self) -> str:
+        """Returns the page content as a markdown file with YAML frontmatter."""
+        return create_page_content(self.meta, self.markdown)
+
+
+def prepare_boilerplate(boilerplate: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Returns a cleaned copy of the `extra.boilerplate` config block, with the year filled in, and compiles its templates. Call it once per build; the config block itself is never modified.
+    """
+    boilerplate = dict(boilerplate)
+    boilerplate["year"] = str(boilerplate.get("year", datetime.now(timezone.utc).strftime("%Y"))).strip()
+    boilerplate = clean_content(boilerplate)
+    compile_templates(boilerplate)
+    return boilerplate
+
+def prepare_license(inputs: LicenseInputs, boilerplate: dict[str, Any]) -> "LicenseContent":
+    """
+    Cleans a license's metadata and layers the boilerplate, rendered against it, on top. Both the MkDocs hooks and the export CLI start from here.
+
+    `inputs.meta` becomes a `ChainMap`: writes, then the boilerplate (which wins over the page's own keys, like `how`), then the cleaned page metadata. Boilerplate keys render when they're first read, against the page metadata alone.
+
+    Args:
+        inputs (LicenseInputs): The license page inputs. `inputs.meta` is replaced.
+        boilerplate (dict[str, Any]): The cleaned boilerplate from `prepare_boilerplate`.
+
+    Returns:
+        LicenseContent: The license, ready to render.
+    """
+    meta = clean_content(inputs.meta)
+    assembly_logger.debug("All data before rendering boilerplate: %s", lazy(meta))
+    inputs.meta = ChainMap({}, RenderedBoilerplate(boilerplate, meta), meta)
+    return LicenseContent(inputs)
+
+def assemble_license(inputs: LicenseInputs, boilerplate: dict[str, Any]) -> AssembledLicense:
+    """
+    Assembles a license page from plain-data inputs. This is a pure function of its arguments, so it's safe to run in a worker process.
+
+    Args:
+        inputs (LicenseInputs): The license page inputs.
+        boilerplate (dict[str, Any]): The cleaned boilerplate from `prepare_boilerplate`.
+
+    Returns:
+        AssembledLicense: The assembled page metadata and markdown, and the license's markdown and plaintext variants.
+    """
+    start = time.perf_counter()
+    license = prepare_license(inputs, boilerplate)
+    markdown = join((inputs.markdown, *license.page_segments))
+    markdown = get_template_engine().render_page(markdown, inputs.meta)
+    return AssembledLicense(
+        inputs.src_uri,
+        inputs.meta,
+        markdown,
+        license.markdown_license_text,
+        license.plaintext_license_text,
+        time.perf_counter() - start,
+    )
+
+_worker_boilerplate: dict[str, Any] = {}
+
+def _init_worker(boilerplate: dict[str, Any]) -> None:
+    """Receives the boilerplate once per worker process, instead of once per license."""
+    global _worker_boilerplate
+    _worker_boilerplate = boilerplate
+
+def _assemble_in_worker(inputs: LicenseInputs) -> AssembledLicense:
+    return assemble_license(inputs, _worker_boilerplate)
+
+def assemble_licenses(
+    inputs: list[LicenseInputs], boilerplate: dict[str, Any], *, parallel: bool = PARALLEL_ASSEMBLY
+) -> list[AssembledLicense]:
+    """
+    Assembles licenses, in a process pool if `parallel` is set and there's more than one core to use. Results are always in the same order as `inputs`.
+    """
+    workers = min(ASSEMBLY_WORKERS or os.cpu_count() or 1, len(inputs))
+    if not parallel or workers < 2:
+        return [assemble_license(item, boilerplate) for item in inputs]
+    assembly_logger.info("Assembling %s licenses with %s workers", len(inputs), workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(boilerplate,),
+    ) as executor:
+        return list(executor.map(_assemble_in_worker, inputs))
+
+def create_page_content(meta: Mapping[str, Any], markdown: str) -> str:
+    """Creates the content for a license page."""
+    frontmatter = ez_yaml.to_string(materialize(meta))
+    if not frontmatter.startswith("---"):
+        frontmatter = "---\n" + frontmatter
+    if not frontmatter.endswith("---"):
+        frontmatter += "\n---\n"
+    return f"{frontmatter}{markdown or ''}"
+
+class LicenseContent:
+    """
+    TODO: Break this class up into smaller classes
+    Represents a license's content and metadata, including the license text and associated attributes. All license text processing happens here.
+    """
+
+    _year_pattern: ClassVar[Pattern[str]] = re.compile(r"\{\{\s{1,2}year\s{1,2}\}\}")
+
+    TAG_MAP: ClassVar[dict[str, str]] = {
+        "distribution": "can-share",  # allowances
+        "commercial-use": "can-sell",
+        "modifications": "can-change",
+        "revokable": "can-revoke",
+        "relicense": "relicense",
+        "disclose-source": "share-source",  # requirements
+        "document-changes": "describe-changes",
+        "include-copyright": "give-credit",
+        "same-license": "share-alike (strict)",
+        "same-license--file": "share-alike (relaxed)",
+        "same-license--library": "share-alike (relaxed)",
+    }
+
+    ICON_MAP: ClassVar[dict[str, str]] = {
+        "reader": ":material-book-open-variant:",
+        "markdown": ":octicons-markdown-24:",
+        "plaintext": ":nounproject-txt:",
+        "embed": ":material-language-html5:",
+        "changelog": ":material-history:",
+        "official": ":material-license:",
+    }
+
+    NOT_ADVICE_TEMPLATE: ClassVar[str] = """We are not lawyers. This is not legal advice. You use this license at your own risk. If you need legal advice, talk to a lawyer.\nWe are normal people who want to make licenses accessible for everyone. We hope that our plain language helps you and anyone else (including lawyers) understand this license. If you see a mistake or want to suggest a change, please [submit an issue on GitHub]({github_issues_link} "Submit an issue on GitHub") or [submit edits to this page]({github_edit_link} "edit on GitHub").\n"""
+
+    NOT_OFFICIAL_TEMPLATE: ClassVar[str] = """Plain License is not affiliated with the original {original_name} authors or {original_organization}. **Our plain language versions are not official** and are not endorsed by the original authors. Our licenses may also include different terms or additional information. We try to capture the *legal meaning* of the original license, but we can't guarantee our license provides the same legal protections.\n\nIf you want to use the {plain_name}, you should refer to the original license text so you understand how it might be different. You can find the official {original_name} [here]({original_url} "check out the official {original_name}" ).\n"""
+
+    NOT_ADVICE_TITLE: ClassVar[str] = "This is not legal advice."
+
+    # maps `attributes` keys to the properties that produce them
+    ATTRIBUTE_SOURCES: ClassVar[dict[str, str]] = {
+        "title": "title",
+        "year": "year",
+        "reader_license_text": "reader_license_text",
+        "markdown_license_text": "markdown_license_text",
+        "plaintext_license_text": "plaintext_license_text",
+        "plain_version": "plain_version",
+        "license_type": "license_type",
+        "tags": "tags",
+        "changelog": "changelog",
+        "official_license_text": "official_license_text",
+        "has_official": "has_official",
+        "final_markdown": "license_content",
+    }
+
+    def __init__(self, inputs: LicenseInputs) -> None:
+        """
+        Initializes a new instance of the class with the provided license inputs.
+        Only the cheap metadata lookups happen here. The license text variants, version, and tags are computed the first time something asks for them, and then memoized.
+
+        Args:
+            inputs (LicenseInputs): The plain-data page inputs for the license.
+
+        Examples:
+            license_instance = LicenseContent(LicenseInputs.from_page(page))
+        """
+
+        self.page = inputs
+        self.meta = inputs.meta
+        self.license_type = self.get_license_type()
+        self.title = f"The {self.meta['plain_name']}"
+        # the boilerplate carries the build's year; fall back to the current year for inputs without it
+        self.year = str(self.meta.get("year") or datetime.now(timezone.utc).strftime("%Y")).strip()
+        self.changelog_text = self.meta.get("changelog", "## such empty, much void :nounproject-doge:")
+        self.official_license_text = self.meta.get("official_license_text", "")
+
+        self.has_official = bool(self.official_license_text)
+
+    @cached_property
+    def reader_license_text(self) -> str:
+        """Returns the reader license text with the year filled in."""
+        return self.replace_year(self.meta["reader_license_text"])
+
+    @cached_property
+    def variants(self) -> LicenseVariants:
+        """Returns the markdown and plaintext variants; both come out of the same transform pass."""
+        return transform_license_text(self.reader_license_text)
+
+    @cached_property
+    def markdown_license_text(self) -> str:
+        """Returns the license text as standard markdown."""
+        return self.variants.markdown
+
+    @cached_property
+    def plaintext_license_text(self) -> str:
+        """Returns the license text as plaintext."""
+        return self.variants.plaintext
+
+    @property
+    def plain_version(self) -> str:
+        """Returns the license's plain version."""
+        return self.page.plain_version
+
+    @cached_property
+    def tags(self) -> list[str] | None:
+        """Returns the license's mapped tags."""
+        return self.get_tags()
+
+    def get_license_type(self) -> Literal["dedication", "license"]:
+        """
+        Returns the license type based on the license metadata.
+        This might seem like overkill, but it was giving me a lot of trouble with a single check.
+        """
+        if (self.page.title and isinstance(self.page.title, str) and "domain" in self.page.title.lower()) or (self.page and "domain" in self.page.url.lower()) or (self.meta.get("category") and "domain" in self.meta["category"].lower()):
+            return "dedication"
+        return "license"
+
+
+    def replace_year(self, text: str) -> str:
+        """
+        Replaces the year placeholder in the provided text with the current year.
+
+        Args:
+            text (str): The text to process and replace the year placeholder.
+
+        Returns:
+            str: The text with the year placeholder replaced by the current year.
+        """
+        return type(self)._year_pattern.sub(self.year, text)
+
+
+    def get_tags(self) -> list[str] | None:
+        """
+        Retrieves a list of tags from the provided frontmatter data dictionary.
+
+        Args:
+            frontmatter (dict[str, Any]): A dictionary containing frontmatter data that may include tags, conditions, permissions, and limitations.
+
+        Returns:
+            list[str] | None: A list of mapped tags if found, or None if no valid tags are present.
+        """
+        possible_tags: list[list[str | None] | None] = [self.meta.get("conditions"), self.meta.get("permissions"), self.meta.get("limitations")]
+        frontmatter_tags = []
+        for taglist in possible_tags:
+            if taglist:
+                frontmatter_tags.extend(taglist)
+        if frontmatter_tags:
+            return [self.TAG_MAP[tag] for tag in frontmatter_tags if tag in self.TAG_MAP]
+        return None
+
+    @staticmethod
+    def blockify(text: str, kind: str, title: str, separator_count: int = 5, options: str = "") -> str:
+        """Returns a blocks api block with the provided text."""
+        return join(block((text,), kind, title, separator_count, options))
+
+    def interpretation_block(self, kind: str) -> str:
+        """Returns the interpretation block for the license."""
+        if not self.has_official:
+            return ""
+        if kind == "reader":
+            return self.blockify(
+                f"{self.meta.get('interpretation_text')}", "note", self.meta.get("interpretation_title", ""), 4
+            )
+        if kind == "markdown":
+            return f"""### {self.meta.get('interpretation_title')}\n\n{self.meta.get('interpretation_text')}\n\n"""
+        return f"""NOTE: {self.meta.get('interpretation_title')}\n\n{self.meta.get('interpretation_text')}\n\n"""
+
+    def get_header_block(self, kind: Literal["reader", "markdown", "plaintext"]) -> str:
+        """Returns the version block for the license."""
+        if kind == "reader":
+            title = f"\n\n# {self.meta['plain_name'].strip()}\n\n"
+            if self.meta.get("original_version"):
+                version_info = f"""<div class='version-info'><span class="original-version">original version: {self.meta.get("original_version")}</span><span class="plain-version">plain version: {self.plain_version}</span></div>\n\n"""
+            else:
+                version_info = f"""<div class='version-info'><span class="plain-version">plain version: {self.plain_version}</span></div>\n\n"""
+            return f"""<div class="license-header">{title}{version_info}</div>\n\n"""
+        if kind == "markdown":
+            title = f"\n\n# {self.meta.get('plain_name')}\n\n"
+            if self.meta.get("original_version"):
+                version_info = f"""> original version: {self.meta.get("original_version")}\n> plain version: {self.plain_version}\n\n"""
+            else:
+                version_info = f"""> plain version: {self.plain_version}\n\n"""
+            return f"""\n\n{title}{version_info}\n\n"""
+        title = f"\n\n# {self.meta.get('plain_name').upper()}\n\n"
+        if self.meta.get("original_version"):
+            version_info = f"""\n\noriginal version: {self.meta.get("original_version")} | plain version: {self.plain_version}\n\n"""
+        else:
+            version_info = f"""\n\nplain version: {self.plain_version}\n\n"""
+        return f"""\n\n{title}{version_info}\n\n"""
+
+    @property
+    def attributes(self) -> Mapping[str, Any | int | str]:
+        """
+        Retrieves a mapping of attributes related to the license.
+        This property consolidates various license-related information into a single mapping,
+        making it easier to access and manage the relevant data. Values are computed when you read them, so asking for one attribute doesn't build every tab.
+
+        Returns:
+            Mapping[str, Any | int | str]: A mapping containing attributes such as year,
+            markdown and plaintext license texts, plain version, and license type.
+        """
+        return LicenseAttributes(self)
+
+    @cached_property
+    def not_advice_text(self) -> str:
+        """Returns the not advice text for the license."""
+        return self.NOT_ADVICE_TEMPLATE.format(
+            github_issues_link=self.meta.get("github_issues_link"),
+            github_edit_link=self.meta.get("github_edit_link"),
+        )
+
+    @cached_property
+    def not_official_text(self) -> str:
+        """Returns the not official text for the license."""
+        if self.has_official:
+            return self.NOT_OFFICIAL_TEMPLATE.format(
+                original_name=self.meta["original_name"].strip(),
+                original_organization=self.meta["original_organization"].strip(),
+                plain_name=self.meta["plain_name"].strip(),
+                original_url=self.meta["original_url"].strip(),
+            )
+        return ""
+
+    @cached_property
+    def disclaimer_segments(self) -> Segments:
+        """Returns the disclaimer block's segments. Every tab that shows the disclaimer shares these."""
+        not_advice = block(
+            (self.not_advice_text,),
+            "tab" if self.has_official else "warning",
+            self.NOT_ADVICE_TITLE,
+            3,
+            options="open: True",
+        )
+        if not self.has_official:
+            return not_advice
+        not_official_title = f"This is not the official {self.meta.get("original_name")}"
+        not_official = block((self.not_official_text,), "tab", not_official_title, 3, options="open: True")
+        return block((*not_advice, "\n", *not_official, "\n"), "details", "disclaimer", 4, "open:True")
+
+    @cached_property
+    def disclaimer_block(self) -> str:
+        """Returns the disclaimer block for the license."""
+        return join(self.disclaimer_segments)
+
+    def document_segments(self, kind: Literal["markdown", "plaintext"], text: str) -> Segments:
+        """Returns the segments of a standalone license: the header, the license text, and the interpretation, which starts a new paragraph."""
+        if interpretation := self.interpretation_block(kind):
+            return (self.get_header_block(kind), text, "\n\n", interpretation)
+        return (self.get_header_block(kind), text)
+
+    @cached_property
+    def markdown_document_segments(self) -> Segments:
+        """Returns the segments of the standalone markdown license."""
+        return self.document_segments("markdown", self.markdown_license_text)
+
+    @cached_property
+    def plaintext_document_segments(self) -> Segments:
+        """Returns the segments of the standalone plaintext license."""
+        return self.document_segments("plaintext", self.plaintext_license_text)
+
+    @cached_property
+    def markdown_document(self) -> str:
+        """Returns the standalone markdown license: header, license text, and interpretation."""
+        return join(self.markdown_document_segments)
+
+    @cached_property
+    def plaintext_document(self) -> str:
+        """Returns the standalone plaintext license: header, license text, and interpretation."""
+        return join(self.plaintext_document_segments)
+
+    @cached_property
+    def reader_segments(self) -> Segments:
+        """Returns the reader tab's segments."""
+        body = (self.get_header_block("reader"), self.reader_license_text, self.interpretation_block("reader"), *self.disclaimer_segments)
+        return block(body, "tab", f"reader {self.ICON_MAP['reader']}")
+
+    @cached_property
+    def markdown_segments(self) -> Segments:
+        """Returns the markdown tab's segments."""
+        body = ("\n```markdown ", *self.markdown_document_segments, "\n```\n\n", *self.disclaimer_segments)
+        return block(body, "tab", f"markdown {self.ICON_MAP['markdown']}")
+
+    @cached_property
+    def plaintext_segments(self) -> Segments:
+        """Returns the plaintext tab's segments."""
+        body = ("```plaintext\n\n", *self.plaintext_document_segments, "```\n\n", *self.disclaimer_segments)
+        return block(body, "tab", f"plaintext {self.ICON_MAP['plaintext']}")
+
+    @cached_property
+    def changelog_segments(self) -> Segments:
+        """Returns the changelog tab's segments."""
+        return block((self.changelog_text,), "tab", f"changelog {self.ICON_MAP['changelog']}")
+
+    @cached_property
+    def official_segments(self) -> Segments:
+        """Returns the official tab's segments, or nothing if there's no official text."""
+        if not self.has_official:
+            return ()
+        body = (self.official_license_text, "\n") if self.meta.get("link_in_original") else (self.official_license_text, "\n\n", f"{self.meta.get("official_link")}", "\n")
+        return block(body, "tab", f"official {self.ICON_MAP['official']}")
+
+    @cached_property
+    def reader(self) -> str:
+        """Returns the reader block for the license."""
+        return join(self.reader_segments)
+
+    @cached_property
+    def markdown(self) -> str:
+        """Returns the markdown block for the license."""
+        return join(self.markdown_segments)
+
+    @cached_property
+    def plaintext(self) -> str:
+        """Returns the plaintext block for the license."""
+        return join(self.plaintext_segments)
+
+    @cached_property
+    def changelog(self) -> str:
+        """Returns the changelog block for the license."""
+        return join(self.changelog_segments)
+
+    @cached_property
+    def official(self) -> str:
+        """Returns the official block for the license."""
+        return join(self.official_segments)
+
+    @cached_property
+    def embed_link(self) -> str:
+        """Returns the embed link for the license."""
+        return f"""<iframe
+    src="https://plainlicense.org/embed/{self.meta['spdx_id']}.html"
+    style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: 1px solid #E4C580; border-radius: 8px; overflow: hidden auto;"
+    title=f"{self.title}"
+    loading="lazy"
+    sandbox="allow-scripts"
+    onload="if(this.contentDocument.body.scrollHeight > 400) this.style.height = this.contentDocument.body.scrollHeight + 'px';"
+    referrerpolicy="no-referrer-when-downgrade">
+    <p>Your browser does not support iframes. View {self.title} at:
+      <a href="{self.page.url}">plainlicense.org</a>
+    </p>
+  </iframe>"""
+
+    @cached_property
+    def embed(self) -> str:
+        """Returns the embed block for the license."""
+        return self.blockify(self.embed_link, "tab", f"html {self.ICON_MAP['embed']}")
+
+    @cached_property
+    def page_segments(self) -> Segments:
+        """Returns the segments of the license page content: every tab inside the license admonition, then the outro."""
+        outro = f"{self.meta.get("outro", "")}"
+        tabs = (*self.reader_segments, *self.markdown_segments, *self.plaintext_segments, *self.changelog_segments, *self.official_segments)
+        title = f"Plain License\\: <span class='detail-title-highlight'>The {self.meta.get('plain_name')}</span>\n"
+        return (*block((*tabs, outro, "\n"), "admonition license", title, 6, options="open:True"), "\n\n", outro)
+
+    @cached_property
+    def license_content(self) -> str:
+        """Returns the content for a license page"""
+        return join(self.page_segments)
+
+
+class LicenseAttributes(Mapping[str, Any]):
+    """A read-only view of a license's attributes that computes each one only when it's read."""
+
+    def __init__(self, license: LicenseContent) -> None:
+        self._license = license
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in LicenseContent.ATTRIBUTE_SOURCES:
+            raise KeyError(key)
+        return getattr(self._license, LicenseContent.ATTRIBUTE_SOURCES[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(LicenseContent.ATTRIBUTE_SOURCES)
+
+    def __len__(self) -> int:
+        return len(LicenseContent.ATTRIBUTE_SOURCES)
@@ -0,0 +1,42 @@
+"""
+Finds the licenses under a docs directory and reads their frontmatter. The export, the build's license manifest, and the benchmarks all start here.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from plainlicense.content import LICENSE_CATEGORIES
+from plainlicense.locales import is_locale
+
+# the same frontmatter split MkDocs uses
+_FRONTMATTER_DELIMITER = "---"
+
+
+def split_frontmatter(source: str) -> tuple[dict[str, Any], str]:
+    """Splits a markdown source into its YAML frontmatter and its body."""
+    lines = source.splitlines(keepends=True)
+    if not lines or lines[0].strip() != _FRONTMATTER_DELIMITER:
+        return {}, source
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() in (_FRONTMATTER_DELIMITER, "..."):
+            meta = yaml.safe_load("".join(lines[1:index])) or {}
+            return (meta if isinstance(meta, dict) else {}), "".join(lines[index + 1 :])
+    return {}, source
+
+
+def discover_licenses(docs_dir: Path) -> Iterator[Path]:
+    """
+    Yields each license's `index.md` (`licenses/<category>/<license>/index.md`), then its translations, in a stable order. Translations can sit next to the original (`index.fr.md`) or in a locale's own tree (`fr/licenses/...`).
+    """
+    for category in LICENSE_CATEGORIES:
+        yield from sorted((docs_dir / "licenses" / category).glob("*/index.md"))
+    for category in LICENSE_CATEGORIES:
+        yield from sorted(
+            path for path in (docs_dir / "licenses" / category).glob("*/index.*.md") if is_locale(path.suffixes[0][1:])
+        )
+    for locale_dir in sorted(path for path in docs_dir.iterdir() if path.is_dir() and is_locale(path.name)):
+        for category in LICENSE_CATEGORIES:
+            yield from sorted((locale_dir / "licenses" / category).glob("*/index.md"))
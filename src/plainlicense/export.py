@@ -0,0 +1,167 @@
+"""
+Exports every license's markdown, plaintext, embed HTML, and metadata without running a MkDocs build.
+
+The export reads the same sources the site build does (each license's `index.md` and `CHANGELOG.md`, and the boilerplate in `mkdocs.yml`), and runs them through the same `plainlicense.content` code the assembly hook uses, so the exported text matches the site. Licenses are assembled in a process pool and each one is written out as soon as its worker finishes.
+
+Translations (see `plainlicense.locales`) go in the same pool as everything else, so exporting more languages keeps every core busy instead of adding a pass per language. They're written under `<output>/<locale>/`.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from plainlicense.content import LicenseInputs, prepare_boilerplate, prepare_license
+from plainlicense.discovery import discover_licenses, split_frontmatter
+from plainlicense.locales import localized_name, split_locale
+from plainlicense.templates import get_template_engine
+from plainlicense.versions import VersionIndex
+
+EMPTY_CHANGELOG = "## such empty, much void :nounproject-doge:"
+
+export_logger = logging.getLogger(__name__)
+
+
+class _ConfigLoader(yaml.SafeLoader):
+    """A safe YAML loader that ignores the tags `mkdocs.yml` uses for python names and environment variables."""
+
+
+_ConfigLoader.add_multi_constructor("!", lambda loader, suffix, node: None)
+_ConfigLoader.add_multi_constructor("tag:yaml.org,2002:python/", lambda loader, suffix, node: None)
+
+
+@dataclass
+class ExportedLicense:
+    """
+    The files written for one license.
+
+    Attributes:
+        src_uri (str): The license's `index.md` src_uri, relative to the docs directory.
+        slug (str): The license's directory name under the export root (or under its locale's directory).
+        files (list[Path]): The files written for the license.
+        locale (str | None): The translation's locale, or None for the untranslated license.
+    """
+
+    src_uri: str
+    slug: str
+    files: list[Path]
+    locale: str | None = None
+
+
+def load_boilerplate(config_path: Path) -> dict[str, Any]:
+    """Returns the `extra.boilerplate` block from a MkDocs config file."""
+    config = yaml.load(config_path.read_text(encoding="utf-8"), Loader=_ConfigLoader) or {}
+    return (config.get("extra") or {}).get("boilerplate") or {}
+
+
+def read_license(path: Path, docs_dir: Path, versions: VersionIndex, *, production: bool = True) -> LicenseInputs:
+    """
+    Reads a license's sources into the same plain-data inputs the assembly hook builds from a MkDocs page.
+
+    Args:
+        path (Path): The license's `index.md`.
+        docs_dir (Path): The docs directory.
+        versions (VersionIndex): The license versions.
+        production (bool): Whether to treat this as a production build.
+    """
+    meta, markdown = split_frontmatter(path.read_text(encoding="utf-8"))
+    src_uri = path.relative_to(docs_dir).as_posix()
+    locale, base_uri = split_locale(src_uri)
+    changelog = next(
+        (changelog for name in (localized_name("CHANGELOG.md", locale), "CHANGELOG.md") if (changelog := path.with_name(name)).is_file()),
+        None,
+    )
+    meta["changelog"] = (changelog.read_text(encoding="utf-8") if changelog else "") or EMPTY_CHANGELOG
+    # mkdocs-static-i18n builds each translation under its locale's directory
+    url = base_uri.removesuffix("index.md")
+    return LicenseInputs(
+        src_uri=src_uri,
+        url=f"{locale}/{url}" if locale else url,
+        # MkDocs falls back to the directory name for an untitled index page
+        title=meta.get("title") or path.parent.name,
+        meta=meta,
+        markdown=markdown,
+        production=production,
+        plain_version=versions.version(base_uri, production=production),
+    )
+
+
+def render_artifacts(inputs: LicenseInputs, boilerplate: dict[str, Any]) -> dict[str, str]:
+    """Returns each exported file's name and content for one license."""
+    license = prepare_license(inputs, boilerplate)
+    engine = get_template_engine()
+    meta = inputs.meta
+    metadata = {
+        "spdx_id": meta.get("spdx_id"),
+        "plain_name": meta.get("plain_name"),
+        "original_name": meta.get("original_name"),
+        "original_url": meta.get("original_url"),
+        "original_version": meta.get("original_version") or None,
+        "plain_version": license.plain_version,
+        "category": meta.get("category"),
+        "license_type": license.license_type,
+        "tags": license.tags or [],
+        "has_official": license.has_official,
+        "description": meta.get("description"),
+        "url": inputs.url,
+    }
+    return {
+        "LICENSE.md": f"{engine.render_page(license.markdown_document, meta).strip()}\n",
+        "LICENSE.txt": f"{engine.render_page(license.plaintext_document, meta).strip()}\n",
+        "embed.html": f"{engine.render_page(license.embed_link, meta).strip()}\n",
+        "license.json": f"{json.dumps(metadata, indent=2, default=str)}\n",
+    }
+
+
+def export_license(inputs: LicenseInputs, boilerplate: dict[str, Any], output_dir: Path) -> ExportedLicense:
+    """Assembles one license and writes its files under `output_dir/<license>/` (or `output_dir/<locale>/<license>/` for a translation)."""
+    slug = Path(inputs.src_uri).parent.name
+    locale = split_locale(inputs.src_uri)[0]
+    license_dir = output_dir / locale / slug if locale else output_dir / slug
+    license_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for name, content in render_artifacts(inputs, boilerplate).items():
+        path = license_dir / name
+        path.write_text(content, encoding="utf-8")
+        files.append(path)
+    return ExportedLicense(inputs.src_uri, slug, files, locale)
+
+
+def export_licenses(
+    docs_dir: Path,
+    config_path: Path,
+    output_dir: Path,
+    *,
+    workers: int | None = None,
+    production: bool = True,
+) -> Iterator[ExportedLicense]:
+    """
+    Exports every license, yielding each one as it finishes. Completion order isn't stable when `workers` is more than one.
+
+    Args:
+        docs_dir (Path): The docs directory.
+        config_path (Path): The MkDocs config that holds the boilerplate.
+        output_dir (Path): Where to write the exported licenses.
+        workers (int | None): The process pool size; defaults to the CPU count. Use 1 to export in this process.
+        production (bool): Whether to treat this as a production build.
+    """
+    boilerplate = prepare_boilerplate(load_boilerplate(config_path))
+    versions = VersionIndex(docs_dir)
+    licenses = [read_license(path, docs_dir, versions, production=production) for path in discover_licenses(docs_dir)]
+    export_logger.info("Exporting %s licenses to %s", len(licenses), output_dir)
+    workers = min(workers or os.cpu_count() or 1, len(licenses) or 1)
+    if workers == 1:
+        for inputs in licenses:
+            yield export_license(inputs, boilerplate, output_dir)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(export_license, inputs, boilerplate, output_dir) for inputs in licenses]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,49 @@
+"""
+Locale handling for translated license pages.
+
+mkdocs-static-i18n supports two layouts for translations, and we follow both:
+
+- suffix: a translation sits next to the original, as `licenses/<category>/<license>/index.<locale>.md`.
+- folder: every language has its own tree, as `<locale>/licenses/<category>/<license>/index.md`.
+
+`split_locale` takes either form apart into the locale and the src_uri the page would have untranslated. Categories and versions key off the untranslated src_uri, so a translation shares its original's category and `package.json`.
+"""
+
+import re
+from pathlib import PurePosixPath
+
+# the locale codes mkdocs-static-i18n accepts: `fr`, `pt-BR`, `zh-Hant`, `zh-Hant-TW`, `en_US`
+LOCALE_PATTERN = re.compile(r"^(?:[a-z]{2}(?:-[A-Za-z]{4})?(?:-[A-Z]{2})?|[a-z]{2}_[A-Z]{2})$")
+
+
+def is_locale(value: str) -> bool:
+    """Returns True if `value` looks like a locale code."""
+    return bool(LOCALE_PATTERN.match(value))
+
+
+def split_locale(src_uri: str) -> tuple[str | None, str]:
+    """
+    Returns the locale of a src_uri and the src_uri without it. The locale is None for untranslated files.
+
+    Examples:
+        split_locale("licenses/permissive/mit/index.fr.md")  # ("fr", "licenses/permissive/mit/index.md")
+        split_locale("fr/licenses/permissive/mit/index.md")  # ("fr", "licenses/permissive/mit/index.md")
+        split_locale("licenses/permissive/mit/index.md")  # (None, "licenses/permissive/mit/index.md")
+    """
+    parent, _, name = src_uri.rpartition("/")
+    stem, dot, suffix = name.rpartition(".")
+    base, _, locale = stem.rpartition(".")
+    if base and is_locale(locale):
+        return locale, f"{parent}/{base}{dot}{suffix}" if parent else f"{base}{dot}{suffix}"
+    first, _, rest = src_uri.partition("/")
+    if rest and is_locale(first):
+        return first, rest
+    return None, src_uri
+
+
+def localized_name(name: str, locale: str | None) -> str:
+    """Returns a file name with the locale suffix mkdocs-static-i18n's suffix layout uses, like `CHANGELOG.fr.md`."""
+    if not locale:
+        return name
+    path = PurePosixPath(name)
+    return f"{path.stem}.{locale}{path.suffix}"
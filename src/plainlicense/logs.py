@@ -0,0 +1,57 @@
+"""
+Logs big values (page metadata, rendered markdown, the boilerplate) without paying for them when nobody reads them.
+
+Wrap the value in `lazy` and pass it as a `%s` argument:
+
+    logger.debug("Page meta: %s", lazy(page.meta))
+
+If the logger's level is off, the record is never made and the value is never turned into text. If it's on, the text is capped at `limit` characters. Strings are cut. Containers go through `reprlib`, which stops early, so a huge dict costs about as much as the cap instead of its whole repr. Mappings that aren't dicts (like the `ChainMap` over the lazily rendered boilerplate) only show their keys, because reading their values could render templates.
+"""
+
+import reprlib
+from collections.abc import Mapping
+from typing import Any
+
+# the most characters a lazy value turns into
+PAYLOAD_LIMIT = 2000
+
+
+def _repr(limit: int) -> reprlib.Repr:
+    return reprlib.Repr(
+        maxlevel=3, maxdict=25, maxlist=25, maxtuple=25, maxset=25, maxfrozenset=25, maxstring=limit, maxother=limit, maxlong=80
+    )
+
+
+class LazyRepr:
+    """
+    A value that turns into capped text only when a log record is formatted.
+
+    Attributes:
+        value (Any): The value to log.
+        limit (int): The most characters it turns into.
+    """
+
+    __slots__ = ("limit", "value")
+
+    def __init__(self, value: Any, limit: int = PAYLOAD_LIMIT) -> None:
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        value = self.value
+        if isinstance(value, str):
+            text = value
+        elif isinstance(value, Mapping) and not isinstance(value, dict):
+            text = f"{type(value).__name__}(keys={_repr(self.limit).repr(list(value))})"
+        else:
+            text = _repr(self.limit).repr(value)
+        if len(text) > self.limit:
+            return f"{text[: self.limit]}... ({len(text) - self.limit:,} more characters)"
+        return text
+
+    __repr__ = __str__
+
+
+def lazy(value: Any, limit: int = PAYLOAD_LIMIT) -> LazyRepr:
+    """Returns a log argument that turns into at most `limit` characters of `value`, and only if the record is emitted."""
+    return LazyRepr(value, limit)
@@ -0,0 +1,140 @@
+"""
+A manifest of the licenses under a docs directory: each license's slug (its directory name), category, source files, and SPDX ID.
+
+The hooks ask "is this a license page?" and "what category is this license?" for every page. Rather than globbing the docs directory for each answer, we build the manifest once and look things up in a dict or a frozenset. Refreshing it only stats the license directories (and their parents) and the license `index.md` files; their frontmatter is only parsed when the manifest rescans. Adding or removing a license or a translation changes a directory's mtime, and editing a license's frontmatter changes its `index.md`'s mtime, so the manifest only rescans when one of those changes.
+"""
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from plainlicense.content import LICENSE_CATEGORIES
+from plainlicense.discovery import discover_licenses, split_frontmatter
+from plainlicense.locales import is_locale, split_locale
+
+manifest_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class LicenseEntry:
+    """
+    One license in the manifest.
+
+    Attributes:
+        slug (str): The license's directory name, like `mit`.
+        category (str): The license's category, like `permissive`.
+        paths (tuple[str, ...]): The src_uris of the license's `index.md` and its translations, the original first.
+        spdx_id (str | None): The `spdx_id` from the license's frontmatter, if it has one.
+    """
+
+    slug: str
+    category: str
+    paths: tuple[str, ...]
+    spdx_id: str | None
+
+
+def read_spdx_id(path: Path) -> str | None:
+    """Returns the `spdx_id` from a license's frontmatter, if it has one."""
+    try:
+        meta, _ = split_frontmatter(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        manifest_logger.warning("Couldn't read an SPDX ID from %s: %s", path, e)
+        return None
+    spdx_id = meta.get("spdx_id")
+    return str(spdx_id).strip() if spdx_id else None
+
+
+class LicenseManifest:
+    """
+    The licenses under a docs directory.
+
+    Attributes:
+        docs_dir (Path): The docs directory the manifest covers.
+        entries (dict[str, LicenseEntry]): Every license, keyed by slug.
+        by_uri (dict[str, LicenseEntry]): Every license, keyed by the src_uri of its `index.md` and of each translation.
+        slugs (frozenset[str]): Every license slug.
+        scans (int): How many times the manifest has scanned the docs directory, across refreshes.
+    """
+
+    def __init__(self, docs_dir: Path | str) -> None:
+        self.docs_dir = Path(docs_dir)
+        self.scans = 0
+        self.entries: dict[str, LicenseEntry] = {}
+        self.by_uri: dict[str, LicenseEntry] = {}
+        self.slugs: frozenset[str] = frozenset()
+        self._watched: list[Path] = []
+        self._stamp: list[int | None] = []
+        self.refresh()
+
+    def _roots(self) -> Iterator[Path]:
+        """Yields the `licenses` directory of the default language and of each locale's tree."""
+        yield self.docs_dir / "licenses"
+        for path in sorted(self.docs_dir.iterdir()):
+            if path.is_dir() and is_locale(path.name):
+                yield path / "licenses"
+
+    def _stamps(self, paths: list[Path]) -> list[int | None]:
+        stamps: list[int | None] = []
+        for path in paths:
+            try:
+                stamps.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return stamps
+
+    def refresh(self) -> bool:
+        """Rescans the docs directory if anything the manifest watches changed. Returns True if it rescanned."""
+        if self._watched and self._stamps(self._watched) == self._stamp:
+            return False
+        sources: dict[str, list[Path]] = {}
+        for path in discover_licenses(self.docs_dir):
+            sources.setdefault(split_locale(path.relative_to(self.docs_dir).as_posix())[1], []).append(path)
+        entries: dict[str, LicenseEntry] = {}
+        watched = [self.docs_dir]
+        for root in self._roots():
+            watched += [root, *(root / category for category in LICENSE_CATEGORIES)]
+        for src_uri, paths in sources.items():
+            _, category, slug, _ = src_uri.split("/")
+            if slug in entries:
+                manifest_logger.warning("Two licenses are called %s; keeping the one in %s", slug, entries[slug].category)
+                continue
+            uris = tuple(path.relative_to(self.docs_dir).as_posix() for path in paths)
+            entries[slug] = LicenseEntry(slug, category, uris, read_spdx_id(paths[0]))
+            watched += [path for source in paths for path in (source.parent, source)]
+        self.entries = entries
+        self.by_uri = {uri: entry for entry in entries.values() for uri in entry.paths}
+        self.slugs = frozenset(entries)
+        self._watched = list(dict.fromkeys(watched))
+        self._stamp = self._stamps(self._watched)
+        self.scans += 1
+        manifest_logger.debug("License manifest has %s licenses (%s scans so far)", len(entries), self.scans)
+        return True
+
+    def get(self, src_uri: str) -> LicenseEntry | None:
+        """Returns the license whose `index.md` (or a translation of it) is at `src_uri`, if there is one."""
+        return self.by_uri.get(src_uri)
+
+    def category(self, src_uri: str) -> str | None:
+        """Returns the category of the license at `src_uri`, or None if it isn't a license."""
+        entry = self.by_uri.get(src_uri)
+        return entry.category if entry else None
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self.slugs
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+_manifests: dict[Path, LicenseManifest] = {}
+
+
+def get_license_manifest(docs_dir: Path | str) -> LicenseManifest:
+    """Returns the process-wide license manifest for a docs directory, refreshed against the filesystem."""
+    docs_dir = Path(docs_dir).resolve()
+    if (manifest := _manifests.get(docs_dir)) is None:
+        manifest = _manifests[docs_dir] = LicenseManifest(docs_dir)
+    else:
+        manifest.refresh()
+    return manifest
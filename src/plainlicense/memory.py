@@ -0,0 +1,310 @@
+"""
+Works out which hooks and plugins the build's memory goes to.
+
+`hook_logger` turns this on with `MEMORY_PROFILE` (see there). `MemoryProfiler` then measures:
+
+- per hook: with `tracemalloc`, how much memory each call allocated and kept (retained) and how high it went while it ran (peak);
+- per phase: the process's resident set size (RSS) after each MkDocs event;
+- at the end of the build: which allocation sites the memory still held was allocated at, attributed to the hook or plugin whose code was running at the time; how much the hooks' module-level state holds (like `LicenseBuildCanary.pages` or `PageMetaStore._meta`); and how many instances of our classes (like `LicenseContent`) are still alive;
+- across builds: what grew since the last build in the same process. With `mkdocs serve`, that's a leak check across rebuilds.
+
+Measuring each call only reads tracemalloc's counters. Attributing allocation sites takes one snapshot per build, so it needs `MEMORY_FRAMES` frames of each allocation's traceback to find the hook in it. Tracing that deep is slow: a build takes about thirty times as long (minutes, not seconds), so this is a profiling mode, not something to leave on.
+"""
+
+import gc
+import linecache
+import os
+import sys
+import tracemalloc
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+# how many frames of each allocation's traceback tracemalloc keeps
+MEMORY_FRAMES = int(os.environ.get("MEMORY_FRAMES", "12"))
+# how many entries each part of the report lists
+MEMORY_TOP = int(os.environ.get("MEMORY_TOP", "10"))
+# how much the traced memory can grow from one build to the next before the leak check warns
+MEMORY_LEAK_BYTES = int(os.environ.get("MEMORY_LEAK_BYTES", str(4 * 1024 * 1024)))
+
+# tracemalloc's own allocations, which aren't the build's
+_IGNORED = frozenset({tracemalloc.__file__, linecache.__file__, "<unknown>"})
+# things `deep_size` doesn't count or look inside: code, not data
+_OPAQUE = (ModuleType, type, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def rss_bytes() -> int | None:
+    """Returns the process's resident set size, where the OS tells us (Linux's /proc)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def format_bytes(size: float) -> str:
+    """Returns a byte count as a short, human-readable string, like `1.5 MiB`."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:,.1f} {unit}" if unit != "B" else f"{size:,.0f} B"
+        size /= 1024
+    return f"{size:,.1f} GiB"
+
+
+def _referents(obj: Any) -> Iterator[Any]:
+    if isinstance(obj, Mapping):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+    if hasattr(obj, "__dict__") and not isinstance(obj, _OPAQUE):
+        yield vars(obj)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            yield getattr(obj, slot)
+
+
+def deep_size(obj: Any, seen: set[int] | None = None, max_depth: int = 8) -> int:
+    """
+    Returns roughly how much memory an object holds: its own size, and the size of what it refers to (dict items, sequence items, attributes), down to `max_depth` levels. Code (modules, classes, functions) isn't counted.
+
+    Args:
+        obj (Any): The object.
+        seen (set[int] | None): The ids of objects already counted; pass the same set to several calls so shared objects count once.
+        max_depth (int): How many levels of references to follow.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [(obj, 0)]
+    while stack:
+        current, depth = stack.pop()
+        if id(current) in seen or isinstance(current, _OPAQUE):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current, 0)
+        if depth < max_depth:
+            stack.extend((referent, depth + 1) for referent in _referents(current))
+    return size
+
+
+@dataclass(slots=True)
+class HookMemory:
+    """
+    What one hook's calls did to the traced memory.
+
+    Attributes:
+        calls (int): How many times it ran.
+        retained (int): How much more memory was allocated after its calls than before them, summed over its calls.
+        peak (int): The most memory it used at once above where it started, over its calls.
+    """
+
+    calls: int = 0
+    retained: int = 0
+    peak: int = 0
+
+
+class MemoryProfiler:
+    """
+    Collects memory measurements for a build, and keeps the last build's snapshot for the leak check.
+
+    Attributes:
+        hooks (dict[str, HookMemory]): Each hook's measurements, keyed by name (like `license_assembly on_files`).
+        rss (dict[str, int]): The highest RSS seen after each phase.
+        builds (int): How many builds have finished in this process.
+    """
+
+    def __init__(self, frames: int = MEMORY_FRAMES, top: int = MEMORY_TOP) -> None:
+        self.frames = frames
+        self.top = top
+        self.hooks: dict[str, HookMemory] = {}
+        self.rss: dict[str, int] = {}
+        self.builds = 0
+        self._open: list[list[int]] = []
+        self._previous: tracemalloc.Snapshot | None = None
+        self._previous_rss: int | None = None
+
+    def start(self) -> None:
+        """Starts tracing allocations (if nothing else has), and clears the last build's measurements."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.hooks.clear()
+        self.rss.clear()
+        self._open.clear()
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Measures the memory the `with` block allocates and keeps, and its peak, for a hook. Measurements can nest, as when a hook runs a whole nested build."""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        if self._open:
+            self._open[-1][1] = max(self._open[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._open.append([current, current])
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            start, seen = self._open.pop()
+            highest = max(seen, peak)
+            if self._open:
+                self._open[-1][1] = max(self._open[-1][1], highest)
+            tracemalloc.reset_peak()
+            stats = self.hooks.setdefault(name, HookMemory())
+            stats.calls += 1
+            stats.retained += current - start
+            stats.peak = max(stats.peak, highest - start)
+
+    def sample_rss(self, phase: str) -> None:
+        """Records the RSS after a phase."""
+        if (rss := rss_bytes()) is not None:
+            self.rss[phase] = max(self.rss.get(phase, 0), rss)
+
+    def finish(self, owners: Mapping[str, str], modules: Iterable[ModuleType], classes: Iterable[type]) -> tuple[str, list[str]]:
+        """
+        Ends a build: reports where its memory went, and compares it with the last build in this process.
+
+        Args:
+            owners (Mapping[str, str]): The hooks' and plugins' source paths (files or package directories), mapped to their names, for attributing allocation sites.
+            modules (Iterable[ModuleType]): The modules whose module-level state to size.
+            classes (Iterable[type]): The classes whose live instances to count.
+
+        Returns:
+            tuple[str, list[str]]: The report, and the leak check's warnings.
+        """
+        self.builds += 1
+        snapshot = tracemalloc.take_snapshot()
+        modules = list(modules)
+        sections = [
+            self._hook_report(),
+            self._rss_report(),
+            self._site_report(snapshot, owners),
+            self._state_report(modules),
+            self._instance_report(classes),
+        ]
+        warnings = self._leak_check(snapshot)
+        self._previous, self._previous_rss = snapshot, rss_bytes()
+        return "\n\n".join(section for section in sections if section), warnings
+
+    def _hook_report(self) -> str:
+        ranked = sorted(self.hooks.items(), key=lambda item: item[1].retained, reverse=True)[: self.top]
+        lines = [f"Memory retained by hook (top {self.top}):"]
+        lines += [
+            f"  {name}: {format_bytes(stats.retained)} retained, {format_bytes(stats.peak)} peak over {stats.calls:,} calls"
+            for name, stats in ranked
+        ]
+        return "\n".join(lines) if ranked else ""
+
+    def _rss_report(self) -> str:
+        if not self.rss:
+            return ""
+        lines = ["Highest RSS after each phase:"]
+        lines += [f"  {phase}: {format_bytes(rss)}" for phase, rss in sorted(self.rss.items(), key=lambda item: item[1], reverse=True)]
+        return "\n".join(lines)
+
+    def _site_report(self, snapshot: tracemalloc.Snapshot, owners: Mapping[str, str]) -> str:
+        """
+        Groups the memory still held by the hook or plugin that was running when it was allocated (the innermost one in the traceback), then by allocation site.
+
+        A build holds a few hundred thousand traces, and tracemalloc builds a Python object for each frame we look at, so we let `statistics` merge the traces with the same traceback first.
+        """
+        paths = sorted(owners, key=len, reverse=True)
+        owner_of: dict[str, str | None] = {}
+        by_owner: dict[str, dict[str, int]] = {}
+        for statistic in snapshot.statistics("traceback"):
+            frames = list(statistic.traceback)
+            if frames[-1].filename in _IGNORED:
+                continue
+            owner = None
+            for frame in reversed(frames):
+                if frame.filename not in owner_of:
+                    owner_of[frame.filename] = next((owners[path] for path in paths if frame.filename.startswith(path)), None)
+                if (owner := owner_of[frame.filename]) is not None:
+                    break
+            site = f"{frames[-1].filename}:{frames[-1].lineno}"
+            sites = by_owner.setdefault(owner or "(no hook or plugin)", {})
+            sites[site] = sites.get(site, 0) + statistic.size
+        totals = sorted(((sum(sites.values()), owner) for owner, sites in by_owner.items()), reverse=True)
+        lines = [f"Memory still held, by the hook or plugin that allocated it ({format_bytes(sum(total for total, _ in totals))} traced):"]
+        for total, owner in totals[: self.top]:
+            lines.append(f"  {owner}: {format_bytes(total)}")
+            top_sites = sorted(by_owner[owner].items(), key=lambda item: item[1], reverse=True)[:3]
+            lines += [f"    {format_bytes(size)} at {site}" for site, size in top_sites]
+        return "\n".join(lines)
+
+    def _state_report(self, modules: Iterable[ModuleType]) -> str:
+        """Sizes the data the modules hold at module level, including the instances their classes keep (like a singleton), attribute by attribute. Instances of other modules' classes (like loggers) aren't ours to size."""
+        sizes: list[tuple[int, str]] = []
+        seen: set[int] = set()
+        names = {module.__name__ for module in modules}
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if name.startswith("__"):
+                    continue
+                if isinstance(value, type) and value.__module__ == module.__name__:
+                    for attr, held in list(vars(value).items()):
+                        if isinstance(held, value):
+                            sizes += self._attribute_sizes(held, seen)
+                elif not isinstance(value, _OPAQUE) and hasattr(value, "__dict__") and type(value).__module__ in names:
+                    sizes += self._attribute_sizes(value, seen)
+                elif isinstance(value, (dict, list, set, tuple)) and value:
+                    sizes.append((deep_size(value, seen), f"{module.__name__}.{name}"))
+        ranked = sorted((entry for entry in sizes if entry[0]), reverse=True)[: self.top]
+        lines = ["Memory held by module-level state:"]
+        lines += [f"  {name}: {format_bytes(size)}" for size, name in ranked]
+        return "\n".join(lines) if ranked else ""
+
+    def _attribute_sizes(self, obj: Any, seen: set[int]) -> list[tuple[int, str]]:
+        if id(obj) in seen:
+            return []
+        seen.add(id(obj))
+        name = type(obj).__qualname__
+        return [(deep_size(value, seen), f"{name}.{attr}") for attr, value in list(vars(obj).items())]
+
+    def _instance_report(self, classes: Iterable[type]) -> str:
+        """Counts the live instances of the classes, and sizes them (objects they share are counted once per class)."""
+        wanted = {cls for cls in classes}
+        found: dict[type, list[Any]] = {}
+        for obj in gc.get_objects():
+            if type(obj) in wanted:
+                found.setdefault(type(obj), []).append(obj)
+        sizes = []
+        for cls, instances in found.items():
+            seen: set[int] = set()
+            sizes.append((sum(deep_size(obj, seen) for obj in instances), len(instances), cls.__qualname__))
+        ranked = sorted(sizes, reverse=True)[: self.top]
+        lines = ["Live instances:"]
+        lines += [f"  {name}: {count:,} alive, {format_bytes(size)}" for size, count, name in ranked]
+        return "\n".join(lines) if ranked else ""
+
+    def _leak_check(self, snapshot: tracemalloc.Snapshot) -> list[str]:
+        """Compares this build's snapshot with the last build's, and warns if the traced memory grew by more than MEMORY_LEAK_BYTES."""
+        if self._previous is None:
+            return []
+        differences = [
+            difference
+            for difference in snapshot.compare_to(self._previous, "lineno")
+            if difference.traceback[-1].filename not in _IGNORED
+        ]
+        growth = sum(difference.size_diff for difference in differences)
+        if growth <= MEMORY_LEAK_BYTES:
+            return []
+        rss, previous_rss = rss_bytes(), self._previous_rss
+        rss_growth = f", RSS {format_bytes(rss - previous_rss)}" if rss is not None and previous_rss is not None else ""
+        warnings = [f"Traced memory grew by {format_bytes(growth)} since the last build{rss_growth} (build {self.builds} in this process); the sites that grew most:"]
+        warnings += [
+            f"  +{format_bytes(difference.size_diff)} ({difference.count_diff:+,} blocks) at {difference.traceback[-1].filename}:{difference.traceback[-1].lineno}"
+            for difference in differences[: self.top]
+            if difference.size_diff > 0
+        ]
+        return warnings
+
+
+def source_root(filename: str) -> str:
+    """Returns the path that a plugin's or hook's code lives under, given the file its event method is in: the file itself for a hook, or the package directory for an installed plugin."""
+    path = Path(filename).resolve()
+    return str(path.parent) if "site-packages" in path.parts else str(path)
@@ -0,0 +1,91 @@
+"""
+Classifies the site's pages once per build, so the hooks don't each work out what kind of page they're looking at.
+
+`license_assembly.on_files` registers every file's src_uri with the license manifest's src_uris (see `plainlicense.manifest`). After that, any hook can ask what kind a page is, or whether it's a license page, with a dict lookup, instead of splitting URLs or matching regexes on every page event.
+
+Translations (`index.fr.md`, `fr/...`) are the same kind as their originals.
+"""
+
+from collections.abc import Container, Iterable
+from enum import StrEnum
+
+from plainlicense.content import LICENSE_CATEGORIES
+from plainlicense.locales import split_locale
+
+# the top-level sections whose pages are standalone articles
+SECTIONS = ("about", "faq", "helping")
+
+
+class PageKind(StrEnum):
+    """What a page is, as far as the hooks care."""
+
+    LICENSE = "license"
+    CATEGORY_INDEX = "category_index"
+    BLOG_POST = "blog_post"
+    SECTION = "section"
+    OTHER = "other"
+
+
+# the kinds of page that get social media share buttons; not blog posts, whose buttons would show up in every excerpt on the blog's listing pages
+SHAREABLE_KINDS = frozenset({PageKind.SECTION})
+
+
+def classify(src_uri: str, license_uris: Container[str] = ()) -> PageKind:
+    """
+    Returns the kind of page at a src_uri.
+
+    Args:
+        src_uri (str): The page's src_uri.
+        license_uris (Container[str]): The src_uris of the license pages, from the license manifest.
+    """
+    if src_uri in license_uris:
+        return PageKind.LICENSE
+    parts = split_locale(src_uri)[1].split("/")
+    match parts:
+        case ["licenses", "index.md"]:
+            return PageKind.CATEGORY_INDEX
+        case ["licenses", category, "index.md"] if category in LICENSE_CATEGORIES:
+            return PageKind.CATEGORY_INDEX
+        case ["blog", "posts", *_, name] if name.endswith(".md"):
+            return PageKind.BLOG_POST
+        case [section, *_, name] if section in SECTIONS and name.endswith(".md"):
+            return PageKind.SECTION
+    return PageKind.OTHER
+
+
+class PageRegistry:
+    """The kind of every page in the current build, keyed by src_uri."""
+
+    def __init__(self) -> None:
+        self._kinds: dict[str, PageKind] = {}
+        self._license_uris: Container[str] = ()
+
+    def register(self, src_uris: Iterable[str], license_uris: Container[str] = ()) -> None:
+        """Classifies a build's pages, replacing the last build's."""
+        self._license_uris = license_uris
+        self._kinds = {src_uri: classify(src_uri, license_uris) for src_uri in src_uris}
+
+    def kind(self, src_uri: str) -> PageKind:
+        """Returns the kind of page at a src_uri. Pages added after registration (like the blog plugin's archive pages) are classified on first use."""
+        if (kind := self._kinds.get(src_uri)) is None:
+            kind = self._kinds[src_uri] = classify(src_uri, self._license_uris)
+        return kind
+
+    def is_license(self, src_uri: str) -> bool:
+        """Returns True if the page at a src_uri is a license page."""
+        return self.kind(src_uri) is PageKind.LICENSE
+
+    def is_shareable(self, src_uri: str) -> bool:
+        """Returns True if the page at a src_uri gets share buttons: the pages in the about, FAQ, and helping sections, other than their index pages."""
+        return self.kind(src_uri) in SHAREABLE_KINDS and not split_locale(src_uri)[1].endswith("index.md")
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+
+_registry = PageRegistry()
+
+
+def get_page_registry() -> PageRegistry:
+    """Returns the process-wide page registry."""
+    return _registry
@@ -0,0 +1,252 @@
+"""
+Hand-written scanners for the license markdown constructs that regular expressions handle badly.
+
+Backtracking regexes for links, HTML tags, and autolinks go quadratic on lines full of unclosed openers (`[[[[`, `<a <a <a`), because every opener rescans to the end of the line. The scanners here walk the text left to right. When a scan fails at a newline or at the end of the text, they remember where it stopped, so any later opener before that point fails straight away instead of scanning again. That keeps every function linear in the length of its input, however the text is formatted.
+
+Each scanner matches exactly what the pattern in its docstring matches.
+"""
+
+from collections.abc import Callable
+
+_HEADING_LEVELS = "123456"
+_ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_TAG_NAME_CHARS = _ASCII_LETTERS | frozenset("0123456789-")
+_AUTOLINK_SCHEMES = ("https:", "http:", "mailto:")
+
+
+def parse_attr_list(line: str) -> list[str] | None:
+    """
+    Returns the tokens of a standalone attribute list line (`{ .annotate }`, `{: #id .class }`), or None if the line isn't one.
+
+    Matches `^\\{:?\\s*([.#][^{}]*)\\}$` against the stripped line; the tokens are group 1, split on whitespace.
+    """
+    line = line.strip()
+    if len(line) < 3 or line[0] != "{" or line[-1] != "}":
+        return None
+    inner = line[1:-1]
+    if inner.startswith(":"):
+        inner = inner[1:]
+    inner = inner.lstrip()
+    if not inner or inner[0] not in ".#" or "{" in inner or "}" in inner:
+        return None
+    return inner.split()
+
+
+def parse_definition(line: str) -> str | None:
+    """Returns the text of a definition line (`:   definition`), stripped, or None if the line isn't one. Matches `^:\\s{1,4}(.*)$`."""
+    if len(line) < 2 or line[0] != ":" or not line[1].isspace():
+        return None
+    return line[1:].strip()
+
+
+def parse_heading(line: str) -> tuple[int, str] | None:
+    """
+    Returns the level and text of an ATX heading line (`## Heading ##`), or None if the line isn't one.
+
+    Matches `^(#{1,6})\\s+(.*?)\\s*#*\\s*$`.
+    """
+    level = len(line) - len(line.lstrip("#"))
+    if not 1 <= level <= 6 or level == len(line) or not line[level].isspace():
+        return None
+    return level, line[level:].strip().rstrip("#").rstrip()
+
+
+def parse_html_heading(line: str) -> tuple[int, str] | None:
+    """
+    Returns the level and inner HTML of a one-line HTML heading (`<h2 class="x">Heading</h2>`), or None if the line isn't one.
+
+    Matches `^<h([1-6])[^>]*>(.*?)</h\\1>\\s*$` against the stripped line.
+    """
+    line = line.strip()
+    if len(line) < 9 or not line.startswith("<h") or line[2] not in _HEADING_LEVELS:
+        return None
+    opening_end = line.find(">", 3)
+    closing = f"</h{line[2]}>"
+    if opening_end == -1 or not line.endswith(closing) or len(line) - len(closing) < opening_end + 1:
+        return None
+    return int(line[2]), line[opening_end + 1 : len(line) - len(closing)]
+
+
+def replace_citations(text: str, replace: Callable[[int, str], str]) -> str:
+    """
+    Replaces each annotation marker, `(1)` through `(999)`, with `replace(number, marker)`.
+
+    Matches `\\((\\d{1,3})\\)`.
+    """
+    out: list[str] = []
+    last = 0
+    i = text.find("(")
+    while i != -1:
+        j = i + 1
+        while j < len(text) and j - i <= 3 and text[j].isdecimal():
+            j += 1
+        if j > i + 1 and j < len(text) and text[j] == ")":
+            marker = text[i : j + 1]
+            out.extend((text[last:i], replace(int(text[i + 1 : j]), marker)))
+            last = j + 1
+            i = text.find("(", last)
+        else:
+            i = text.find("(", i + 1)
+    out.append(text[last:])
+    return "".join(out)
+
+
+def strip_attr_lists(text: str) -> str:
+    """
+    Removes inline attribute lists (`{ .class }`, `{: #id }`) and one whitespace character before each.
+
+    Matches `\\s?\\{:?\\s*[.#][^{}\\n]*\\}`.
+    """
+    out: list[str] = []
+    last = 0
+    n = len(text)
+    i = text.find("{")
+    while i != -1:
+        j = i + 1
+        if j < n and text[j] == ":":
+            j += 1
+        while j < n and text[j].isspace():
+            j += 1
+        if j < n and text[j] in ".#":
+            k = j + 1
+            while k < n and text[k] not in "{}\n":
+                k += 1
+            if k < n and text[k] == "}":
+                start = i - 1 if i > last and text[i - 1].isspace() else i
+                out.append(text[last:start])
+                last = k + 1
+                i = text.find("{", last)
+                continue
+        i = text.find("{", i + 1)
+    out.append(text[last:])
+    return "".join(out)
+
+
+def replace_inline_links(text: str, *, images: bool) -> str:
+    """
+    Replaces inline links `[text](target "title")` (or, with `images`, images `![alt](target)`) with `text (target)`.
+
+    Matches `\\[([^\\]\\n]*)\\]\\(([^)\\s]*)[^)\\n]*\\)`, with a leading `!` for images.
+    """
+    opener = "![" if images else "["
+    out: list[str] = []
+    last = 0
+    n = len(text)
+    # a failed `(...)` scan means there's no `)` before this index, so any scan starting before it fails too
+    no_close_before = -1
+    i = text.find(opener)
+    while i != -1:
+        bracket = i + len(opener) - 1
+        close = bracket + 1
+        while close < n and text[close] not in "]\n":
+            close += 1
+        if close == n or text[close] == "\n":
+            # every opener before the newline runs into it the same way
+            i = text.find(opener, close)
+            continue
+        if close + 1 < n and text[close + 1] == "(" and close + 2 >= no_close_before:
+            target_end = close + 2
+            while target_end < n and text[target_end] != ")" and not text[target_end].isspace():
+                target_end += 1
+            end = target_end
+            while end < n and text[end] not in ")\n":
+                end += 1
+            if end < n and text[end] == ")":
+                out.extend((text[last:i], text[bracket + 1 : close], " (", text[close + 2 : target_end], ")"))
+                last = end + 1
+                i = text.find(opener, last)
+                continue
+            no_close_before = end
+        # an opener before `close` would find the same `]` and fail the same way
+        i = text.find(opener, close + 1)
+    out.append(text[last:])
+    return "".join(out)
+
+
+def replace_reference_links(text: str) -> str:
+    """Replaces reference links `[text][ref]` with `text`. Matches `\\[([^\\]\\n]*)\\]\\[[^\\]\\n]*\\]`."""
+    out: list[str] = []
+    last = 0
+    n = len(text)
+    i = text.find("[")
+    while i != -1:
+        close = i + 1
+        while close < n and text[close] not in "]\n":
+            close += 1
+        if close == n or text[close] == "\n":
+            i = text.find("[", close)
+            continue
+        if close + 1 < n and text[close + 1] == "[":
+            end = close + 2
+            while end < n and text[end] not in "]\n":
+                end += 1
+            if end < n and text[end] == "]":
+                out.extend((text[last:i], text[i + 1 : close]))
+                last = end + 1
+                i = text.find("[", last)
+                continue
+        # the `[` after `close` starts its own scan over the same stretch, then skips past it
+        i = text.find("[", close + 1)
+    out.append(text[last:])
+    return "".join(out)
+
+
+def strip_html_tags(text: str) -> str:
+    """Removes HTML tags (`<a href="...">`, `</p>`, `<br/>`). Matches `</?[a-zA-Z][a-zA-Z0-9-]*(?:\\s[^>\\n]*)?/?>`."""
+    out: list[str] = []
+    last = 0
+    n = len(text)
+    i = text.find("<")
+    while i != -1:
+        j = i + 1
+        if j < n and text[j] == "/":
+            j += 1
+        if j < n and text[j] in _ASCII_LETTERS:
+            j += 1
+            while j < n and text[j] in _TAG_NAME_CHARS:
+                j += 1
+            end = -1
+            if j < n and text[j] == ">":
+                end = j
+            elif j + 1 < n and text[j] == "/" and text[j + 1] == ">":
+                end = j + 1
+            elif j < n and text[j].isspace():
+                end = j + 1
+                while end < n and text[end] not in ">\n":
+                    end += 1
+                if end == n or text[end] == "\n":
+                    # no `>` before the newline, so no tag can start before it either
+                    i = text.find("<", end)
+                    continue
+            if end != -1:
+                out.append(text[last:i])
+                last = end + 1
+                i = text.find("<", last)
+                continue
+        i = text.find("<", i + 1)
+    out.append(text[last:])
+    return "".join(out)
+
+
+def unwrap_autolinks(text: str) -> str:
+    """Replaces autolinks `<https://example.com>` with the bare URL. Matches `<((?:https?|mailto):[^>\\s]*)>`."""
+    out: list[str] = []
+    last = 0
+    n = len(text)
+    i = text.find("<")
+    while i != -1:
+        if scheme := next((scheme for scheme in _AUTOLINK_SCHEMES if text.startswith(scheme, i + 1)), None):
+            end = i + 1 + len(scheme)
+            while end < n and text[end] != ">" and not text[end].isspace():
+                end += 1
+            if end < n and text[end] == ">":
+                out.extend((text[last:i], text[i + 1 : end]))
+                last = end + 1
+                i = text.find("<", last)
+                continue
+            # an autolink starting before `end` would stop at the same whitespace (or the end of the text)
+            i = text.find("<", end)
+            continue
+        i = text.find("<", i + 1)
+    out.append(text[last:])
+    return "".join(out)
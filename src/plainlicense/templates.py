@@ -0,0 +1,162 @@
+"""
+A shared Jinja environment for rendering license boilerplate and license pages.
+
+Creating a new `jinja2.Template` compiles the source every time. The boilerplate strings are the same for every license, so we compile each distinct source once per process and keep it in an LRU keyed by a hash of the source. Compiled bytecode also goes to a `FileSystemBytecodeCache`, so later builds (and `mkdocs serve` restarts) can skip compiling entirely.
+
+Whole license pages and documents are templates too, but each one is different and changes with every edit, so writing their bytecode would only fill the bytecode directory with files nothing reads again. `render_page` compiles those in memory and keeps them in the same LRU, but never writes their bytecode.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, Template, TemplateNotFound
+from jinja2.bccache import Bucket
+
+TEMPLATE_CACHE_SIZE = 512
+TEMPLATE_BYTECODE_DIR = Path(".cache/plugin/jinja_bytecode")
+
+engine_logger = logging.getLogger(__name__)
+
+
+def source_key(source: str) -> str:
+    """Returns the key we use to identify a template source."""
+    return hashlib.sha1(source.encode(), usedforsecurity=False).hexdigest()
+
+
+class SourceLoader(BaseLoader):
+    """
+    Loads templates from sources registered by their hash. Going through a loader (instead of `Environment.from_string`) is what lets Jinja use the bytecode cache.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str] = {}
+
+    def register(self, source: str) -> str:
+        """Registers a template source and returns its name."""
+        key = source_key(source)
+        self.sources[key] = source
+        return key
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool] | None]:
+        """Returns the registered source. Sources are content-addressed, so they're always up to date."""
+        if template not in self.sources:
+            raise TemplateNotFound(template)
+        return self.sources[template], None, lambda: True
+
+
+class CountingBytecodeCache(FileSystemBytecodeCache):
+    """A `FileSystemBytecodeCache` that counts how often it had bytecode ready for us."""
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory))
+        self.hits = 0
+        self.misses = 0
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Loads bytecode for the bucket and counts the result."""
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+
+class TemplateEngine:
+    """
+    Compiles and renders template sources, compiling each distinct source at most once per process.
+
+    Attributes:
+        hits (int): Renders that reused a compiled template from the LRU.
+        misses (int): Renders that needed to load the template (from bytecode or by compiling).
+    """
+
+    def __init__(
+        self,
+        cache_size: int = TEMPLATE_CACHE_SIZE,
+        bytecode_dir: Path | None = TEMPLATE_BYTECODE_DIR,
+    ) -> None:
+        self.cache_size = cache_size
+        self.loader = SourceLoader()
+        self.bytecode_cache = CountingBytecodeCache(bytecode_dir) if bytecode_dir else None
+        # we keep our own LRU so we can count it; Jinja's internal cache would just double up
+        self.env = Environment(
+            loader=self.loader, cache_size=0, bytecode_cache=self.bytecode_cache
+        )
+        self._templates: OrderedDict[str, Template] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def template(self, source: str, *, bytecode: bool = True) -> Template:
+        """
+        Returns the compiled template for a source.
+
+        Args:
+            source (str): The template source.
+            bytecode (bool): Whether to load and save its bytecode in the bytecode cache; one-off sources, like whole pages, shouldn't.
+
+        Raises:
+            TemplateError: If the source isn't a valid template.
+        """
+        key = source_key(source)
+        if (template := self._templates.get(key)) is not None:
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+        self.misses += 1
+        if bytecode:
+            self.loader.register(source)
+            template = self.env.get_template(key)
+            self.loader.sources.pop(key, None)
+        else:
+            template = self.env.from_string(source)
+        self._templates[key] = template
+        if len(self._templates) > self.cache_size:
+            self._templates.popitem(last=False)
+        return template
+
+    def render(self, source: str, context: Mapping[str, Any]) -> str:
+        """
+        Renders a template source with a context.
+
+        Raises:
+            TemplateError: If the source isn't a valid template or fails to render.
+        """
+        return self.template(source).render(**context)
+
+    def render_page(self, source: str, context: Mapping[str, Any]) -> str:
+        """
+        Renders a one-off template source, like a license's whole page. It's compiled once and kept in the LRU like any other, but its bytecode isn't written to disk.
+
+        Raises:
+            TemplateError: If the source isn't a valid template or fails to render.
+        """
+        return self.template(source, bytecode=False).render(**context)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns the compiled-template and bytecode hit/miss counters."""
+        stats = {"hits": self.hits, "misses": self.misses, "size": len(self._templates)}
+        if self.bytecode_cache:
+            stats |= {
+                "bytecode_hits": self.bytecode_cache.hits,
+                "bytecode_misses": self.bytecode_cache.misses,
+            }
+        return stats
+
+
+_engine: TemplateEngine | None = None
+
+
+def get_template_engine() -> TemplateEngine:
+    """Returns the process-wide template engine."""
+    global _engine
+    if _engine is None:
+        _engine = TemplateEngine()
+    return _engine
@@ -0,0 +1,130 @@
+"""
+Records how long the build spends where, as spans, and writes them as a Chrome trace.
+
+A span is a named stretch of time with a category (like `phase` or `hook`) and a few tags. Spans that run inside another span nest under it in the trace viewer. `hook_logger` opens a span for each MkDocs event and for each plugin or hook that handles it; see its `HOOK_TRACE` setting.
+
+Open the trace in `chrome://tracing`, https://ui.perfetto.dev, or https://www.speedscope.app (which reads Chrome traces as-is). Each span records wall time and the CPU time of the thread that ran it; work done in other processes (like parallel assembly) only shows up as wall time.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class Span:
+    """
+    A stretch of time the build spent on one thing.
+
+    Attributes:
+        name (str): What the span covers, like `on_files` or `license_assembly on_files`.
+        category (str): The kind of span, like `phase` or `hook`.
+        start (float): When the span started, in seconds since the tracer started.
+        wall (float): How long the span took, in seconds.
+        cpu (float | None): How much CPU time the thread spent in the span, in seconds, if it was measured.
+        tags (dict[str, Any]): Anything else worth knowing, like the page's src_uri.
+    """
+
+    name: str
+    category: str
+    start: float
+    wall: float
+    cpu: float | None = None
+    tags: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """
+    Collects spans for one build.
+
+    Attributes:
+        spans (list[Span]): The finished spans, in the order they finished.
+        depth (int): How many spans are open right now.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.depth = 0
+        self._origin = time.perf_counter()
+
+    def reset(self) -> None:
+        """Drops every span and restarts the clock, for a new build."""
+        self.spans.clear()
+        self.depth = 0
+        self._origin = time.perf_counter()
+
+    def now(self) -> float:
+        """Returns the seconds since the tracer started."""
+        return time.perf_counter() - self._origin
+
+    @contextmanager
+    def span(self, name: str, category: str, **tags: Any) -> Iterator[dict[str, Any]]:
+        """
+        Records the time spent in the `with` block as a span. Yields the span's tags, so the block can add to them.
+
+        Args:
+            name (str): What the span covers.
+            category (str): The kind of span.
+            **tags: Anything else worth knowing; tags that are None are dropped.
+        """
+        tags = {key: value for key, value in tags.items() if value is not None}
+        start, cpu = self.now(), time.thread_time()
+        self.depth += 1
+        try:
+            yield tags
+        finally:
+            self.depth -= 1
+            self.spans.append(Span(name, category, start, self.now() - start, time.thread_time() - cpu, tags))
+
+    def add(self, name: str, category: str, start: float, end: float, **tags: Any) -> None:
+        """Records a span that started and ended at the given times (from `now`), for time between two events that no code of ours runs in."""
+        tags = {key: value for key, value in tags.items() if value is not None}
+        self.spans.append(Span(name, category, start, end - start, None, tags))
+
+    def trace_events(self) -> dict[str, Any]:
+        """Returns the spans in the Chrome trace event format, as complete (`X`) events in microseconds."""
+        pid, tid = os.getpid(), threading.get_ident()
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": "mkdocs build"}},
+        ]
+        for span in sorted(self.spans, key=lambda span: (span.start, -span.wall)):
+            event = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(span.start * 1e6, 1),
+                "dur": round(span.wall * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": span.tags,
+            }
+            if span.cpu is not None:
+                event["tdur"] = round(span.cpu * 1e6, 1)
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path | str) -> Path:
+        """Writes the trace to a JSON file, and returns its path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.trace_events(), default=str), encoding="utf-8")
+        return path
+
+    def summary(self, category: str, top: int = 10) -> str:
+        """Returns the spans of one category that took the most time in total, one per line, with their counts and their wall and CPU time."""
+        totals: dict[str, list[float]] = {}
+        for span in self.spans:
+            if span.category == category:
+                count, wall, cpu = totals.setdefault(span.name, [0, 0.0, 0.0])
+                totals[span.name] = [count + 1, wall + span.wall, cpu + (span.cpu or 0.0)]
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        return "\n".join(
+            f"{name}: {wall * 1000:,.1f} ms wall, {cpu * 1000:,.1f} ms CPU over {count:,} calls"
+            for name, (count, wall, cpu) in ranked
+        )
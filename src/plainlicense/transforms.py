@@ -0,0 +1,266 @@
+"""
+Transforms a license's reader text (MkDocs-flavored markdown) into its markdown and plaintext variants.
+
+We tokenize the reader text once into a flat list of blocks (headings, paragraphs, lists, definitions, code fences), resolve Material-style annotations into footnotes, and then render both variants from the same blocks in a single pass. Headings, definitions, attribute lists, annotation markers, links, and HTML go through the hand-written scanners in `plainlicense.scanner`; the few regexes left are anchored or can't backtrack across a line, so the work grows linearly with the size of the license, however badly it's formatted.
+"""
+
+import re
+from dataclasses import dataclass, field
+from re import Pattern
+from typing import Literal
+
+from plainlicense.scanner import (
+    parse_attr_list,
+    parse_definition,
+    parse_heading,
+    parse_html_heading,
+    replace_citations,
+    replace_inline_links,
+    replace_reference_links,
+    strip_attr_lists,
+    strip_html_tags,
+    unwrap_autolinks,
+)
+
+BlockKind = Literal["heading", "paragraph", "list", "definition", "fence", "annotations"]
+
+# the remaining patterns are anchored to the start of a line, or can only fail at the next delimiter
+_fence_pattern: Pattern[str] = re.compile(r"^\s*(`{3,}|~{3,})")
+_list_item_pattern: Pattern[str] = re.compile(r"^\s{0,3}(?:[-*+]|\d{1,9}[.)])\s+(.*)$")
+_emphasis_pattern: Pattern[str] = re.compile(r"(\*\*|\*|`)([^\n]+?)\1")
+_footnote_ref_pattern: Pattern[str] = re.compile(r"\[\^(\d+)\]")
+
+
+@dataclass(slots=True)
+class Block:
+    """
+    A block-level element of the license text.
+
+    Attributes:
+        kind (BlockKind): What kind of block this is.
+        lines (list[str]): The block's source lines (for a definition, the definition's lines).
+        level (int): The heading level, for headings.
+        term (str): The defined term, for definitions.
+        annotated (bool): Whether the block carries a `{ .annotate }` attribute list.
+    """
+
+    kind: BlockKind
+    lines: list[str] = field(default_factory=list)
+    level: int = 0
+    term: str = ""
+    annotated: bool = False
+
+    @property
+    def text(self) -> str:
+        """Returns the block's lines as one string."""
+        return "\n".join(self.lines)
+
+
+@dataclass(slots=True, frozen=True)
+class LicenseVariants:
+    """The markdown and plaintext variants of a license's text."""
+
+    markdown: str
+    plaintext: str
+
+
+def _starts_block(line: str) -> bool:
+    """Returns True if the line can't continue a paragraph."""
+    stripped = line.strip()
+    return bool(
+        _fence_pattern.match(line)
+        or parse_heading(line)
+        or parse_html_heading(stripped)
+        or parse_attr_list(stripped) is not None
+        or parse_definition(line) is not None
+    )
+
+
+def tokenize(text: str) -> list[Block]:
+    """
+    Splits license text into blocks. Each line is looked at once.
+
+    Args:
+        text (str): The reader license text.
+
+    Returns:
+        list[Block]: The blocks, in document order.
+    """
+    lines = text.split("\n")
+    blocks: list[Block] = []
+    i, count = 0, len(lines)
+    while i < count:
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped:
+            i += 1
+            continue
+        if fence := _fence_pattern.match(line):
+            marker = fence.group(1)
+            block = Block("fence", [line])
+            i += 1
+            while i < count:
+                block.lines.append(lines[i])
+                i += 1
+                if lines[i - 1].strip().startswith(marker):
+                    break
+            blocks.append(block)
+            continue
+        if heading := parse_html_heading(stripped):
+            level, inner = heading
+            blocks.append(Block("heading", [inner.strip()], level=level))
+            i += 1
+            continue
+        if heading := parse_heading(line):
+            level, inner = heading
+            blocks.append(Block("heading", [inner], level=level))
+            i += 1
+            continue
+        if (attrs := parse_attr_list(stripped)) is not None:
+            # a standalone attribute list applies to the block right before it
+            if blocks and ".annotate" in attrs:
+                blocks[-1].annotated = True
+            i += 1
+            continue
+        if (definition := parse_definition(line)) is not None and blocks and blocks[-1].kind == "paragraph":
+            block = blocks[-1]
+            block.kind, block.term, block.lines = "definition", block.text, [definition]
+            i += 1
+            while i < count and lines[i].strip() and not _starts_block(lines[i]):
+                block.lines.append(lines[i].strip())
+                i += 1
+            continue
+        if _list_item_pattern.match(line):
+            block = Block("list", [line])
+            i += 1
+            while i < count:
+                if lines[i].strip():
+                    if _starts_block(lines[i]):
+                        break
+                    block.lines.append(lines[i])
+                    i += 1
+                    continue
+                # a blank line only continues the list if another item or an indented line follows
+                j = i
+                while j < count and not lines[j].strip():
+                    j += 1
+                if j < count and (_list_item_pattern.match(lines[j]) or lines[j].startswith("    ")):
+                    block.lines.extend(lines[i:j])
+                    i = j
+                    continue
+                break
+            blocks.append(block)
+            continue
+        block = Block("paragraph", [line])
+        i += 1
+        while i < count and lines[i].strip() and not _starts_block(lines[i]):
+            block.lines.append(lines[i])
+            i += 1
+        blocks.append(block)
+    return blocks
+
+
+def list_items(block: Block) -> list[str]:
+    """Returns the text of each item in a list block, with continuation lines folded in."""
+    items: list[str] = []
+    for line in block.lines:
+        if item := _list_item_pattern.match(line):
+            items.append(item.group(1).strip())
+        elif line.strip() and items:
+            items[-1] = f"{items[-1]} {line.strip()}"
+    return items
+
+
+def resolve_annotations(blocks: list[Block]) -> list[str]:
+    """
+    Turns Material annotations into footnotes, in place.
+
+    An annotated block's markers, `(1)`, `(2)`, ..., point at the items of the list that follows it, in order. We rewrite each marker as a footnote reference, mark the list as consumed, and return the footnote texts.
+
+    Returns:
+        list[str]: The footnote texts; footnote `n` is at index `n - 1`.
+    """
+    footnotes: list[str] = []
+    for index, block in enumerate(blocks):
+        if not block.annotated or index + 1 >= len(blocks) or blocks[index + 1].kind != "list":
+            continue
+        annotation_list = blocks[index + 1]
+        items = list_items(annotation_list)
+        offset = len(footnotes)
+
+        def to_footnote(number: int, marker: str, items: list[str] = items, offset: int = offset) -> str:
+            return f"[^{offset + number}]" if 0 < number <= len(items) else marker
+
+        block.lines = [replace_citations(line, to_footnote) for line in block.lines]
+        annotation_list.kind = "annotations"
+        footnotes.extend(items)
+    return footnotes
+
+
+def strip_inline(text: str) -> str:
+    """Strips inline markdown formatting from text, leaving link targets in parentheses."""
+    text = strip_attr_lists(text)
+    text = replace_inline_links(text, images=True)
+    text = replace_inline_links(text, images=False)
+    text = replace_reference_links(text)
+    text = _emphasis_pattern.sub(r"\2", text)
+    text = unwrap_autolinks(text)
+    text = strip_html_tags(text)
+    return _footnote_ref_pattern.sub(r"[\1]", text)
+
+
+def render(blocks: list[Block], footnotes: list[str]) -> LicenseVariants:
+    """
+    Renders the markdown and plaintext variants from the same blocks in one pass.
+
+    Args:
+        blocks (list[Block]): The tokenized, annotation-resolved blocks.
+        footnotes (list[str]): The footnote texts from `resolve_annotations`.
+
+    Returns:
+        LicenseVariants: The markdown and plaintext license text.
+    """
+    markdown: list[str] = []
+    plaintext: list[str] = []
+    for block in blocks:
+        match block.kind:
+            case "annotations":
+                continue
+            case "heading":
+                markdown.append(f"{'#' * block.level} {block.text}")
+                plaintext.append(strip_inline(block.text))
+            case "definition":
+                definition = " ".join(block.lines)
+                markdown.append(f"{block.term}\n: {strip_attr_lists(definition)}")
+                plaintext.append(f"{strip_inline(block.term)}\n- {strip_inline(definition)}")
+            case "fence":
+                closed = len(block.lines) > 1 and _fence_pattern.match(block.lines[-1])
+                body = block.lines[1:-1] if closed else block.lines[1:]
+                markdown.append(block.text)
+                plaintext.append("\n".join(["===", *body, "==="]))
+            case _:
+                markdown.append(strip_attr_lists(block.text))
+                plaintext.append("\n".join(strip_inline(line) for line in block.lines))
+    if footnotes:
+        markdown.append("\n".join(f"[^{n}]: {note}" for n, note in enumerate(footnotes, 1)))
+        plaintext.append("\n".join(f"[{n}]: {strip_inline(note)}" for n, note in enumerate(footnotes, 1)))
+    return LicenseVariants("\n\n".join(markdown), "\n\n".join(plaintext))
+
+
+def transform_license_text(text: str) -> LicenseVariants:
+    """
+    Parses reader license text once and returns its markdown and plaintext variants.
+
+    Args:
+        text (str): The reader license text, with the year already filled in.
+
+    Returns:
+        LicenseVariants: The markdown and plaintext license text.
+
+    Examples:
+        variants = transform_license_text(reader_text)
+        variants.markdown, variants.plaintext
+    """
+    blocks = tokenize(text)
+    footnotes = resolve_annotations(blocks)
+    return render(blocks, footnotes)
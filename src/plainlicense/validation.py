@@ -0,0 +1,182 @@
+"""
+Checks the structure of built license pages. This runs after the build, on the HTML files in `site/`, so it sees what a reader's browser sees. Every page gets these checks:
+
+- tabs: the license tabs (reader, markdown, plaintext, changelog, and official if the license has an official text) all have labels.
+- structure: block elements (`div`, `details`, `section`, and the like) open and close in order, and every `details` has a `summary`. A broken admonition or details block shows up here.
+- footnotes: every footnote link (`#fn:1`, `#fnref:1`) points at an element on the page.
+- templates: no Jinja expressions or statements are left.
+
+Each page is parsed on its own, so `validate_pages` spreads them over a process pool.
+"""
+
+import multiprocessing
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+
+from plainlicense.leaks import TEMPLATE_SCANNER
+
+# Set VALIDATION_WORKERS to cap the validation pool size; it defaults to the CPU count
+VALIDATION_WORKERS = int(os.environ.get("VALIDATION_WORKERS", "0")) or None
+
+LICENSE_TABS = ("reader", "markdown", "plaintext", "changelog")
+OFFICIAL_TAB = "official"
+# elements that have to close explicitly; the others (`p`, `li`, void elements) can close implicitly, so they don't count
+STRUCTURAL_TAGS = frozenset({"article", "blockquote", "details", "div", "nav", "ol", "pre", "section", "summary", "table", "ul"})
+FOOTNOTE_PREFIXES = ("#fn:", "#fnref:")
+
+
+def expected_tabs(has_official: bool) -> tuple[str, ...]:
+    """Returns the tabs a license page should have."""
+    return (*LICENSE_TABS, OFFICIAL_TAB) if has_official else LICENSE_TABS
+
+
+@dataclass(frozen=True, slots=True)
+class PageCheck:
+    """
+    A built license page to validate.
+
+    Attributes:
+        url (str): The page URL.
+        path (str): The page's HTML file.
+        tabs (tuple[str, ...]): The tabs the page should have.
+    """
+
+    url: str
+    path: str
+    tabs: tuple[str, ...] = LICENSE_TABS
+
+
+@dataclass(slots=True)
+class PageReport:
+    """
+    What validation found on one page.
+
+    Attributes:
+        url (str): The page URL.
+        tabs (list[str]): The tab labels found on the page, in order.
+        problems (list[str]): Everything wrong with the page; empty if it passed.
+    """
+
+    url: str
+    tabs: list[str] = field(default_factory=list)
+    problems: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _OpenElement:
+    tag: str
+    line: int
+    classes: list[str]
+    has_summary: bool = False
+
+
+class _PageParser(HTMLParser):
+    """Walks a page's HTML once, tracking open block elements, tab labels, ids, and footnote links."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.problems: list[str] = []
+        self.stack: list[_OpenElement] = []
+        self.ids: set[str] = set()
+        self.footnote_links: list[tuple[str, int]] = []
+        self.tab_labels: list[str] = []
+        self._label: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        if element_id := attributes.get("id"):
+            self.ids.add(element_id)
+        if (href := attributes.get("href")) and href.startswith(FOOTNOTE_PREFIXES):
+            self.footnote_links.append((href, self.getpos()[0]))
+        if tag == "label" and self.stack and "tabbed-labels" in self.stack[-1].classes:
+            self._label = []
+        if tag == "summary" and self.stack and self.stack[-1].tag == "details":
+            self.stack[-1].has_summary = True
+        if tag in STRUCTURAL_TAGS:
+            self.stack.append(_OpenElement(tag, self.getpos()[0], (attributes.get("class") or "").split()))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "label" and self._label is not None:
+            words = "".join(self._label).split()
+            self.tab_labels.append(words[0] if words else "")
+            self._label = None
+        if tag not in STRUCTURAL_TAGS:
+            return
+        line = self.getpos()[0]
+        if not any(element.tag == tag for element in self.stack):
+            self.problems.append(f"line {line}: </{tag}> closes nothing")
+            return
+        while (element := self.stack.pop()).tag != tag:
+            self.problems.append(f"line {element.line}: <{element.tag}> is never closed (its parent closes at line {line})")
+        self._check_closed(element)
+
+    def handle_data(self, data: str) -> None:
+        if self._label is not None:
+            self._label.append(data)
+
+    def close(self) -> None:
+        super().close()
+        for element in reversed(self.stack):
+            self.problems.append(f"line {element.line}: <{element.tag}> is never closed")
+        self.stack.clear()
+
+    def _check_closed(self, element: _OpenElement) -> None:
+        if element.tag == "details" and not element.has_summary:
+            self.problems.append(f"line {element.line}: <details> has no <summary>")
+
+
+def validate_html(html: str, tabs: Iterable[str] = LICENSE_TABS) -> tuple[list[str], list[str]]:
+    """
+    Validates a license page's HTML.
+
+    Args:
+        html (str): The page HTML.
+        tabs (Iterable[str]): The tabs the page should have.
+
+    Returns:
+        tuple[list[str], list[str]]: The tab labels found, and the problems.
+    """
+    parser = _PageParser()
+    parser.feed(html)
+    parser.close()
+    problems = parser.problems
+    problems += [f"no {tab} tab" for tab in tabs if tab not in parser.tab_labels]
+    problems += [f"line {line}: footnote link {href} has no target" for href, line in parser.footnote_links if href[1:] not in parser.ids]
+    problems += [f"{leak.rule.description} at offset {leak.offset}: {leak.snippet!r}" for leak in TEMPLATE_SCANNER.scan(html)]
+    return parser.tab_labels, problems
+
+
+def validate_page(check: PageCheck) -> PageReport:
+    """Validates one built page."""
+    try:
+        html = Path(check.path).read_text(encoding="utf-8")
+    except OSError as e:
+        return PageReport(check.url, problems=[f"can't read {check.path}: {e}"])
+    tabs, problems = validate_html(html, check.tabs)
+    return PageReport(check.url, tabs, problems)
+
+
+def validate_pages(checks: list[PageCheck], *, workers: int | None = VALIDATION_WORKERS) -> list[PageReport]:
+    """
+    Validates built pages, in a process pool if there's more than one core to use. Reports are always in the same order as `checks`.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(checks))
+    if workers < 2:
+        return [validate_page(check) for check in checks]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(validate_page, checks))
+
+
+def format_report(reports: list[PageReport]) -> str:
+    """Returns one report for every page: a summary line, then each failing page's problems."""
+    failed = [report for report in reports if report.problems]
+    problems = sum(len(report.problems) for report in failed)
+    lines = [f"Validated {len(reports)} license pages: {len(failed)} failed, with {problems} problems"]
+    for report in failed:
+        lines.append(f"  {report.url}")
+        lines += [f"    - {problem}" for problem in report.problems]
+    return "\n".join(lines)
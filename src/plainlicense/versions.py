@@ -0,0 +1,101 @@
+"""
+An in-memory index of license versions.
+
+Each license keeps its version in a `package.json` next to its `index.md` (semantic-release owns those files). The index finds every `licenses/**/package.json` under the docs directory in one pass and parses them up front, so assembly never touches the filesystem for a version. Refreshing re-stats the files and only reparses the ones whose mtime changed, which keeps `mkdocs serve` rebuilds cheap.
+
+The index never writes to `package.json`.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+PACKAGE_GLOB = "licenses/**/package.json"
+DEFAULT_VERSION = "0.0.0"
+# what a license that hasn't had a release yet shows in production
+FIRST_RELEASE_VERSION = "0.1.0"
+
+version_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _VersionEntry:
+    mtime_ns: int
+    version: str | None
+
+
+def read_version(path: Path) -> str | None:
+    """Returns the `version` from a `package.json`, or None if it's missing or unreadable."""
+    try:
+        version = json.loads(path.read_text(encoding="utf-8")).get("version")
+    except (OSError, ValueError, AttributeError) as e:
+        version_logger.warning("Couldn't read a version from %s: %s", path, e)
+        return None
+    return str(version).strip() if version else None
+
+
+def resolve_version(version: str | None, *, production: bool) -> str:
+    """
+    Returns the version to show for a license. Development versions (semantic-release's `0.0.0-development` placeholder) show as the first release version in production builds.
+    """
+    if not version:
+        return DEFAULT_VERSION
+    if "development" in version and production:
+        return FIRST_RELEASE_VERSION
+    return version
+
+
+class VersionIndex:
+    """
+    License versions keyed by each license's directory, relative to the docs directory (e.g. `licenses/permissive/mit`).
+
+    Attributes:
+        docs_dir (Path): The docs directory the index covers.
+        parsed (int): How many `package.json` files the index has parsed, across refreshes.
+    """
+
+    def __init__(self, docs_dir: Path | str) -> None:
+        self.docs_dir = Path(docs_dir)
+        self.parsed = 0
+        self._entries: dict[str, _VersionEntry] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Rediscovers the `package.json` files, reparsing only new files and files whose mtime changed."""
+        entries: dict[str, _VersionEntry] = {}
+        for path in sorted(self.docs_dir.glob(PACKAGE_GLOB)):
+            key = path.parent.relative_to(self.docs_dir).as_posix()
+            mtime_ns = path.stat().st_mtime_ns
+            entry = self._entries.get(key)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                entry = _VersionEntry(mtime_ns, read_version(path))
+                self.parsed += 1
+            entries[key] = entry
+        self._entries = entries
+        version_logger.debug("Version index has %s licenses (%s parsed so far)", len(entries), self.parsed)
+
+    def raw_version(self, src_uri: str) -> str | None:
+        """Returns the version in the `package.json` next to `src_uri`, or None if there isn't one."""
+        entry = self._entries.get(PurePosixPath(src_uri).parent.as_posix())
+        return entry.version if entry else None
+
+    def version(self, src_uri: str, *, production: bool) -> str:
+        """Returns the version to show for the license at `src_uri`."""
+        return resolve_version(self.raw_version(src_uri), production=production)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_indexes: dict[Path, VersionIndex] = {}
+
+
+def get_version_index(docs_dir: Path | str) -> VersionIndex:
+    """Returns the process-wide version index for a docs directory, refreshed against the filesystem."""
+    docs_dir = Path(docs_dir).resolve()
+    if (index := _indexes.get(docs_dir)) is None:
+        index = _indexes[docs_dir] = VersionIndex(docs_dir)
+    else:
+        index.refresh()
+    return index